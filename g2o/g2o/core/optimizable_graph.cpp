@@ -491,9 +491,8 @@ bool OptimizableGraph::load(istream& is)
         while (currentLine >> buff) {
           if (buff == "||") break;
           ids.push_back(atoi(buff.c_str()));
-          currentLine >> buff;
         }
-        e->resize(numV);
+        e->resize(ids.size());
       }
       bool vertsOkay = true;
       for (size_t l = 0; l < ids.size(); ++l) {
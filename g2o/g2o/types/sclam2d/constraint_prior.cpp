@@ -0,0 +1,55 @@
+//
+// Dense Gaussian prior on a variable number of nodes, e.g., resulting from marginalisation (Schur complement).
+//
+
+#include "constraint_prior.h"
+
+namespace g2o {
+    ConstraintPrior::ConstraintPrior() :
+        BaseVariableSizedEdge<-1, VectorX>() {
+        resize(0);
+    }
+
+    bool ConstraintPrior::read(std::istream& is) {
+        // the node-ids (and the '||'-separator) are read by the graph, after which the nodes are set
+        int dim = 0;
+        for (size_t i = 0; i < _vertices.size(); i++) {
+            dim += static_cast<const OptimizableGraph::Vertex*>(_vertices[i])->dimension();
+        }
+        setDimension(dim);
+        _points.resize(dim);
+        _measurement.resize(dim);
+
+        for (int i = 0; i < dim; i++) {
+            is >> _points[i];
+        }
+        for (int i = 0; i < dim; i++) {
+            is >> _measurement[i];
+        }
+        for (int i = 0; i < dim; i++) {
+            for (int j = i; j < dim; j++) {
+                is >> _information(i, j);
+                if (i != j) {
+                    _information(j, i) = _information(i, j);
+                }
+            }
+        }
+        return is.good() || is.eof();
+    }
+
+    bool ConstraintPrior::write(std::ostream& os) const {
+        os << "||";
+        for (int i = 0; i < _points.size(); i++) {
+            os << " " << _points[i];
+        }
+        for (int i = 0; i < _measurement.size(); i++) {
+            os << " " << _measurement[i];
+        }
+        for (int i = 0; i < _information.rows(); i++) {
+            for (int j = i; j < _information.cols(); j++) {
+                os << " " << _information(i, j);
+            }
+        }
+        return os.good();
+    }
+}
@@ -0,0 +1,47 @@
+//
+// Dense Gaussian prior on a variable number of nodes, e.g., resulting from marginalisation (Schur complement).
+//
+
+#ifndef G2O_CONSTRAINT_PRIOR_H
+#define G2O_CONSTRAINT_PRIOR_H
+
+#include "g2o/core/base_variable_sized_edge.h"
+#include "g2o/stuff/misc.h"
+#include "g2o/types/slam2d/vertex_se2.h"
+
+namespace g2o {
+    /**
+     * The error is the difference of the (stacked) node-estimates and their linearisation-points, minus the mean (i.e.,
+     * the measurement). Angles of SE2-nodes are normalised, such that the error is linear in the oplus-increments.
+     *
+     * File-format (after the node-ids): || <points> <mean> <upper-triangular information matrix>
+     */
+    class ConstraintPrior : public BaseVariableSizedEdge<-1, VectorX> {
+    public:
+        ConstraintPrior();
+
+        void computeError() {
+            int offset = 0;
+            for (size_t i = 0; i < _vertices.size(); i++) {
+                const OptimizableGraph::Vertex* v = static_cast<const OptimizableGraph::Vertex*>(_vertices[i]);
+                const int dim = v->dimension();
+                VectorX estimate(dim);
+                v->getEstimateData(estimate.data());
+                VectorX delta = estimate - _points.segment(offset, dim);
+                if (dynamic_cast<const VertexSE2*>(v) != nullptr) {
+                    delta[2] = normalize_theta(delta[2]);
+                }
+                _error.segment(offset, dim) = delta - _measurement.segment(offset, dim);
+                offset += dim;
+            }
+        }
+
+        virtual bool read(std::istream& is);
+        virtual bool write(std::ostream& os) const;
+
+    protected:
+        VectorX _points;  // linearisation-points of the nodes (stacked)
+    };
+}
+
+#endif //G2O_CONSTRAINT_PRIOR_H
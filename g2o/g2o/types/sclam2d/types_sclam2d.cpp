@@ -53,6 +53,7 @@ namespace g2o {
     G2O_REGISTER_TYPE(CONSTRAINT_POSES2D_SE2_V1, ConstraintPoses2DSE2V1)
     G2O_REGISTER_TYPE(CONSTRAINT_POSES2D_SE2_V2, ConstraintPoses2DSE2V2)
     G2O_REGISTER_TYPE(CONSTRAINT_POSES2D_SE2_V3, ConstraintPoses2DSE2V3)
+    G2O_REGISTER_TYPE(CONSTRAINT_PRIOR, ConstraintPrior)
 
 
     G2O_REGISTER_TYPE(INFO3, Info3)
@@ -47,6 +47,7 @@
 #include "constraint_poses2d_se2_v1.h"
 #include "constraint_poses2d_se2_v2.h"
 #include "constraint_poses2d_se2_v3.h"
+#include "constraint_prior.h"
 
 #include "info3.h"
 #include "constraint_info3.h"
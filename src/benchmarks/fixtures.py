@@ -0,0 +1,148 @@
+import pathlib
+import typing as tp
+
+import numpy as np
+from src.definitions import get_project_root
+from src.framework.graph.Graph import Graph
+from src.framework.graph.constraint.EdgePosesSE2 import EdgePosesSE2
+from src.framework.graph.spatial.NodeSE2 import NodeSE2
+from src.framework.math.lie.transformation import SE2
+from src.framework.math.matrix.square import Square3
+from src.framework.simulation.Path import PoseCache
+from src.framework.simulation.Sensor import SensorSE2
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubGraph
+
+# fixture-kinds
+SYNTHETIC: str = 'synthetic'
+INTEL: str = 'intel'
+
+_intel_file: pathlib.Path = (get_project_root() / 'graphs/solution_INTEL_g2o.g2o').resolve()
+
+
+def synthetic_poses(
+        num: int,
+        seed: int = 0,
+        block_size: int = 5
+) -> np.ndarray:
+    """ Returns (num, 3)-poses of a fixed-seed Manhattan-like walk of unit steps that turns at block-corners. """
+    rng: np.random.RandomState = np.random.RandomState(seed)
+    turns: np.ndarray = np.zeros(num)
+    corners: np.ndarray = np.arange(block_size, num, block_size)
+    turns[corners] = rng.choice([-np.pi / 2, 0., 0., np.pi / 2], size=len(corners))
+    angles: np.ndarray = np.cumsum(turns)
+    angles[0] = 0.
+    steps: np.ndarray = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    steps[0] = 0.
+    translations: np.ndarray = np.cumsum(steps, axis=0)
+    return np.column_stack([translations, np.arctan2(np.sin(angles), np.cos(angles))])
+
+
+def intel_poses(num: int) -> np.ndarray:
+    """ Returns (num, 3)-poses of the Intel trajectory, repeated side-by-side (with an x-offset) up to <num> poses. """
+    intel: np.ndarray = np.asarray(PoseCache.load(_intel_file))
+    width: float = float(np.ptp(intel[:, 0])) + 10.
+    repeats: int = int(np.ceil(num / len(intel)))
+    tiles: tp.List[np.ndarray] = []
+    for i in range(repeats):
+        tile: np.ndarray = intel.copy()
+        tile[:, 0] += i * width
+        tiles.append(tile)
+    return np.concatenate(tiles)[:num]
+
+
+def poses(kind: str, num: int) -> np.ndarray:
+    if kind == INTEL:
+        return intel_poses(num)
+    assert kind == SYNTHETIC, f'Unknown fixture <{kind}>.'
+    return synthetic_poses(num)
+
+
+def build_graphs(
+        pose_array: np.ndarray,
+        seed: int = 0,
+        closure_ratio: float = 0.05,
+        separation: int = 10
+) -> tp.Tuple['SubGraph', 'SubGraph']:
+    """
+    Returns a consistent truth-graph of odometry- and closure-edges between <pose_array> and a perturbed estimate-graph,
+    of which the poses are dead-reckoned from noisy odometry.
+    """
+    rng: np.random.RandomState = np.random.RandomState(seed)
+    info_wheel: Square3 = Square3.from_diagonal([400., 400., 400.])
+    info_lidar: Square3 = Square3.from_diagonal([8000., 8000., 12000.])
+    wheel: SensorSE2 = SensorSE2(seed, info_wheel)
+    lidar: SensorSE2 = SensorSE2(seed + 1, info_lidar)
+
+    num: int = len(pose_array)
+    truth_poses: tp.List[SE2] = [SE2.from_translation_angle_elements(*pose) for pose in pose_array.tolist()]
+    pairs: tp.List[tp.Tuple[int, int, str, Square3, SensorSE2]] = [
+        (i - 1, i, 'wheel', info_wheel, wheel) for i in range(1, num)
+    ]
+    if num > separation:
+        targets: np.ndarray = np.arange(separation, num)
+        targets = targets[rng.uniform(size=len(targets)) < closure_ratio]
+        for j in targets.tolist():
+            pairs.append((int(rng.randint(0, j - separation + 1)), j, 'lidar', info_lidar, lidar))
+    pairs.sort(key=lambda pair: (pair[1], pair[0]))
+
+    truth: 'SubGraph' = Graph()
+    estimate: 'SubGraph' = Graph()
+    estimate_poses: tp.List[SE2] = [truth_poses[0]]
+    for id_, pose in enumerate(truth_poses):
+        if id_ > 0:
+            odometry: SE2 = wheel.measure(truth_poses[id_] - truth_poses[id_ - 1])
+            estimate_poses.append(estimate_poses[-1] + odometry)
+        truth.add_node(NodeSE2('poses', pose, id_))
+        estimate.add_node(NodeSE2('poses', estimate_poses[id_], id_))
+        if id_ == 0:
+            truth.get_node(0).fix()
+            estimate.get_node(0).fix()
+
+    for a, b, name, info_matrix, sensor in pairs:
+        measurement: SE2 = truth_poses[b] - truth_poses[a]
+        truth.add_edge(EdgePosesSE2(name, measurement, info_matrix, truth.get_node(a), truth.get_node(b)))
+        estimate.add_edge(EdgePosesSE2(
+            name, sensor.measure(measurement), info_matrix, estimate.get_node(a), estimate.get_node(b)
+        ))
+    return truth, estimate
+
+
+class Fixtures(object):
+    """ Builds (and keeps) the fixed-seed graph-fixtures of each kind and scale. """
+
+    _poses: tp.Dict[tp.Tuple[str, int], np.ndarray]
+    _graphs: tp.Dict[tp.Tuple[str, int], tp.Tuple['SubGraph', 'SubGraph']]
+    _bare_graphs: tp.Dict[tp.Tuple[str, int], tp.Tuple['SubGraph', 'SubGraph']]
+
+    def __init__(self):
+        self._poses = {}
+        self._graphs = {}
+        self._bare_graphs = {}
+
+    def poses(self, kind: str, num: int) -> np.ndarray:
+        key: tp.Tuple[str, int] = (kind, num)
+        if key not in self._poses:
+            self._poses[key] = poses(kind, num)
+        return self._poses[key]
+
+    def graphs(self, kind: str, num: int) -> tp.Tuple['SubGraph', 'SubGraph']:
+        """ Returns the shared (truth, estimate)-pair, in which the truth is assigned to the estimate. """
+        key: tp.Tuple[str, int] = (kind, num)
+        if key not in self._graphs:
+            truth, estimate = self.fresh_graphs(kind, num)
+            estimate.assign_truth(truth)
+            self._graphs[key] = (truth, estimate)
+        return self._graphs[key]
+
+    def bare_graphs(self, kind: str, num: int) -> tp.Tuple['SubGraph', 'SubGraph']:
+        """ Returns the shared (truth, estimate)-pair without assigned truth, which should be copied before use. """
+        key: tp.Tuple[str, int] = (kind, num)
+        if key not in self._bare_graphs:
+            self._bare_graphs[key] = self.fresh_graphs(kind, num)
+        return self._bare_graphs[key]
+
+    def fresh_graphs(self, kind: str, num: int) -> tp.Tuple['SubGraph', 'SubGraph']:
+        """ Returns a new (truth, estimate)-pair, for benchmarks that modify the graphs. """
+        return build_graphs(self.poses(kind, num))
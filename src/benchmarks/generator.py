@@ -0,0 +1,428 @@
+import argparse
+import pathlib
+import sys
+import typing as tp
+
+import numpy as np
+from src.definitions import get_project_root
+from src.framework.graph.GraphParser import GraphParser
+from src.framework.graph.constraint.EdgePosePointV2 import EdgePosePointV2
+from src.framework.graph.constraint.EdgePosesSE2 import EdgePosesSE2
+from src.framework.graph.parameter.ParameterNodeFactory import ParameterNodeFactory
+from src.framework.graph.parameter.ParameterSpecification import ParameterSpecification
+from src.framework.graph.spatial.NodeSE2 import NodeSE2
+from src.framework.graph.spatial.NodeV2 import NodeV2
+from src.framework.math.lie.transformation import SE2
+from src.framework.math.matrix.square import Square2, Square3
+from src.framework.math.matrix.vector import Vector2
+from src.framework.simulation.Path import ManhattanPath
+from src.framework.simulation.Sensor import SensorSE2, SensorV2
+from src.utils.GeoHash2D import GeoHash2D
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubParameterNode
+    from src.framework.graph.data.DataFactory import Quantity
+
+Cell = tp.Tuple[int, int]
+
+
+class GraphGenerator(object):
+    """
+    Generates a truth- and perturbed-graph of a Manhattan-path with odometry, loop-closure, proximity and landmark
+    constraints, which are streamed element-by-element to g2o-files. Only the (truth and perturbed) poses are kept in
+    memory as arrays, such that graphs of millions of poses can be generated. The truth-graph is written in full
+    precision, such that its cost remains zero at any scale.
+    """
+
+    _num_poses: int
+    _seed: int
+    _path: ManhattanPath
+
+    # constraints
+    _closure_ratio: float
+    _closure_distance: float
+    _closure_separation: int
+    _proximity_ratio: float
+    _proximity_steps: int
+    _landmark_density: float  # landmarks per square metre
+    _landmark_range: float
+
+    # parameter
+    _parameter_truth: tp.Optional['Quantity']
+    _parameter_estimate: tp.Optional['Quantity']
+    _parameter_specification: ParameterSpecification
+    _batch_size: int
+
+    # sensors
+    _wheel: SensorSE2
+    _lidar: SensorSE2
+    _landmark: SensorV2
+
+    # state
+    _rng: np.random.RandomState
+    _geo: GeoHash2D[int]
+    _count: int  # next node-id
+    _pose_ids: np.ndarray  # pose-index to node-id
+    _truth_poses: np.ndarray
+    _estimate_poses: np.ndarray
+    _recent: tp.Dict[int, tp.Tuple[NodeSE2, NodeSE2]]  # (truth, estimate)-nodes of the previous and current pose
+    _landmarks: tp.Dict[Cell, tp.Optional[tp.Tuple[NodeV2, NodeV2]]]  # (truth, estimate)-landmark per cell
+    _parameters: tp.Optional[tp.Tuple['SubParameterNode', 'SubParameterNode']]  # (truth, estimate)-parameter of batch
+
+    def __init__(
+            self,
+            num_poses: int,
+            seed: int = 0
+    ):
+        assert num_poses > 1
+        self._num_poses = num_poses
+        self._seed = seed
+
+        self._path = ManhattanPath(seed)
+        self._path.set_block_size(5)
+        self._path.set_domain(max(50., 1.5 * np.sqrt(num_poses)))  # keeps the density of revisits roughly constant
+
+        self.set_closures(0.5)
+        self.set_proximity(0.)
+        self.set_landmarks(0.)
+        self._parameter_truth = None
+        self._parameter_estimate = None
+        self._parameter_specification = ParameterSpecification.BIAS
+        self._batch_size = num_poses
+
+        self._wheel = SensorSE2(seed, Square3.from_diagonal([400., 400., 400.]))
+        self._lidar = SensorSE2(seed + 1, Square3.from_diagonal([8000., 8000., 12000.]))
+        self._landmark = SensorV2(seed + 2, Square2.from_diagonal([100., 100.]))
+
+    # configuration
+    def set_domain(self, domain: float) -> 'GraphGenerator':
+        self._path.set_domain(domain)
+        return self
+
+    def set_block_size(self, block_size: int) -> 'GraphGenerator':
+        self._path.set_block_size(block_size)
+        return self
+
+    def set_closures(
+            self,
+            ratio: float,
+            distance: float = 1.,
+            separation: int = 10
+    ) -> 'GraphGenerator':
+        """ Attempts (as BiSimulation.try_closure) a loop-closure at a fraction <ratio> of the poses. """
+        self._closure_ratio = ratio
+        self._closure_distance = distance
+        self._closure_separation = separation
+        return self
+
+    def set_proximity(
+            self,
+            ratio: float,
+            steps: int = 5
+    ) -> 'GraphGenerator':
+        """ Adds (as BiSimulation.try_proximity) a proximity-constraint at a fraction <ratio> of the poses. """
+        self._proximity_ratio = ratio
+        self._proximity_steps = steps
+        return self
+
+    def set_landmarks(
+            self,
+            density: float,
+            range_: float = 2.
+    ) -> 'GraphGenerator':
+        """ Scatters <density> landmarks per square metre, which are observed from all poses within <range_>. """
+        self._landmark_density = density
+        self._landmark_range = range_
+        return self
+
+    def set_parameter(
+            self,
+            value_truth: 'Quantity',
+            value_estimate: 'Quantity',
+            specification: ParameterSpecification = ParameterSpecification.BIAS,
+            batch_size: tp.Optional[int] = None
+    ) -> 'GraphGenerator':
+        """ Adds an odometry-parameter, of which a new node is created every <batch_size> poses. """
+        self._parameter_truth = value_truth
+        self._parameter_estimate = value_estimate
+        self._parameter_specification = specification
+        if batch_size is None:
+            batch_size = self._num_poses
+        self._batch_size = batch_size
+        return self
+
+    # generation
+    def generate(
+            self,
+            folder: tp.Optional[pathlib.Path] = None,
+            name: tp.Optional[str] = None,
+            should_print: bool = True
+    ) -> tp.Tuple[pathlib.Path, pathlib.Path]:
+        """ Writes the truth- and perturbed-graph to '<folder>/<name>_truth.g2o' and '<folder>/<name>_perturbed.g2o'. """
+        if folder is None:
+            folder = get_project_root() / 'graphs/generated'
+        if name is None:
+            name = f'manhattan_{self._num_poses}'
+        folder.mkdir(parents=True, exist_ok=True)
+        truth_file: pathlib.Path = (folder / f'{name}_truth.g2o').resolve()
+        estimate_file: pathlib.Path = (folder / f'{name}_perturbed.g2o').resolve()
+        if should_print:
+            print(f"benchmarks/generator: Generating {self._num_poses} poses to:\n    '{truth_file}'\n    '{estimate_file}'")
+
+        self._reset()
+        with truth_file.open('w') as truth_writer, estimate_file.open('w') as estimate_writer:
+            writers: tp.Tuple[tp.TextIO, tp.TextIO] = (truth_writer, estimate_writer)
+            origin: SE2 = SE2.from_translation_angle_elements(0., 0., 0.)
+            self._write_pose(writers, 0, origin, origin)
+            for index in range(1, self._num_poses):
+                self._step(writers, index)
+                if should_print and (index + 1) % 10000 == 0:
+                    self.print(f'benchmarks/generator: {index + 1}/{self._num_poses} poses')
+        if should_print:
+            self.print(f'benchmarks/generator: {self._num_poses}/{self._num_poses} poses, {self._count} nodes\n')
+        return truth_file, estimate_file
+
+    def _reset(self) -> None:
+        self._path.reset()
+        self._wheel.set_rng(self._seed)
+        self._lidar.set_rng(self._seed + 1)
+        self._landmark.set_rng(self._seed + 2)
+        self._rng = np.random.RandomState(self._seed)
+        self._geo = GeoHash2D[int]()
+        self._count = 0
+        self._pose_ids = np.zeros(self._num_poses, dtype=np.int64)
+        self._truth_poses = np.zeros((self._num_poses, 3))
+        self._estimate_poses = np.zeros((self._num_poses, 3))
+        self._recent = {}
+        self._landmarks = {}
+        self._parameters = None
+
+    def _step(
+            self,
+            writers: tp.Tuple[tp.TextIO, tp.TextIO],
+            index: int
+    ) -> None:
+        # parameter
+        if self._parameter_truth is not None and (index - 1) % self._batch_size == 0:
+            self._parameters = self._write_parameters(writers)
+
+        # odometry
+        truth_previous, estimate_previous = [node.get_value() for node in self._pose_nodes(index - 1)]
+        truth_pose: SE2 = self._path.next()
+        truth_measurement: SE2 = self._decompose(truth_pose - truth_previous)
+        estimate_measurement: SE2 = self._wheel.measure(truth_measurement)
+        estimate_pose: SE2 = estimate_previous + self._compose(estimate_measurement)
+        self._write_pose(writers, index, truth_pose, estimate_pose)
+        self._write_poses_edge(
+            writers, 'wheel', index - 1, index, truth_measurement, estimate_measurement, self._wheel, self._parameters
+        )
+
+        # loop-closure
+        if self._closure_ratio > 0. and self._rng.uniform(0, 1) < self._closure_ratio:
+            closure: tp.Optional[int] = self._find_closure(index)
+            if closure is not None:
+                self._write_closure(writers, 'lidar', closure, index)
+        truth_translation: np.ndarray = self._truth_poses[index, :2]
+        self._geo.add(truth_translation[0], truth_translation[1], index)
+
+        # proximity
+        if self._proximity_ratio > 0. and index > self._proximity_steps and \
+                self._rng.uniform(0, 1) < self._proximity_ratio:
+            self._write_closure(writers, 'proximity', index - self._proximity_steps, index)
+
+        # landmarks
+        if self._landmark_density > 0.:
+            self._write_landmarks(writers, index)
+
+    def _find_closure(self, index: int) -> tp.Optional[int]:
+        """ Returns the oldest pose-index within the closure-distance that is separated by the closure-separation. """
+        x, y = self._truth_poses[index, :2].tolist()
+        candidates: tp.List[int] = [
+            closure for closure in self._geo.find_within(x, y, self._closure_distance)
+            if closure < index - self._closure_separation
+        ]
+        if candidates:
+            return min(candidates)
+        return None
+
+    # parameters
+    def _compose(self, transformation: SE2) -> SE2:
+        if self._parameters is None:
+            return transformation
+        return self._parameters[1].compose_transformation(transformation)
+
+    def _decompose(self, transformation: SE2) -> SE2:
+        if self._parameters is None:
+            return transformation
+        return self._parameters[0].compose_transformation(transformation, is_inverse=True)
+
+    def _write_parameters(
+            self,
+            writers: tp.Tuple[tp.TextIO, tp.TextIO]
+    ) -> tp.Tuple['SubParameterNode', 'SubParameterNode']:
+        id_: int = self._next_id()
+        nodes: tp.Tuple['SubParameterNode', 'SubParameterNode'] = tuple(
+            ParameterNodeFactory.from_value(None, value, specification=self._parameter_specification, id_=id_)
+            for value in (self._parameter_truth, self._parameter_estimate)
+        )
+        for i, (writer, node) in enumerate(zip(writers, nodes)):
+            GraphParser.write_node(writer, node, is_exact=i == 0)
+        return nodes
+
+    # poses
+    def _write_pose(
+            self,
+            writers: tp.Tuple[tp.TextIO, tp.TextIO],
+            index: int,
+            truth_pose: SE2,
+            estimate_pose: SE2
+    ) -> None:
+        id_: int = self._next_id()
+        self._pose_ids[index] = id_
+        self._truth_poses[index] = truth_pose.translation_angle_list()
+        self._estimate_poses[index] = estimate_pose.translation_angle_list()
+        nodes: tp.Tuple[NodeSE2, NodeSE2] = (NodeSE2(None, truth_pose, id_), NodeSE2(None, estimate_pose, id_))
+        for i, (writer, node) in enumerate(zip(writers, nodes)):
+            if index == 0:
+                node.fix()
+            GraphParser.write_node(writer, node, is_exact=i == 0)
+        self._recent[index] = nodes
+        self._recent.pop(index - 2, None)
+
+    def _pose_nodes(self, index: int) -> tp.Tuple[NodeSE2, NodeSE2]:
+        """ Returns the (truth, estimate)-node of a pose, which is recreated from the arrays if it is not recent. """
+        if index in self._recent:
+            return self._recent[index]
+        id_: int = int(self._pose_ids[index])
+        return (
+            NodeSE2(None, self._get_pose(self._truth_poses, index), id_),
+            NodeSE2(None, self._get_pose(self._estimate_poses, index), id_)
+        )
+
+    @staticmethod
+    def _get_pose(poses: np.ndarray, index: int) -> SE2:
+        return SE2.from_translation_angle_elements(*poses[index].tolist())
+
+    # edges
+    def _write_closure(
+            self,
+            writers: tp.Tuple[tp.TextIO, tp.TextIO],
+            sensor_name: str,
+            index_a: int,
+            index_b: int
+    ) -> None:
+        truth_measurement: SE2 = self._pose_nodes(index_b)[0].get_value() - self._pose_nodes(index_a)[0].get_value()
+        estimate_measurement: SE2 = self._lidar.measure(truth_measurement)
+        self._write_poses_edge(
+            writers, sensor_name, index_a, index_b, truth_measurement, estimate_measurement, self._lidar
+        )
+
+    def _write_poses_edge(
+            self,
+            writers: tp.Tuple[tp.TextIO, tp.TextIO],
+            sensor_name: str,
+            index_a: int,
+            index_b: int,
+            truth_measurement: SE2,
+            estimate_measurement: SE2,
+            sensor: SensorSE2,
+            parameters: tp.Optional[tp.Tuple['SubParameterNode', 'SubParameterNode']] = None
+    ) -> None:
+        for i, (writer, node_a, node_b, measurement) in enumerate(zip(
+                writers, self._pose_nodes(index_a), self._pose_nodes(index_b), (truth_measurement, estimate_measurement)
+        )):
+            edge: EdgePosesSE2 = EdgePosesSE2(sensor_name, measurement, sensor.get_info_matrix(), node_a, node_b)
+            if parameters is not None:
+                edge.add_node(parameters[i])
+            GraphParser.write_edge(writer, edge, is_exact=i == 0)
+
+    # landmarks
+    def _write_landmarks(
+            self,
+            writers: tp.Tuple[tp.TextIO, tp.TextIO],
+            index: int
+    ) -> None:
+        spacing: float = 1. / np.sqrt(self._landmark_density)
+        x, y = self._truth_poses[index, :2].tolist()
+        a, b = int(np.floor(x / spacing)), int(np.floor(y / spacing))
+        reach: int = int(np.ceil(self._landmark_range / spacing))
+        truth_pose, estimate_pose = self._pose_nodes(index)
+        for i in range(a - reach, a + reach + 1):
+            for j in range(b - reach, b + reach + 1):
+                if (i, j) not in self._landmarks:
+                    # landmarks are jittered within their cell when the cell is first reached
+                    point: np.ndarray = (np.array([i, j]) + self._rng.uniform(0, 1, size=2)) * spacing
+                    self._landmarks[i, j] = (NodeV2(None, Vector2(point), 0), None)
+                truth_landmark, estimate_landmark = self._landmarks[i, j]
+                truth_measurement: Vector2 = Vector2(
+                    truth_landmark.get_value().array() - truth_pose.get_value().translation().array()
+                )
+                if np.linalg.norm(truth_measurement.array()) > self._landmark_range:
+                    continue
+                estimate_measurement: Vector2 = self._landmark.measure(truth_measurement)
+
+                if estimate_landmark is None:
+                    # the landmark is initialised from its first (perturbed) observation
+                    id_: int = self._next_id()
+                    truth_landmark.set_id(id_)
+                    estimate_landmark = NodeV2(None, Vector2(
+                        estimate_pose.get_value().translation().array() + estimate_measurement.array()
+                    ), id_)
+                    self._landmarks[i, j] = (truth_landmark, estimate_landmark)
+                    for k, (writer, node) in enumerate(zip(writers, (truth_landmark, estimate_landmark))):
+                        GraphParser.write_node(writer, node, is_exact=k == 0)
+
+                for k, (writer, pose, landmark, measurement) in enumerate(zip(
+                        writers, (truth_pose, estimate_pose), (truth_landmark, estimate_landmark),
+                        (truth_measurement, estimate_measurement)
+                )):
+                    edge: EdgePosePointV2 = EdgePosePointV2(
+                        'landmark', measurement, self._landmark.get_info_matrix(), pose, landmark
+                    )
+                    GraphParser.write_edge(writer, edge, is_exact=k == 0)
+
+    # helper-methods
+    def _next_id(self) -> int:
+        id_: int = self._count
+        self._count += 1
+        return id_
+
+    @staticmethod
+    def print(text: str) -> None:
+        sys.__stdout__.write(f'\r{text}')
+        sys.__stdout__.flush()
+
+
+def main(args: tp.Optional[tp.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Streams a synthetic truth- and perturbed-graph to g2o-files.')
+    parser.add_argument('poses', type=int)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--domain', type=float, default=None, help='half-width of the domain [m]')
+    parser.add_argument('--closure-ratio', type=float, default=0.5)
+    parser.add_argument('--closure-distance', type=float, default=1.)
+    parser.add_argument('--proximity-ratio', type=float, default=0.)
+    parser.add_argument('--landmark-density', type=float, default=0., help='landmarks per square metre')
+    parser.add_argument('--landmark-range', type=float, default=2.)
+    parser.add_argument('--bias', type=float, nargs=3, default=None, help='odometry-bias (x, y, angle)')
+    parser.add_argument('--batch-size', type=int, default=None, help='poses per bias-node')
+    parser.add_argument('--folder', type=pathlib.Path, default=None)
+    parser.add_argument('--name', default=None)
+    arguments = parser.parse_args(args)
+
+    generator: GraphGenerator = GraphGenerator(arguments.poses, seed=arguments.seed)
+    if arguments.domain is not None:
+        generator.set_domain(arguments.domain)
+    generator.set_closures(arguments.closure_ratio, distance=arguments.closure_distance)
+    generator.set_proximity(arguments.proximity_ratio)
+    generator.set_landmarks(arguments.landmark_density, range_=arguments.landmark_range)
+    if arguments.bias is not None:
+        generator.set_parameter(
+            SE2.from_translation_angle_elements(*arguments.bias), SE2.from_translation_angle_elements(0., 0., 0.),
+            batch_size=arguments.batch_size
+        )
+    generator.generate(arguments.folder, arguments.name)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import typing as tp
+
+from src.definitions import get_project_root
+
+# entry-points of the (headless) framework, as imported by batch-workers
+MODULES: tp.List[str] = [
+    'src.framework.graph.Graph',
+    'src.framework.graph.GraphParser',
+    'src.framework.simulation.Simulation',
+    'src.framework.simulation.BiSimulation',
+    'src.framework.analysis.sim.SimulationSet'
+]
+
+# packages that should only be imported by plotting, clustering or GUI entry-points
+HEAVY: tp.List[str] = ['matplotlib', 'sklearn', 'PyQt5', 'pyqtgraph', 'OpenGL', 'src.gui']
+
+
+def import_times(module: str) -> tp.Dict[str, int]:
+    """ Imports <module> in a fresh interpreter and returns the cumulative import-time [us] per imported module. """
+    process: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=str(get_project_root()), capture_output=True, text=True
+    )
+    assert process.returncode == 0, process.stderr
+    times: tp.Dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def heavy_imports(times: tp.Dict[str, int]) -> tp.List[str]:
+    return sorted({
+        package for package in HEAVY for name in times if name == package or name.startswith(f'{package}.')
+    })
+
+
+def measure(
+        modules: tp.List[str],
+        repeats: int = 5
+) -> tp.Dict[str, tp.Dict[str, tp.Any]]:
+    """ Returns, per module, the median import-time [ms] and the heavy packages it imports. """
+    results: tp.Dict[str, tp.Dict[str, tp.Any]] = {}
+    for module in modules:
+        durations: tp.List[float] = []
+        heavy: tp.List[str] = []
+        for _ in range(repeats):
+            times: tp.Dict[str, int] = import_times(module)
+            durations.append(times[module] / 1000)
+            heavy = heavy_imports(times)
+        results[module] = {'time': statistics.median(durations), 'heavy': heavy}
+    return results
+
+
+def main(args: tp.Optional[tp.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measures the import-time of the core framework modules.')
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=500., help='maximum import-time per module [ms]')
+    arguments = parser.parse_args(args)
+
+    results: tp.Dict[str, tp.Dict[str, tp.Any]] = measure(arguments.modules, repeats=arguments.repeats)
+    is_within_budget: bool = True
+    for module, result in results.items():
+        violations: tp.List[str] = []
+        if result['time'] > arguments.budget:
+            violations.append(f"exceeds budget of {arguments.budget:.0f} ms")
+        if result['heavy']:
+            violations.append(f"imports {', '.join(result['heavy'])}")
+        is_within_budget = is_within_budget and not violations
+        print(f"{module:<45} {result['time']:8.1f} ms  {'; '.join(violations) if violations else 'ok'}")
+    return 0 if is_within_budget else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import argparse
+import pathlib
+import statistics
+import sys
+import tempfile
+import typing as tp
+
+from src.benchmarks.generator import GraphGenerator
+from src.benchmarks.suite import metadata, quiet
+from src.framework.graph.GraphParser import GraphParser
+from src.framework.math.lie.transformation import SE2
+from src.framework.optimiser.Optimiser import Library, Optimiser
+from src.framework.optimiser.SolverSelector import CalibrationTable, GraphStatistics, calibration_path
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubGraph
+
+_max_dense_dim: int = 3000  # dense solvers are not timed above this (free) dimension
+
+
+def representative_graphs(
+        scales: tp.Sequence[int],
+        closure_ratios: tp.Sequence[float],
+        batch_sizes: tp.Sequence[int],
+        folder: pathlib.Path
+) -> tp.Iterator[tp.Tuple[str, 'SubGraph']]:
+    """
+    Yields (name, perturbed graph)-pairs of generated Manhattan-graphs of every scale and closure-ratio, without a
+    parameter (batch-size 0) or with a bias-parameter of which a new node is created every batch-size poses.
+    """
+    for scale in scales:
+        for closure_ratio in closure_ratios:
+            for batch_size in batch_sizes:
+                name: str = f'calibration_{scale}_{closure_ratio}_{batch_size}'
+                generator: GraphGenerator = GraphGenerator(scale).set_closures(closure_ratio)
+                if batch_size:
+                    generator.set_parameter(
+                        SE2.from_translation_angle_elements(0.02, 0.01, 0.005),
+                        SE2.from_translation_angle_elements(0., 0., 0.),
+                        batch_size=batch_size
+                    )
+                _, estimate_file = generator.generate(folder, name, should_print=False)
+                yield name, GraphParser.load(estimate_file, should_print=False)
+
+
+def time_solvers(
+        graph: 'SubGraph',
+        repeats: int = 3
+) -> tp.Dict[str, float]:
+    """ Returns the median (process-)time of every library and solver on <graph>, which is infinite if it failed. """
+    dim: int = GraphStatistics.from_graph(graph).dim
+    timings: tp.Dict[str, float] = {}
+    for library in Optimiser.get_libraries():
+        for solver in Optimiser.get_solvers(library):
+            solver_string: str = Optimiser.get_solver_string(library, solver)
+            if library == Library.DENSE and dim > _max_dense_dim:
+                timings[solver_string] = float('inf')
+                continue
+            durations: tp.List[float] = []
+            for _ in range(repeats):
+                with quiet():
+                    solution, report = Optimiser.optimise_with_report(
+                        graph, library, solver, workspace='calibration'
+                    )
+                if solution is None:
+                    durations = [float('inf')]
+                    break
+                durations.append(report.process_time)
+            timings[solver_string] = statistics.median(durations)
+    return timings
+
+
+def calibrate(
+        scales: tp.Sequence[int],
+        closure_ratios: tp.Sequence[float],
+        batch_sizes: tp.Sequence[int],
+        repeats: int = 3
+) -> CalibrationTable:
+    """ Times every library and solver on the representative graphs and returns the calibration-table. """
+    table: CalibrationTable = CalibrationTable(metadata(repeats))
+    with tempfile.TemporaryDirectory() as folder:
+        for name, graph in representative_graphs(scales, closure_ratios, batch_sizes, pathlib.Path(folder)):
+            graph_statistics: GraphStatistics = GraphStatistics.from_graph(graph)
+            timings: tp.Dict[str, float] = time_solvers(graph, repeats)
+            table.add(graph_statistics, timings)
+            best: str = min(timings, key=timings.get)
+            print(f'{name:<40} dim {graph_statistics.dim:>7}: {best:<16} {timings[best] * 1000:10.2f} ms')
+    return table
+
+
+def main(args: tp.Optional[tp.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Times every g2o library and solver on representative graphs, for the auto-mode of the Optimiser.'
+    )
+    parser.add_argument('--scales', type=int, nargs='+', default=[100, 1000, 5000], help='number of poses')
+    parser.add_argument('--closure-ratios', type=float, nargs='+', default=[0.1, 0.5])
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[0, 20, 1000000],
+                        help='poses per parameter-node (0: no parameter)')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--output', type=pathlib.Path, default=calibration_path)
+    arguments = parser.parse_args(args)
+
+    table: CalibrationTable = calibrate(
+        arguments.scales, arguments.closure_ratios, arguments.batch_sizes, arguments.repeats
+    )
+    table.save(arguments.output)
+    print(f"benchmarks/solvers: Calibration-table saved as '{arguments.output}'")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,323 @@
+import argparse
+import contextlib
+import copy
+import datetime
+import json
+import os
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as tp
+
+import numpy as np
+from src.benchmarks.fixtures import Fixtures, SYNTHETIC, INTEL
+from src.definitions import get_project_root
+from src.framework.graph.GraphParser import GraphParser
+from src.framework.math.lie.transformation import SE2
+from src.framework.math.matrix.square import Square3
+from src.framework.simulation.Sensor import SensorSE2
+from src.utils.GeoHash2D import GeoHash2D
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubGraph
+
+Statement = tp.Callable[[], tp.Any]
+Setup = tp.Callable[[Fixtures, str, int], Statement]
+
+_baseline_path: pathlib.Path = (get_project_root() / 'benchmarks' / 'baseline.json').resolve()
+
+
+class Benchmark(object):
+    """ A named benchmark: <setup> prepares a fixture (untimed) and returns the statement to time. """
+
+    _name: str
+    _setup: Setup
+    _kinds: tp.Tuple[str, ...]
+    _max_scale: tp.Optional[int]
+    _is_single_use: bool  # whether the statement modifies its fixture, such that it is set up for every repeat
+
+    def __init__(
+            self,
+            name: str,
+            setup: Setup,
+            kinds: tp.Tuple[str, ...] = (SYNTHETIC, INTEL),
+            max_scale: tp.Optional[int] = None,
+            is_single_use: bool = False
+    ):
+        self._name = name
+        self._setup = setup
+        self._kinds = kinds
+        self._max_scale = max_scale
+        self._is_single_use = is_single_use
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_kinds(self) -> tp.Tuple[str, ...]:
+        return self._kinds
+
+    def supports(self, scale: int) -> bool:
+        return self._max_scale is None or scale <= self._max_scale
+
+    def run(
+            self,
+            fixtures: Fixtures,
+            kind: str,
+            scale: int,
+            repeats: int
+    ) -> tp.Dict[str, tp.Any]:
+        durations: tp.List[float] = []
+        statement: tp.Optional[Statement] = None
+        for _ in range(repeats):
+            with quiet():
+                if statement is None or self._is_single_use:
+                    statement = self._setup(fixtures, kind, scale)
+                start: float = time.perf_counter()
+                statement()
+                durations.append(time.perf_counter() - start)
+        return {
+            'name': self._name, 'kind': kind, 'scale': scale, 'repeats': repeats,
+            'median': statistics.median(durations), 'min': min(durations)
+        }
+
+
+@contextlib.contextmanager
+def quiet() -> tp.Iterator[None]:
+    """ Silences stdout, including direct writes to sys.__stdout__ (e.g., the progress of simulations). """
+    sys.stdout.flush()
+    sys.__stdout__.flush()
+    descriptor: int = sys.__stdout__.fileno()
+    saved: int = os.dup(descriptor)
+    with open(os.devnull, 'w') as devnull:
+        os.dup2(devnull.fileno(), descriptor)
+        try:
+            with contextlib.redirect_stdout(devnull):
+                yield
+        finally:
+            sys.__stdout__.flush()
+            os.dup2(saved, descriptor)
+            os.close(saved)
+
+
+def key(result: tp.Dict[str, tp.Any]) -> str:
+    return f"{result['name']}[{result['kind']}-{result['scale']}]"
+
+
+# setups
+def _deltas(fixtures: Fixtures, kind: str, scale: int) -> tp.List[SE2]:
+    poses: tp.List[SE2] = [SE2.from_translation_angle_elements(*pose) for pose in fixtures.poses(kind, scale).tolist()]
+    return [b - a for a, b in zip(poses[:-1], poses[1:])]
+
+
+def setup_parser_save(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    estimate: 'SubGraph' = fixtures.graphs(kind, scale)[1]
+    path: pathlib.Path = pathlib.Path(tempfile.gettempdir()) / f'benchmark_{kind}_{scale}.g2o'
+    return lambda: GraphParser.save(estimate, path, should_print=False)
+
+
+def setup_parser_read(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    estimate: 'SubGraph' = fixtures.graphs(kind, scale)[1]
+    path: pathlib.Path = pathlib.Path(tempfile.gettempdir()) / f'benchmark_{kind}_{scale}.g2o'
+    GraphParser.save(estimate, path, should_print=False)
+    return lambda: GraphParser.read_graph(path, should_print=False)
+
+
+def setup_graph_copy(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    estimate: 'SubGraph' = fixtures.graphs(kind, scale)[1]
+    return lambda: estimate.copy()
+
+
+def setup_graph_cost(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    estimate: 'SubGraph' = fixtures.graphs(kind, scale)[1]
+    return lambda: estimate.cost()
+
+
+def setup_graph_ate(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    estimate: 'SubGraph' = fixtures.graphs(kind, scale)[1]
+    return lambda: estimate.ate()
+
+
+def setup_find_subgraphs(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    estimate: 'SubGraph' = fixtures.graphs(kind, scale)[1].copy()
+    return lambda: estimate.find_subgraphs()
+
+
+def setup_assign_truth(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    truth, estimate = copy.deepcopy(fixtures.bare_graphs(kind, scale))
+    return lambda: estimate.assign_truth(truth)
+
+
+def setup_se2_compose(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    deltas: tp.List[SE2] = _deltas(fixtures, kind, scale)
+
+    def statement() -> SE2:
+        pose: SE2 = SE2.from_translation_angle_elements(0., 0., 0.)
+        for delta in deltas:
+            pose = pose + delta
+        return pose
+    return statement
+
+
+def setup_se2_inverse(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    deltas: tp.List[SE2] = _deltas(fixtures, kind, scale)
+    return lambda: [delta.inverse() for delta in deltas]
+
+
+def setup_sensor_measure(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    deltas: tp.List[SE2] = _deltas(fixtures, kind, scale)
+    sensor: SensorSE2 = SensorSE2(0, Square3.from_diagonal([400., 400., 400.]))
+    return lambda: [sensor.measure(delta) for delta in deltas]
+
+
+def setup_geohash_find_within(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    poses: np.ndarray = fixtures.poses(kind, scale)
+    geo: GeoHash2D[int] = GeoHash2D[int]()
+    for i, (x, y, _) in enumerate(poses.tolist()):
+        geo.add(x, y, i)
+    queries: tp.List[tp.List[float]] = poses[::max(1, scale // 1000), :2].tolist()
+    return lambda: [geo.find_within(x, y, 2.) for x, y in queries]
+
+
+def setup_spatial_batch(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    # the first post-processing step, which attaches a parameter to every edge
+    from src.framework.graph.parameter.ParameterSpecification import ParameterSpecification
+    from src.framework.math.matrix.vector import Vector1
+    from src.framework.simulation.Simulation import PostSimulation
+    simulation: PostSimulation = PostSimulation()
+    simulation.add_sensor('wheel', SensorSE2())
+    simulation.add_spatial_parameter('wheel', 'bias', Vector1.zeros(), ParameterSpecification.BIAS, 20)
+    for delta in _deltas(fixtures, kind, scale):
+        simulation.add_odometry('wheel', delta)
+    return lambda: simulation.get_analyser().post_process()
+
+
+def setup_results_run(fixtures: Fixtures, kind: str, scale: int) -> Statement:
+    from src.simulation.results.ResultsPlain import ResultsPlain
+    results: ResultsPlain = ResultsPlain()
+    if kind == INTEL:
+        results.set_intel().set_steps(min(scale // 10, 1227))
+    else:
+        results.set_manhattan().set_steps(scale // 10)
+    return lambda: results.run()
+
+
+BENCHMARKS: tp.List[Benchmark] = [
+    Benchmark('parser.save', setup_parser_save),
+    Benchmark('parser.read_graph', setup_parser_read),
+    Benchmark('graph.copy', setup_graph_copy),
+    Benchmark('graph.cost', setup_graph_cost),
+    Benchmark('graph.ate', setup_graph_ate),
+    Benchmark('graph.find_subgraphs', setup_find_subgraphs, max_scale=10000, is_single_use=True),
+    Benchmark('graph.assign_truth', setup_assign_truth, is_single_use=True),
+    Benchmark('se2.compose', setup_se2_compose, kinds=(SYNTHETIC,)),
+    Benchmark('se2.inverse', setup_se2_inverse, kinds=(SYNTHETIC,)),
+    Benchmark('sensor.measure', setup_sensor_measure, kinds=(SYNTHETIC,)),
+    Benchmark('geohash.find_within', setup_geohash_find_within),
+    Benchmark('analyser.spatial_batch', setup_spatial_batch, is_single_use=True),
+    Benchmark('results.run', setup_results_run, max_scale=10000)
+]
+
+
+# suite
+def metadata(repeats: int) -> tp.Dict[str, tp.Any]:
+    commit: tp.Optional[str] = None
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=str(get_project_root()), capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'repeats': repeats
+    }
+
+
+def run(
+        scales: tp.Sequence[int],
+        kinds: tp.Sequence[str],
+        repeats: int = 3,
+        pattern: tp.Optional[str] = None
+) -> tp.Dict[str, tp.Any]:
+    """ Runs the (matching) benchmarks for every kind and scale, and returns the machine-readable results. """
+    fixtures: Fixtures = Fixtures()
+    results: tp.Dict[str, tp.Dict[str, tp.Any]] = {}
+    for scale in scales:
+        for kind in kinds:
+            for benchmark in BENCHMARKS:
+                if kind not in benchmark.get_kinds() or not benchmark.supports(scale):
+                    continue
+                if pattern is not None and pattern not in benchmark.get_name():
+                    continue
+                result: tp.Dict[str, tp.Any] = benchmark.run(fixtures, kind, scale, repeats)
+                results[key(result)] = result
+                print(f"{key(result):<45} {result['median'] * 1000:10.2f} ms")
+    return {'meta': metadata(repeats), 'results': results}
+
+
+def compare(
+        report: tp.Dict[str, tp.Any],
+        baseline: tp.Dict[str, tp.Any],
+        tolerance: float = 0.2
+) -> tp.List[str]:
+    """ Prints the ratio of each median to its baseline-median and returns the keys that regressed. """
+    regressions: tp.List[str] = []
+    print(f"\nComparison against baseline of {baseline['meta'].get('date')} ({baseline['meta'].get('commit')}):")
+    for name, result in report['results'].items():
+        if name not in baseline['results']:
+            print(f'{name:<45} {"(new)":>10}')
+            continue
+        ratio: float = result['median'] / max(baseline['results'][name]['median'], 1e-9)
+        status: str = ''
+        if ratio > 1 + tolerance:
+            status = 'slower'
+            regressions.append(name)
+        elif ratio < 1 / (1 + tolerance):
+            status = 'faster'
+        print(f'{name:<45} {ratio:9.2f}x {status}')
+    return regressions
+
+
+def main(args: tp.Optional[tp.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Times the hot paths of the framework on fixed-seed fixtures.')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1000, 10000], help='number of poses (e.g., 100000)')
+    parser.add_argument('--kinds', nargs='+', default=[SYNTHETIC, INTEL], choices=[SYNTHETIC, INTEL])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--filter', default=None, help='only run benchmarks of which the name contains this string')
+    parser.add_argument('--output', type=pathlib.Path, default=None, help='writes the results as json')
+    parser.add_argument('--baseline', type=pathlib.Path, default=_baseline_path)
+    parser.add_argument('--save-baseline', action='store_true', help='stores the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='relative slow-down that counts as regression')
+    arguments = parser.parse_args(args)
+
+    report: tp.Dict[str, tp.Any] = run(arguments.scales, arguments.kinds, arguments.repeats, arguments.filter)
+
+    paths: tp.List[pathlib.Path] = []
+    if arguments.output is not None:
+        paths.append(arguments.output)
+    if arguments.save_baseline:
+        paths.append(arguments.baseline)
+    for path in paths:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"benchmarks/suite: Results saved as '{path}'")
+
+    if not arguments.save_baseline and arguments.baseline.is_file():
+        with open(arguments.baseline, 'r') as file:
+            baseline: tp.Dict[str, tp.Any] = json.load(file)
+        if compare(report, baseline, arguments.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
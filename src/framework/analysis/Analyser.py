@@ -5,6 +5,7 @@ from abc import abstractmethod
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
 from src.framework.analysis.plot.FigureParser import FigureParser
 from src.framework.analysis.plot.Plotter import Plotter
 from src.framework.graph.Visualisable import Visualisable, DrawPoint, DrawAxis, DrawEdge
@@ -15,7 +16,7 @@ if tp.TYPE_CHECKING:
     from src.framework.graph.Graph import SubGraph, SubNode, SubSpatialNode, SubParameterNode, SubNodeEdge, SubEdge
     from src.framework.math.lie.transformation import SE2
     from src.framework.math.matrix.vector.Vector import SubSizeVector
-    from src.framework.math.matrix.vector import SubVector, Vector2, Vector3
+    from src.framework.math.matrix.vector import SubVector, Vector2
 
 
 class SubgraphSet(object):
@@ -50,6 +51,8 @@ def update_print(text: str) -> None:
 
 class AnalyserTopology(object):
 
+    _axis_resolution: float = 10.  # [deg]
+
     @staticmethod
     def find_domain(
             graph: 'SubGraph',
@@ -63,16 +66,13 @@ class AnalyserTopology(object):
 
         type_: tp.Type['SubNode']
         for type_ in graph.get_types():
-            if issubclass(type_, Visualisable):
-                elements: tp.List['SubNodeEdge'] = graph.get_of_type(type_)
-                element: 'SubNodeEdge'
-                for element in elements:
-                    if isinstance(element, DrawPoint):
-                        point: Vector = element.draw_point()
-                        x_min = min(x_min, point[0])
-                        x_max = max(x_max, point[0])
-                        y_min = min(y_min, point[1])
-                        y_max = max(y_max, point[1])
+            if issubclass(type_, DrawPoint):
+                points: np.ndarray = type_.draw_points(graph.get_of_type(type_))
+                if len(points):
+                    x_min = min(x_min, float(points[:, 0].min()))
+                    x_max = max(x_max, float(points[:, 0].max()))
+                    y_min = min(y_min, float(points[:, 1].min()))
+                    y_max = max(y_max, float(points[:, 1].max()))
         x_min -= margin
         y_min -= margin
         x_max += margin
@@ -84,41 +84,79 @@ class AnalyserTopology(object):
         y_min = round_down(y_min, round)
         return x_min, y_min, round_up(x_max, round) - x_min, round_up(y_max, round) - y_min
 
+    # extraction
+    @staticmethod
+    def decimate(
+            elements: tp.List['SubNodeEdge'],
+            max_elements: tp.Optional[int] = None
+    ) -> tp.List['SubNodeEdge']:
+        """ Returns an evenly strided selection of at most <max_elements> elements. """
+        if max_elements is None or len(elements) <= max_elements:
+            return elements
+        stride: int = int(np.ceil(len(elements) / max(max_elements, 1)))
+        return elements[::stride]
+
+    @staticmethod
+    def extract_poses(elements: tp.List['SubNodeEdge']) -> np.ndarray:
+        """ Returns an (n, 3)-array of the (x, y, angle) poses of the elements. """
+        poses: np.ndarray = np.empty((len(elements), 3))
+        for i, element in enumerate(elements):
+            pose: 'SE2' = element.draw_pose().to_se2()
+            poses[i, :] = pose.translation_angle_list()
+        return poses
+
+    # plotting
     @classmethod
-    def plot(
+    def plot_axes(
             cls,
-            graph: 'SubGraph'
-    ) -> plt.Figure:
-        import time
-
-        _, __, size_x, size_y = cls.find_domain(graph)
-        fig, ax = plt.subplots(figsize=(6, 6))
-        # fig, ax = plt.subplots(figsize=(0.2 * size_x, 0.2 * size_y))
+            ax: plt.Axes,
+            poses: np.ndarray,
+            color: tp.Tuple[float, ...]
+    ) -> None:
+        """ Scatters the poses with one call per (binned) heading, as markers cannot be rotated individually. """
+        bins: np.ndarray = np.round(np.rad2deg(poses[:, 2]) / cls._axis_resolution).astype(int)
+        for bin_ in np.unique(bins):
+            mask: np.ndarray = bins == bin_
+            marker = mpl.markers.MarkerStyle(marker='4')
+            marker._transform = marker.get_transform().rotate_deg(bin_ * cls._axis_resolution)
+            ax.scatter(poses[mask, 0], poses[mask, 1], marker=marker, s=40, c=[list(color)])
 
+    @classmethod
+    def plot_to(
+            cls,
+            ax: plt.Axes,
+            graph: 'SubGraph',
+            max_elements: tp.Optional[int] = None
+    ) -> None:
+        """ Draws the topology of the graph onto <ax>, optionally decimating every element-type to <max_elements>. """
+        type_: tp.Type['SubNodeEdge']
         for type_ in graph.get_types():
             if issubclass(type_, Visualisable):
-                t = time.time()
-                elements: tp.List['SubNodeEdge'] = graph.get_of_type(type_)
-                element: 'SubNodeEdge'
-                for element in elements:
-                    color: tp.Tuple = type_.draw_rgb()
-                    if isinstance(element, DrawAxis):
-                        pose: 'SE2' = element.draw_pose().to_se2()
-                        translation: 'Vector2' = pose.translation()
-                        marker = mpl.markers.MarkerStyle(marker='4')
-                        marker._transform = marker.get_transform().rotate_deg(np.rad2deg(pose.rotation().angle()))
-                        ax.scatter(
-                            (translation[0]), (translation[1]), marker=marker, s=40,
-                            c=[list(Rgb.invert(color))]
-                        )
-                    elif isinstance(element, DrawPoint):
-                        point: 'Vector3' = element.draw_point()
-                        ax.plot(point[0], point[1], color=Rgb.invert(color), marker='.')
-                    elif isinstance(element, DrawEdge):
-                        a, b = element.draw_nodeset()
-                        ax.plot([a[0], b[0]], [a[1], b[1]], color=Rgb.invert(color), linestyle='-')
-                print(f'Plotting <{type_.__name__}> = time: {time.time() - t} s')
+                elements: tp.List['SubNodeEdge'] = cls.decimate(graph.get_of_type(type_), max_elements)
+                if not elements:
+                    continue
+                color: tp.Tuple[float, ...] = Rgb.invert(type_.draw_rgb())
+                if issubclass(type_, DrawAxis):
+                    cls.plot_axes(ax, cls.extract_poses(elements), color)
+                elif issubclass(type_, DrawPoint):
+                    points: np.ndarray = type_.draw_points(elements)
+                    ax.scatter(points[:, 0], points[:, 1], s=20, color=color, marker='.')
+                elif issubclass(type_, DrawEdge):
+                    segments: np.ndarray = type_.draw_nodesets(elements)[:, :, :2]
+                    ax.add_collection(LineCollection(segments, colors=[color], linestyles='-'))
+        ax.autoscale_view()
         ax.set_aspect('equal')
+
+    @classmethod
+    def plot(
+            cls,
+            graph: 'SubGraph',
+            max_elements: tp.Optional[int] = None
+    ) -> plt.Figure:
+        fig, ax = plt.subplots(figsize=(6, 6))
+        # _, __, size_x, size_y = cls.find_domain(graph)
+        # fig, ax = plt.subplots(figsize=(0.2 * size_x, 0.2 * size_y))
+        cls.plot_to(ax, graph, max_elements)
         fig.show()
         return fig
 
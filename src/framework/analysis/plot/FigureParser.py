@@ -3,9 +3,11 @@ import pickle as pkl
 import typing as tp
 from datetime import datetime
 
-from matplotlib import pyplot as plt
 from src.definitions import get_project_root
 
+if tp.TYPE_CHECKING:
+    from matplotlib import pyplot as plt
+
 
 class FigureParser(object):
     _path: pathlib.Path = (get_project_root() / 'plots').resolve()
@@ -17,7 +19,7 @@ class FigureParser(object):
     @classmethod
     def save(
             cls,
-            fig: plt.Figure,
+            fig: 'plt.Figure',
             name: tp.Optional[str] = None
     ) -> None:
         if name is None:
@@ -34,13 +36,14 @@ class FigureParser(object):
     def load(
             cls,
             name: str
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         if not name.endswith('.pickle'):
             name += '.pickle'
         path: pathlib.Path = (cls._path / name).resolve()
         assert path.is_file()
         with open(path, 'rb') as file:
             fig: plt.Figure = pkl.load(file)
+        from matplotlib import pyplot as plt
         dummy = plt.figure()
         new_manager = dummy.canvas.manager
         new_manager.canvas.figure = fig
@@ -152,11 +152,17 @@ class Plotter(object):
     def save(
             self,
             name: str,
-            dpi: float = 300
-    ) -> None:
+            dpi: float = 300,
+            formats: tp.Sequence[str] = ('png',)
+    ) -> tp.List[pathlib.Path]:
         assert self.has_fig()
-        path: pathlib.Path = (FigureParser.path() / f'{name}.png').resolve()
-        self._fig.savefig(str(path), dpi=dpi, bbox_inches='tight')
+        paths: tp.List[pathlib.Path] = []
+        for format_ in formats:
+            path: pathlib.Path = (FigureParser.path() / f'{name}.{format_}').resolve()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._fig.savefig(str(path), dpi=dpi, bbox_inches='tight', format=format_)
+            paths.append(path)
+        return paths
 
     def show(self) -> None:
         assert self.has_fig()
@@ -0,0 +1,146 @@
+import json
+import multiprocessing as mp
+import os
+import pathlib
+import typing as tp
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from src.framework.analysis.plot.FigureParser import FigureParser
+
+if tp.TYPE_CHECKING:
+    from src.framework.analysis.sim.GraphData import SubGraphData
+
+SubFigureExporter = tp.TypeVar('SubFigureExporter', bound='FigureExporter')
+
+
+def init_worker() -> None:
+    """ Switches a worker process to the non-interactive Agg backend. """
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    from matplotlib import pyplot as plt
+    plt.switch_backend('Agg')
+
+
+def input_stamp(path: pathlib.Path) -> tp.List[int]:
+    stat: os.stat_result = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def manifest_path(name: str) -> pathlib.Path:
+    return (FigureParser.path() / f'{name}.figures.json').resolve()
+
+
+def is_up_to_date(
+        name: str,
+        formats: tp.Sequence[str],
+        dpi: float
+) -> bool:
+    """ Returns whether the figures of <name> were exported from the current results with the same settings. """
+    from src.framework.analysis.sim.GraphData import GraphData
+    path_input: pathlib.Path = (GraphData._path / f'{name}.pickle').resolve()
+    path_manifest: pathlib.Path = manifest_path(name)
+    if not path_input.is_file() or not path_manifest.is_file():
+        return False
+    with open(path_manifest, 'r') as file:
+        manifest: tp.Dict[str, tp.Any] = json.load(file)
+    if manifest.get('input') != input_stamp(path_input) \
+            or manifest.get('formats') != list(formats) \
+            or manifest.get('dpi') != dpi:
+        return False
+    return all(pathlib.Path(figure).is_file() for figure in manifest.get('figures', []))
+
+
+def export_figures(
+        name: str,
+        formats: tp.Sequence[str] = ('png',),
+        dpi: float = 300,
+        should_skip: bool = True
+) -> tp.List[str]:
+    """ Renders the cost, ATE and parameter figures of a saved GraphData-instance and returns the written paths. """
+    if should_skip and is_up_to_date(name, formats, dpi):
+        return []
+
+    from matplotlib import pyplot as plt
+    from src.framework.analysis.plot.Plotter import Plotter
+    from src.framework.analysis.sim.GraphData import GraphData
+    path_input: pathlib.Path = (GraphData._path / f'{name}.pickle').resolve()
+    stamp: tp.List[int] = input_stamp(path_input)
+    graph_data: 'SubGraphData' = GraphData.load(name)
+
+    figures: tp.List[tp.Tuple[str, plt.Figure]] = [
+        ('cost', graph_data.plot_cost(show=False)),
+        ('ate', graph_data.plot_ate(show=False))
+    ]
+    for parameter_name in graph_data.get_parameters():
+        figures.append((parameter_name, graph_data.plot_parameter(parameter_name, show=False)))
+
+    paths: tp.List[str] = []
+    for suffix, fig in figures:
+        fig.suptitle(name)
+        paths += [str(path) for path in Plotter(fig).save(f'{name}_{suffix}', dpi=dpi, formats=formats)]
+        plt.close(fig)
+
+    with open(manifest_path(name), 'w') as file:
+        json.dump({'input': stamp, 'formats': list(formats), 'dpi': dpi, 'figures': paths}, file)
+    return paths
+
+
+class FigureExporter(object):
+    """ Exports the figures of saved simulation results in a pool of headless worker processes. """
+
+    _num_workers: int
+    _formats: tp.Tuple[str, ...]
+    _dpi: float
+    _should_skip: bool
+
+    _pool: tp.Optional[ProcessPoolExecutor]
+    _futures: tp.Dict[str, Future]
+
+    def __init__(
+            self,
+            num_workers: tp.Optional[int] = None,
+            formats: tp.Sequence[str] = ('png', 'pdf'),
+            dpi: float = 300,
+            should_skip: bool = True
+    ):
+        if num_workers is None:
+            num_workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+        self._num_workers = num_workers
+        self._formats = tuple(formats)
+        self._dpi = dpi
+        self._should_skip = should_skip
+        self._pool = None
+        self._futures = {}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # fork: spawning would re-run the (unguarded) simulation scripts in every worker
+            context = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._num_workers, mp_context=context, initializer=init_worker
+            )
+        return self._pool
+
+    def submit(self, name: str) -> None:
+        """ Schedules the figures of the GraphData-instance saved as <name> for export. """
+        if self._num_workers == 0:
+            future: Future = Future()
+            future.set_result(export_figures(name, self._formats, self._dpi, self._should_skip))
+        else:
+            future = self._get_pool().submit(export_figures, name, self._formats, self._dpi, self._should_skip)
+        self._futures[name] = future
+
+    def wait(self) -> tp.Dict[str, tp.List[str]]:
+        """ Blocks until all submitted exports are done and returns the written paths per name. """
+        paths: tp.Dict[str, tp.List[str]] = {}
+        for name, future in self._futures.items():
+            paths[name] = future.result()
+            if paths[name]:
+                print(f"framework/FigureExporter: Exported {len(paths[name])} figure(s) of '{name}'")
+            else:
+                print(f"framework/FigureExporter: Figures of '{name}' are up-to-date")
+        self._futures = {}
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        return paths
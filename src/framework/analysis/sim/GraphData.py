@@ -4,21 +4,17 @@ import pickle as pkl
 import sys
 import typing as tp
 
-import matplotlib as mpl
 import numpy as np
-from matplotlib import pyplot as plt
-from matplotlib import ticker
-from scipy.stats import norm
 from src.definitions import get_project_root
 from src.framework.analysis.sim.TimeData import Data, TimeData
-from src.framework.graph.Visualisable import Visualisable, DrawPoint, DrawAxis, DrawEdge
-from src.gui.viewer.Rgb import Rgb
+from src.utils.Profiler import profiled
 
 if tp.TYPE_CHECKING:
+    from matplotlib import pyplot as plt
     from src.framework.analysis.sim.TimeData import SubData, SubTimeData
-    from src.framework.graph.Graph import SubNode, SubParameterNode, SubEdge, SubNodeEdge, SubGraph
-    from src.framework.math.lie.transformation import SE2
-    from src.framework.math.matrix.vector.Vector import SubSizeVector, Vector2, Vector3
+    from src.framework.graph.Graph import SubParameterNode, SubEdge, SubGraph
+    from src.framework.math.matrix.vector.Vector import SubSizeVector
+    from src.framework.optimiser.OptimisationReport import OptimisationReport
 
 default_figsize: tp.Tuple[float, float] = (4, 2.4)  # (4, 3.2)
 
@@ -40,6 +36,7 @@ class GraphData(object):
     _par_evolution: tp.Dict[str, 'SubTimeData']
     _par_values: tp.Dict[str, 'SubTimeData']
     _par_spatial: tp.Dict[str, 'SubData']
+    _reports: tp.List[tp.List['OptimisationReport']]  # optimisation-reports per graph
 
     def __init__(self):
         self._graphs = []
@@ -47,6 +44,7 @@ class GraphData(object):
         self._measurements = {}
         self._par_evolution = {}
         self._par_values = {}
+        self._reports = []
 
     def path(self) -> pathlib.Path:
         return self._path
@@ -58,6 +56,7 @@ class GraphData(object):
         assert len(self._graphs) > index
         return self._graphs[index]
 
+    @profiled('graph_data.add_graph')
     def add_graph(self, graph: 'SubGraph') -> None:
         assert graph.has_truth()
         has_first: bool = self.has_first()
@@ -78,6 +77,9 @@ class GraphData(object):
         # measurements
         meas: tp.Dict[str, tp.List[tp.List[float]]] = {}
 
+        # optimisation-reports
+        reports: tp.List['OptimisationReport'] = []
+
         parameter_names: tp.List[str] = graph.get_parameter_names()
         edge_names: tp.List[str] = graph.get_edge_names()
         subgraphs: tp.List['SubGraph'] = graph.subgraphs()
@@ -91,6 +93,7 @@ class GraphData(object):
             ate.append(subgraph.ate())
             rpet.append(subgraph.rpe_translation())
             rper.append(subgraph.rpe_rotation())
+            reports += subgraph.get_reports()
 
             # parameter evolution
             for parameter_name in parameter_names:
@@ -122,6 +125,8 @@ class GraphData(object):
             self.print(f'\rframework/AnalysisSet: Analysing: {100 * i / size:.2f}%')
         self.print('\rframework/AnalysisSet: Analysis done!\n')
 
+        self._reports.append(reports)
+
         if not has_first:
             self._metrics = TimeData(time_)
         self._metrics.add(self._COST, error)
@@ -198,12 +203,12 @@ class GraphData(object):
             show_band: bool = True,
             show: bool = True,
             indices: tp.Optional[tp.List[int]] = None,
-            fig: tp.Optional[plt.Figure] = None,
+            fig: tp.Optional['plt.Figure'] = None,
             figsize: tp.Tuple[float, float] = default_figsize,
             colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
             alpha: float = 1,
             linestyle: str = '-'
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         return self._plot_metric(
             'Cost', '-', self._COST,
             show_individual=show_individual, show_mean=show_mean, show_band=show_band, show=show, indices=indices,
@@ -217,18 +222,19 @@ class GraphData(object):
             show_band: bool = True,
             show: bool = True,
             indices: tp.Optional[tp.List[int]] = None,
-            fig: tp.Optional[plt.Figure] = None,
+            fig: tp.Optional['plt.Figure'] = None,
             figsize: tp.Tuple[float, float] = default_figsize,
             colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
             alpha: float = 1,
             linestyle: str = '-'
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         fig: plt.Figure = self._plot_metric(
             'ATE', 'm', self._ATE,
             show_individual=show_individual, show_mean=show_mean, show_band=show_band, show=show, indices=indices,
             fig=fig, figsize=figsize, colour=colour, alpha=alpha, linestyle=linestyle
         )
         print(np.mean(self._metrics.mean(self._ATE)))
+        from matplotlib import ticker
         fig.axes[0].yaxis.set_major_formatter(ticker.FormatStrFormatter('%.2f'))
         return fig
 
@@ -239,12 +245,12 @@ class GraphData(object):
             show_band: bool = True,
             show: bool = True,
             indices: tp.Optional[tp.List[int]] = None,
-            fig: tp.Optional[plt.Figure] = None,
+            fig: tp.Optional['plt.Figure'] = None,
             figsize: tp.Tuple[float, float] = default_figsize,
             colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
             alpha: float = 1,
             linestyle: str = '-'
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         return self._plot_metric(
             'RPE (translation)', 'm', self._RPET,
             show_individual=show_individual, show_mean=show_mean, show_band=show_band, show=show, indices=indices,
@@ -258,12 +264,12 @@ class GraphData(object):
             show_band: bool = True,
             show: bool = True,
             indices: tp.Optional[tp.List[int]] = None,
-            fig: tp.Optional[plt.Figure] = None,
+            fig: tp.Optional['plt.Figure'] = None,
             figsize: tp.Tuple[float, float] = default_figsize,
             colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
             alpha: float = 1,
             linestyle: str = '-'
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         return self._plot_metric(
             'RPE (rotation)', 'rad', self._RPER,
             show_individual=show_individual, show_mean=show_mean, show_band=show_band, show=show, indices=indices,
@@ -280,12 +286,12 @@ class GraphData(object):
             show_band: bool = True,
             show: bool = True,
             indices: tp.Optional[tp.List[int]] = None,
-            fig: tp.Optional[plt.Figure] = None,
+            fig: tp.Optional['plt.Figure'] = None,
             figsize: tp.Tuple[float, float] = default_figsize,
             colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
             alpha: float = 1,
             linestyle: str = '-'
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
 
         # construct figure
         if fig is None:
@@ -314,6 +320,7 @@ class GraphData(object):
                     time, mean - std, mean + std,
                     color=colour, alpha=0.1 * alpha
                 )
+                from scipy.stats import norm
                 for r in range(1, self._resolution + 1):
                     factor: float = norm.pdf(1 + r / (1 * self._resolution), 1, 0.4)
                     # factor: float = r / self._resolution
@@ -363,12 +370,12 @@ class GraphData(object):
             show_band: bool = True,
             show: bool = True,
             indices: tp.Optional[tp.List[int]] = None,
-            fig: tp.Optional[plt.Figure] = None,
+            fig: tp.Optional['plt.Figure'] = None,
             figsize: tp.Tuple[float, float] = default_figsize,
             colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
             alpha: float = 1,
             linestyle: str = '-'
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         time_data: 'SubTimeData' = self.get_parameter_data(parameter_name)
         return self._plot_parameter(
             parameter_name, time_data,
@@ -390,12 +397,12 @@ class GraphData(object):
             show_band: bool = True,
             show: bool = True,
             indices: tp.Optional[tp.List[int]] = None,
-            fig: tp.Optional[plt.Figure] = None,
+            fig: tp.Optional['plt.Figure'] = None,
             figsize: tp.Tuple[float, float] = default_figsize,
             colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
             alpha: float = 1,
             linestyle: str = '-'
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         time_data: 'SubTimeData' = self.get_parameter_evolution_data(parameter_name)
         return self._plot_parameter(
             parameter_name, time_data,
@@ -417,12 +424,12 @@ class GraphData(object):
             show_band: bool = True,
             show: bool = True,
             indices: tp.Optional[tp.List[int]] = None,
-            fig: tp.Optional[plt.Figure] = None,
+            fig: tp.Optional['plt.Figure'] = None,
             figsize: tp.Tuple[float, float] = default_figsize,
             colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
             alpha: float = 1,
             linestyle: str = '-'
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         time_data: 'SubTimeData' = self.get_parameter_values_data(parameter_name)
         return self._plot_parameter(
             parameter_name, time_data,
@@ -439,12 +446,12 @@ class GraphData(object):
             show_band: bool = True,
             show: bool = True,
             indices: tp.Optional[tp.List[int]] = None,
-            fig: tp.Optional[plt.Figure] = None,
+            fig: tp.Optional['plt.Figure'] = None,
             figsize: tp.Tuple[float, float] = default_figsize,
             colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
             alpha: float = 1,
             linestyle: str = '-'
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         dim: int = time_data.dim()
 
         # construct figure
@@ -474,6 +481,7 @@ class GraphData(object):
                         time, mean - std, mean + std,
                         color=colour, alpha=0.1 * alpha
                     )
+                    from scipy.stats import norm
                     for r in range(1, self._resolution + 1):
                         factor: float = norm.pdf(1 + r / (1 * self._resolution), 1, 0.4)
                         # factor: float = r / self._resolution
@@ -499,12 +507,12 @@ class GraphData(object):
             show_band: bool = True,
             show: bool = True,
             indices: tp.Optional[tp.List[int]] = None,
-            fig: tp.Optional[plt.Figure] = None,
+            fig: tp.Optional['plt.Figure'] = None,
             figsize: tp.Tuple[float, float] = default_figsize,
             colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
             alpha: float = 1,
             linestyle: str = '-'
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         self.has_edge_name(edge_name)
         time_data: 'SubTimeData' = self._measurements[edge_name]
         dim: int = time_data.dim()
@@ -536,6 +544,7 @@ class GraphData(object):
                         time, mean - std, mean + std,
                         color=colour, alpha=0.1 * alpha
                     )
+                    from scipy.stats import norm
                     for r in range(1, self._resolution + 1):
                         factor: float = norm.pdf(1 + r / (1 * self._resolution), 1, 0.4)
                         # factor: float = r / self._resolution
@@ -546,6 +555,51 @@ class GraphData(object):
             fig.show()
         return fig
 
+    # optimisation-reports
+    def has_reports(self) -> bool:
+        return any(self._reports)
+
+    def get_reports(self, index: tp.Optional[int] = None) -> tp.List['OptimisationReport']:
+        """ Returns the optimisation-reports of the graph at <index> (default: of all graphs). """
+        if index is None:
+            return [report for reports in self._reports for report in reports]
+        assert len(self._reports) > index
+        return self._reports[index]
+
+    def plot_solver_cost(
+            self,
+            key: str = 'total_time',
+            x_key: str = 'timestep',
+            show: bool = True,
+            indices: tp.Optional[tp.List[int]] = None,
+            fig: tp.Optional['plt.Figure'] = None,
+            figsize: tp.Tuple[float, float] = default_figsize,
+            colour: tp.Optional[str] = None,  # b, g, r, c, m, y, k, w
+            alpha: float = 1
+    ) -> 'plt.Figure':
+        """ Scatters a report-quantity <key> (e.g., 'solve_time' or 'iterations') of each optimisation against <x_key>. """
+        assert self.has_reports()
+        if fig is None:
+            from matplotlib import pyplot as plt
+            fig, ax = plt.subplots(figsize=figsize)
+            fig.tight_layout()
+            ax.set_title(f"Optimisation '{key}' - {x_key}")
+            ax.set_xlabel(f'{x_key} [-]')
+            ax.set_ylabel(f"{key} [{'s' if key.endswith('time') else '-'}]")
+
+        ax: plt.Axes = fig.axes[0]
+        if indices is None:
+            indices = list(range(len(self._reports)))
+        for i in indices:
+            dicts: tp.List[tp.Dict[str, tp.Any]] = [report.to_dict() for report in self._reports[i]]
+            ax.scatter(
+                [dict_[x_key] for dict_ in dicts], [dict_[key] for dict_ in dicts],
+                color=colour, alpha=alpha, s=2
+            )
+        if show:
+            fig.show()
+        return fig
+
     # tracking
     def tracking_lsq(
             self,
@@ -591,7 +645,8 @@ class GraphData(object):
             metric_name: str,
             unit: str,
             figsize: tp.Tuple[float, float] = default_figsize
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
+        from matplotlib import pyplot as plt
         fig, ax = plt.subplots(figsize=figsize)
         fig.tight_layout()
         ax.set_title(f'{metric_name} - time')
@@ -606,7 +661,8 @@ class GraphData(object):
             x_label: str,
             y_label: str,
             figsize: tp.Tuple[float, float] = default_figsize
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
+        from matplotlib import pyplot as plt
         fig: plt.Figure = plt.figure(figsize=figsize)
         gs = fig.add_gridspec(dim, hspace=0.2)
         gs.subplots(sharex=True)
@@ -625,7 +681,7 @@ class GraphData(object):
             dim: int,
             parameter_name: str,
             figsize: tp.Tuple[float, float] = default_figsize
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         return cls.create_multi_fig(
             dim,
             f"Parameter '{parameter_name}' - time",
@@ -640,7 +696,7 @@ class GraphData(object):
             dim: int,
             sensor_name: str,
             figsize: tp.Tuple[float, float] = default_figsize
-    ) -> plt.Figure:
+    ) -> 'plt.Figure':
         return cls.create_multi_fig(
             dim,
             f"Measurements '{sensor_name}' - time",
@@ -651,59 +707,17 @@ class GraphData(object):
 
     @staticmethod
     def find_domain(graph: 'SubGraph') -> tp.Tuple[float, float, float, float]:
-        x_min: float = 0.
-        x_max: float = 0.
-        y_min: float = 0.
-        y_max: float = 0
-
-        type_: tp.Type['SubNode']
-        for type_ in graph.get_types():
-            if issubclass(type_, Visualisable):
-                elements: tp.List['SubNodeEdge'] = graph.get_of_type(type_)
-                element: 'SubNodeEdge'
-                for element in elements:
-                    if isinstance(element, DrawPoint):
-                        point: 'SubSizeVector' = element.draw_point()
-                        x_min = min(x_min, point[0])
-                        x_max = max(x_max, point[0])
-                        y_min = min(y_min, point[1])
-                        y_max = max(y_max, point[1])
-        return x_min, y_min, x_max - x_min, y_max - y_min
-
-    def plot_topology(self, index: int = 0) -> plt.Figure:
-        import time
-        graph: 'SubGraph' = self._graphs[index]
+        from src.framework.analysis.Analyser import AnalyserTopology
+        return AnalyserTopology.find_domain(graph)
 
-        _, __, size_x, size_y = self.find_domain(graph)
-        fig, ax = plt.subplots(figsize=(6, 6))
-        # fig, ax = plt.subplots(figsize=(0.2 * size_x, 0.2 * size_y))
-
-        for type_ in graph.get_types():
-            if issubclass(type_, Visualisable):
-                t = time.time()
-                elements: tp.List['SubNodeEdge'] = graph.get_of_type(type_)
-                element: 'SubNodeEdge'
-                for element in elements:
-                    color: tp.Tuple = type_.draw_rgb()
-                    if isinstance(element, DrawAxis):
-                        pose: 'SE2' = element.draw_pose().to_se2()
-                        translation: 'Vector2' = pose.translation()
-                        marker = mpl.markers.MarkerStyle(marker='4')
-                        marker._transform = marker.get_transform().rotate_deg(np.rad2deg(pose.rotation().angle()))
-                        ax.scatter(
-                            (translation[0]), (translation[1]), marker=marker, s=40,
-                            c=[list(Rgb.invert(color))]
-                        )
-                    elif isinstance(element, DrawPoint):
-                        point: 'Vector3' = element.draw_point()
-                        ax.plot(point[0], point[1], color=Rgb.invert(color), marker='.')
-                    elif isinstance(element, DrawEdge):
-                        a, b = element.draw_nodeset()
-                        ax.plot([a[0], b[0]], [a[1], b[1]], color=Rgb.invert(color), linestyle='-')
-                print(f'Plotting <{type_.__name__}> = time: {time.time() - t} s')
-        ax.set_aspect('equal')
-        fig.show()
-        return fig
+    def plot_topology(
+            self,
+            index: int = 0,
+            max_elements: tp.Optional[int] = None
+    ) -> 'plt.Figure':
+        from src.framework.analysis.Analyser import AnalyserTopology
+        graph: 'SubGraph' = self._graphs[index]
+        return AnalyserTopology.plot(graph, max_elements=max_elements)
 
     # save load
     def save(self, path: tp.Union[str, pathlib.Path]) -> None:
@@ -1,8 +1,8 @@
 import time
 import typing as tp
 
-import matplotlib.pyplot as plt
 import numpy as np
+from src.framework.analysis.sim.FigureExporter import FigureExporter
 from src.framework.analysis.sim.GraphData import GraphData
 
 if tp.TYPE_CHECKING:
@@ -12,9 +12,17 @@ if tp.TYPE_CHECKING:
 
 class SimulationSet(object):
     _simulations: tp.Dict[str, tp.Tuple['SubResults', tp.List[int], int]]
+    _exporter: tp.Optional[FigureExporter]
 
-    def __init__(self):
+    def __init__(
+            self,
+            exporter: tp.Optional[FigureExporter] = None,
+            should_export: bool = True
+    ):
         self._simulations = {}
+        if exporter is None and should_export:
+            exporter = FigureExporter()
+        self._exporter = exporter
 
     def add(
             self,
@@ -35,6 +43,8 @@ class SimulationSet(object):
                 name,
                 print_index=f'({i + 1}/{num_sims})'
             )
+        if self._exporter is not None:
+            self._exporter.wait()
 
     def run_sim(
             self,
@@ -68,7 +78,7 @@ class SimulationSet(object):
 
                 count: int = j * num_mc + k + 1
                 durations.append(duration)
-                avg_duration: float = float(np.mean(duration))
+                avg_duration: float = float(np.mean(durations))
                 num_runs_left: int = num_runs - count
                 print(
                     f"Run duration: {duration:.2f} (total: {t_current - t_sim:.2f}, {count} runs); Estimated time left: {num_runs_left * avg_duration:.2f} s ({num_runs_left} runs)"
@@ -78,17 +88,8 @@ class SimulationSet(object):
             graph_data.save(title)
             graph_datas.append(graph_data)
 
-            fig = graph_data.plot_cost(show=False)
-            fig.suptitle(title)
-            fig.show()
-
-            fig: plt.Figure = graph_data.plot_ate(show=False)
-            fig.suptitle(title)
-            fig.show()
-
-            for parameter_name in graph_data.get_parameters():
-                fig: plt.Figure = graph_data.plot_parameter(parameter_name, show=False)
-                fig.suptitle(title)
-                fig.show()
+            # figures are rendered from the saved results, off the simulation loop
+            if self._exporter is not None:
+                self._exporter.submit(title)
             print(f'{title}: {np.mean(graph_data._metrics.mean(graph_data._ATE))}')
         return graph_datas
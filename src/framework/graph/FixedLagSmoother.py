@@ -0,0 +1,223 @@
+import copy
+import typing as tp
+
+import numpy as np
+from src.framework.graph.Graph import Graph, GraphView
+from src.framework.graph.Linearisation import Linearisation
+from src.framework.graph.Prior import Prior
+from src.framework.graph.spatial.NodeSE2 import NodeSE2
+from src.utils.RingBuffer import RingBuffer
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubGraph, SubNode, SubEdge, SubNodeEdge
+    from src.framework.graph.Prior import SubPrior
+
+
+class FixedLagSmoother(object):
+    """
+    Bounds the optimisation-problem of a growing graph to a window of its last poses and the (parameter-)nodes that are
+    connected to these. A pose that leaves the window is marginalised into a dense prior on the remaining nodes (i.e.,
+    Schur complement) and frozen (i.e., fixed) in the graph; other nodes are marginalised with their last edge.
+    """
+
+    _rcond: float = 1e-12  # relative cut-off of the (pseudo-)inverses of the information matrices
+
+    _window: int
+    _poses: RingBuffer['NodeSE2']  # poses in the window
+    _expelled: tp.List['NodeSE2']  # poses that left the window, but are not yet marginalised
+
+    # active (i.e., not marginalised) elements
+    _nodes: tp.Dict[int, 'SubNode']
+    _edges: tp.Dict[int, 'SubEdge']  # by id(edge)
+    _edge_ids: tp.Dict[int, tp.List[int]]  # id(edge) to node-ids
+    _adjacency: tp.Dict[int, tp.Dict[int, 'SubEdge']]  # node-id to active edges (by id(edge))
+    _prior: tp.Optional['SubPrior']
+
+    def __init__(self, window: int):
+        assert window > 0
+        self._window = window
+        self.reset()
+
+    def reset(self) -> None:
+        self._poses = RingBuffer['NodeSE2'](self._window)
+        self._expelled = []
+        self._nodes = {}
+        self._edges = {}
+        self._edge_ids = {}
+        self._adjacency = {}
+        self._prior = None
+
+    def get_window(self) -> int:
+        return self._window
+
+    def get_prior(self) -> tp.Optional['SubPrior']:
+        return self._prior
+
+    # elements
+    def add_node(self, node: 'SubNode') -> None:
+        id_: int = node.get_id()
+        self._nodes[id_] = node
+        self._adjacency[id_] = {}
+        if isinstance(node, NodeSE2):
+            expelled: tp.Optional['NodeSE2'] = self._poses.push(node)
+            if expelled is not None:
+                self._expelled.append(expelled)
+
+    def add_edge(self, edge: 'SubEdge') -> None:
+        self._edges[id(edge)] = edge
+        self._connect(edge)
+
+    def update_edges(self, edges: tp.List['SubEdge']) -> None:
+        """ Reconnects active <edges> of which nodes are removed (e.g., retired parameters). """
+        for edge in edges:
+            key: int = id(edge)
+            assert key in self._edges, f'Edge {edge.identifier_class()} is marginalised and can no longer change.'
+            for id_ in self._edge_ids.pop(key):
+                del self._adjacency[id_][key]
+            self._connect(edge)
+
+    def get_expelled_edges(self) -> tp.List['SubEdge']:
+        """ Returns the active edges of the poses that left the window, i.e., the edges to be marginalised next. """
+        edges: tp.Dict[int, 'SubEdge'] = {}
+        for pose in self._expelled:
+            edges.update(self._adjacency[pose.get_id()])
+        return list(edges.values())
+
+    def _connect(self, edge: 'SubEdge') -> None:
+        key: int = id(edge)
+        ids: tp.List[int] = [node.get_id() for node in edge.get_nodes() if node.get_id() in self._nodes]
+        self._edge_ids[key] = ids
+        for id_ in ids:
+            self._adjacency[id_][key] = edge
+
+    # window
+    def window(self) -> 'SubGraph':
+        """
+        Returns the graph of the active nodes, active edges and prior. Marginalised nodes of active edges are included as
+        (fixed) copies, such that optimisation of the window does not change them. Nodes are ordered by id (as g2o).
+        """
+        nodes: tp.Dict[int, 'SubNode'] = dict(self._nodes)
+        for edge in self._edges.values():
+            for node in edge.get_nodes():
+                if node.get_id() not in nodes:
+                    nodes[node.get_id()] = copy.deepcopy(node)
+
+        window: 'SubGraph' = Graph()
+        for id_ in sorted(nodes):
+            window.add_node(nodes[id_])
+        for edge in self._edges.values():
+            window.add_edge(edge)
+        if self._prior is not None:
+            window.add_prior(self._prior)
+        return window
+
+    def snapshot(
+            self,
+            graph: 'SubGraph',
+            timestep: int
+    ) -> 'SubGraph':
+        """
+        Returns a view of <graph> at <timestep> that shares its frozen nodes and edges. Only the active nodes and edges
+        are copied, such that its cost does not grow with the graph.
+        """
+        memo: tp.Dict[int, tp.Any] = {}
+        replacements: tp.Dict[int, 'SubNodeEdge'] = {}
+        for node in self._nodes.values():
+            replacements[id(node)] = copy.deepcopy(node, memo)
+        for edge in self._edges.values():
+            for node in edge.get_nodes():
+                memo.setdefault(id(node), node)
+            replacements[id(edge)] = copy.deepcopy(edge, memo)
+
+        snapshot: 'SubGraph' = GraphView(graph, timestep, len(graph.get_edges()), replacements=replacements)
+        snapshot._truth = graph._truth  # as Graph.copy_attributes_to, of which the equivalence-check would materialise
+        if graph.has_previous():
+            snapshot.set_previous(graph.get_previous())
+        return snapshot
+
+    # marginalisation
+    def marginalise(self) -> None:
+        """ Marginalises the poses that left the window, at the current estimate. """
+        for pose in self._expelled:
+            self._marginalise(pose)
+        self._expelled = []
+
+    def _marginalise(self, pose: 'NodeSE2') -> None:
+        # the edges of the pose are marginalised, together with the other (non-pose) nodes of which these are the last
+        keys: tp.Set[int] = set(self._adjacency[pose.get_id()])
+        eliminated: tp.List['SubNode'] = [pose]
+        for key in keys:
+            for id_ in self._edge_ids[key]:
+                node: 'SubNode' = self._nodes[id_]
+                if not isinstance(node, NodeSE2) and node not in eliminated and set(self._adjacency[id_]) <= keys:
+                    eliminated.append(node)
+        edges: tp.List['SubEdge'] = [self._edges[key] for key in keys]
+
+        # information (H) and gradient (g) of the edges and prior, of which the variables are ordered as eliminated first
+        variables: tp.List['SubNode'] = [node for node in eliminated if not node.is_fixed()]
+        num_eliminated: int = len(variables)
+        for edge in edges:
+            for node in edge.get_active_nodes():
+                if node not in variables:
+                    variables.append(node)
+        if self._prior is not None:
+            for id_ in self._prior.get_node_ids():
+                if self._nodes[id_] not in variables:
+                    variables.append(self._nodes[id_])
+        offsets: tp.Dict[int, int] = {}
+        dim: int = 0
+        for node in variables:
+            offsets[node.get_id()] = dim
+            dim += node.dim()
+        information: np.ndarray = np.zeros((dim, dim))
+        gradient: np.ndarray = np.zeros(dim)
+
+        for edge in edges:
+            if not edge.get_active_nodes():
+                continue
+            indices: np.ndarray = self._indices(edge.get_active_nodes(), offsets)
+            jacobian: np.ndarray = np.hstack(Linearisation.edge_jacobian(edge))
+            info_matrix: np.ndarray = edge.get_info_matrix().array()
+            error: np.ndarray = edge._compute_error_vector().array().ravel()
+            information[np.ix_(indices, indices)] += jacobian.transpose() @ info_matrix @ jacobian
+            gradient[indices] += jacobian.transpose() @ info_matrix @ error
+        if self._prior is not None:
+            prior_nodes: tp.List['SubNode'] = [self._nodes[id_] for id_ in self._prior.get_node_ids()]
+            indices: np.ndarray = self._indices(prior_nodes, offsets)
+            info_matrix: np.ndarray = self._prior.get_info_matrix()
+            information[np.ix_(indices, indices)] += info_matrix
+            gradient[indices] += info_matrix @ self._prior.error_vector(prior_nodes)
+
+        # Schur complement
+        split: int = sum(node.dim() for node in variables[:num_eliminated])
+        blanket: tp.List['SubNode'] = variables[num_eliminated:]
+        self._prior = None
+        if blanket:
+            inverse: np.ndarray = np.linalg.pinv(information[:split, :split], rcond=self._rcond, hermitian=True)
+            coupling: np.ndarray = information[split:, :split] @ inverse
+            schur: np.ndarray = information[split:, split:] - coupling @ information[:split, split:]
+            schur = 0.5 * (schur + schur.transpose())
+            reduced: np.ndarray = gradient[split:] - coupling @ gradient[:split]
+            mean: np.ndarray = -np.linalg.pinv(schur, rcond=self._rcond, hermitian=True) @ reduced
+            self._prior = Prior.from_nodes(blanket, mean, schur)
+
+        # remove marginalised edges and freeze marginalised nodes
+        for key in keys:
+            for id_ in self._edge_ids.pop(key):
+                del self._adjacency[id_][key]
+            del self._edges[key]
+        for node in eliminated:
+            node.fix()
+            del self._nodes[node.get_id()]
+            del self._adjacency[node.get_id()]
+
+    @staticmethod
+    def _indices(
+            nodes: tp.List['SubNode'],
+            offsets: tp.Dict[int, int]
+    ) -> np.ndarray:
+        indices: tp.List[int] = []
+        for node in nodes:
+            start: int = offsets[node.get_id()]
+            indices += range(start, start + node.dim())
+        return np.array(indices, dtype=int)
@@ -1,6 +1,8 @@
+import collections
 import copy
 import typing as tp
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from src.framework.graph.data import DataFactory
@@ -8,14 +10,20 @@ from src.framework.graph.parameter.ParameterSpecification import ParameterDict
 from src.framework.math.matrix.square import SquareFactory
 from src.framework.math.matrix.vector import VectorFactory
 from src.framework.math.matrix.vector.Vector import Vector
+from src.utils.Profiler import profiled
 
 if tp.TYPE_CHECKING:
     from src.framework.graph.data import SubData, SubDataSymmetric
     from src.framework.optimiser.Optimiser import Optimiser
+    from src.framework.optimiser.OptimisationReport import OptimisationReport
     from src.framework.graph.parameter.ParameterSpecification import ParameterSpecification
     from src.framework.math.lie.transformation import SE2
     from src.framework.math.matrix.vector import SubVector, SubSizeVector, Vector2, Vector3
     from src.framework.math.matrix.square import SubSquare
+    from src.framework.graph.Linearisation import Linearisation
+    from src.framework.graph.Prior import SubPrior
+    from src.framework.math.matrix.BlockMatrix import SubSparseBlockMatrix
+    from src.framework.math.matrix.Matrix import SubMatrix
 
 SubElement = tp.TypeVar('SubElement', bound='Element')
 SubDataContainer = tp.TypeVar('SubDataContainer', bound='DataContainer')
@@ -26,6 +34,7 @@ SubNodeContainer = tp.TypeVar('SubNodeContainer', bound='NodeContainer')
 SubEdge = tp.TypeVar('SubEdge', bound='Edge')
 SubNodeEdge = tp.Union[SubNode, SubEdge]
 SubGraph = tp.TypeVar('SubGraph', bound='Graph')
+EdgeKey = tp.Tuple[tp.Tuple[int, ...], tp.Type['Edge']]  # connectivity-key: (node-ids, edge-type)
 
 T = tp.TypeVar('T')
 
@@ -524,6 +533,7 @@ class Edge(tp.Generic[T], DataContainer[T], NodeContainer):
     _error_vector: tp.Optional['SubSizeVector']
     _rpet2: tp.Optional[float]
     _rper2: tp.Optional[float]
+    _is_stale: bool  # metrics are (re)computed when these are next accessed
 
     def __init__(
             self,
@@ -543,6 +553,7 @@ class Edge(tp.Generic[T], DataContainer[T], NodeContainer):
         self._error_vector = None
         self._rpet2 = None
         self._rper2 = None
+        self._is_stale = False
 
         # nodes
         if nodes is not None:
@@ -590,13 +601,21 @@ class Edge(tp.Generic[T], DataContainer[T], NodeContainer):
         self.set_metrics()
 
     # metrics
-    def add_node(self, node: SubNode) -> None:
+    def add_node(
+            self,
+            node: SubNode,
+            is_deferred: bool = False
+    ) -> None:
         super().add_node(node)
-        self.set_metrics()
+        self.set_metrics(is_deferred=is_deferred)
 
-    def remove_node_id(self, id_) -> None:
+    def remove_node_id(
+            self,
+            id_: int,
+            is_deferred: bool = False
+    ) -> None:
         super().remove_node_id(id_)
-        self.set_metrics()
+        self.set_metrics(is_deferred=is_deferred)
 
     @abstractmethod
     def set_from_transformation(
@@ -617,8 +636,10 @@ class Edge(tp.Generic[T], DataContainer[T], NodeContainer):
         super().set_from_vector(vector)
         self.set_metrics()
 
-    def set_metrics(self) -> None:
-        if self._is_complete():
+    def set_metrics(self, is_deferred: bool = False) -> None:
+        """ (Re)computes the metrics, or defers this until these are next accessed (e.g., for batches of edges). """
+        self._is_stale = is_deferred
+        if not is_deferred and self._is_complete():
             self._error_vector = self._compute_error_vector()
             if self.has_truth():
                 self._rpet2 = self._compute_rpe_translation2()
@@ -641,14 +662,20 @@ class Edge(tp.Generic[T], DataContainer[T], NodeContainer):
 
     def error_vector(self) -> 'SubSizeVector':
         assert self._is_complete()
+        if self._is_stale:
+            self.set_metrics()
         return self._error_vector
 
     def rpe_translation2(self) -> tp.Optional[float]:
         assert self.has_truth() and self._is_complete()
+        if self._is_stale:
+            self.set_metrics()
         return self._rpet2
 
     def rpe_rotation2(self) -> tp.Optional[float]:
         assert self.has_truth() and self._is_complete()
+        if self._is_stale:
+            self.set_metrics()
         return self._rper2
 
     def cost(self) -> float:
@@ -663,6 +690,32 @@ class Edge(tp.Generic[T], DataContainer[T], NodeContainer):
         vector_array: np.ndarray = vector.array()
         return float(vector_array.transpose() @ matrix.array() @ vector_array)
 
+    # linearisation
+    def get_jacobian(self) -> 'SubSparseBlockMatrix':
+        """ Returns the (1 x n)-block Jacobian of the error-vector w.r.t. the n active nodes. """
+        from src.framework.graph.Linearisation import Linearisation
+        from src.framework.math.matrix.BlockMatrix import SparseBlockMatrix
+        from src.framework.math.matrix.Matrix import Matrix
+        jacobians: tp.List[np.ndarray] = Linearisation.edge_jacobian(self)
+        jacobian: 'SubSparseBlockMatrix' = SparseBlockMatrix(
+            [self.dim()], [node.dim() for node in self.get_active_nodes()]
+        )
+        for i, block in enumerate(jacobians):
+            jacobian[0, i] = Matrix(block)
+        return jacobian
+
+    def get_hessian(self) -> 'SubSparseBlockMatrix':
+        """ Returns the (n x n)-block Hessian J^T Omega J of the n active nodes. """
+        from src.framework.graph.Linearisation import Linearisation
+        from src.framework.math.matrix.BlockMatrix import SparseBlockMatrix
+        from src.framework.math.matrix.Matrix import Matrix
+        hessian: 'SubSparseBlockMatrix' = SparseBlockMatrix([node.dim() for node in self.get_active_nodes()])
+        for (i, j), block in Linearisation.edge_hessian(self).items():
+            hessian[i, j] = Matrix(block)
+            if i != j:
+                hessian[j, i] = Matrix(block.transpose())
+        return hessian
+
     # timestep
     def timestep(self) -> int:
         timesteps: tp.List[int] = [node.get_timestep() for node in self.get_nodes()]
@@ -698,6 +751,7 @@ class Edge(tp.Generic[T], DataContainer[T], NodeContainer):
         new._error_vector = self._error_vector  # passed by reference
         new._rpet2 = self._rpet2  # passed by value
         new._rper2 = self._rper2  # passed by value
+        new._is_stale = self._is_stale  # passed by value
         return new
 
     def __deepcopy__(self, memo: tp.Optional[tp.Dict[int, tp.Any]] = None) -> SubEdge:
@@ -715,6 +769,7 @@ class Edge(tp.Generic[T], DataContainer[T], NodeContainer):
         new._error_vector = copy.deepcopy(self._error_vector, memo)  # passed by reference -> copy
         new._rpet2 = self._rpet2  # passed by value
         new._rper2 = self._rper2  # passed by value
+        new._is_stale = self._is_stale  # passed by value
         return new
 
 
@@ -723,12 +778,16 @@ class Graph(NodeContainer):
     _by_type: tp.Dict[tp.Type[SubNodeEdge], tp.List[SubNodeEdge]]
     _by_name: tp.Dict[str, tp.List[SubNodeEdge]]
     _edges: tp.List[SubEdge]
+    _priors: tp.List['SubPrior']  # dense priors (e.g., of marginalised nodes)
 
     # references
     _previous: tp.Optional[SubGraph]
     _truth: tp.Optional[SubGraph]
     _atol: float
 
+    # reports of the optimisations that resulted in this graph
+    _reports: tp.List['OptimisationReport']
+
     def __init__(
             self,
             name: tp.Optional[str] = None
@@ -737,9 +796,11 @@ class Graph(NodeContainer):
         self._by_type = {}
         self._by_name = {}
         self._edges = []
+        self._priors = []
         self._previous = None
         self._truth = None
         self._atol = 1e-6
+        self._reports = []
 
     def identifier(self) -> str:
         return f'{len(self.get_nodes())}; {len(self.get_edges())}'
@@ -785,6 +846,23 @@ class Graph(NodeContainer):
         assert tuple(node_ids) in by_node_ids
         return by_node_ids[node_ids]
 
+    def get_edges_by_key(self, is_spatial: bool = False) -> tp.Dict[EdgeKey, tp.Deque[tp.Tuple[int, SubEdge]]]:
+        """ Returns the (index, edge)-pairs in order by their connectivity-key of (spatial if <is_spatial>) node-ids. """
+        by_key: tp.Dict[EdgeKey, tp.Deque[tp.Tuple[int, SubEdge]]] = collections.defaultdict(collections.deque)
+        for i, edge in enumerate(self.get_edges()):
+            node_ids: tp.List[int] = [node.get_id() for node in edge.get_spatial_nodes()] if is_spatial \
+                else edge.get_node_ids()
+            by_key[(tuple(node_ids), type(edge))].append((i, edge))
+        return by_key
+
+    def add_prior(self, prior: 'SubPrior') -> None:
+        for id_ in prior.get_node_ids():
+            assert self.contains_node_id(id_)
+        self._priors.append(prior)
+
+    def get_priors(self) -> tp.List['SubPrior']:
+        return self._priors
+
     def get_node_names(self) -> tp.List[str]:
         return [name for name in self.get_names() if issubclass(self.get_type_of_name(name), Node)]
 
@@ -828,6 +906,8 @@ class Graph(NodeContainer):
             vectors.append(vector)
         if cost_threshold is None:
             cost_threshold = self.cost()
+        if optimiser.is_speculative() and parameters:
+            return self._optimise_speculatively(optimiser, parameters, vectors, cost_threshold)
 
         solution: tp.Optional[SubGraph] = optimiser.instance_optimise(self)
         if solution is not None:
@@ -841,8 +921,10 @@ class Graph(NodeContainer):
             # else: fix parameters and try again
             for parameter in parameters:
                 parameter.fix()
+            reports: tp.List['OptimisationReport'] = solution.get_reports()
             solution = optimiser.instance_optimise(self)
             if solution is not None:
+                solution.set_reports(reports + solution.get_reports())
                 # revert parameter fix
                 for parameter in parameters:
                     parameter.fix(is_fixed=False)
@@ -853,12 +935,66 @@ class Graph(NodeContainer):
             for i, parameter in enumerate(parameters):
                 parameter.set_from_vector(vectors[i])
 
+    def _optimise_speculatively(
+            self,
+            optimiser: 'Optimiser',
+            parameters: tp.List[SubParameterNode],
+            vectors: tp.List['SubSizeVector'],
+            cost_threshold: float
+    ) -> tp.Optional[SubGraph]:
+        """
+        Optimises with free and with fixed parameters concurrently, and accepts a solution as <optimise> does. The
+        solution with fixed parameters is only read (and its report recorded) if the (free) solution is rejected. Each
+        call uses its own workspace, such that concurrent calls do not overwrite each other's files.
+        """
+        fixed_ids: tp.Set[int] = {parameter.get_id() for parameter in parameters}
+        workspace: str = optimiser.unique_workspace('speculative')
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                free_future = executor.submit(optimiser.instance_optimise, self, workspace=f'{workspace}/free')
+                fixed_future = executor.submit(
+                    optimiser.instance_solve, self,
+                    workspace=f'{workspace}/fixed', fixed_ids=fixed_ids, should_record=False
+                )
+                solution: tp.Optional[SubGraph] = free_future.result()
+                path_output, report = fixed_future.result()
+
+            if solution is not None:
+
+                # cost below cost_threshold is considered optimal
+                if solution.cost() < cost_threshold:
+                    return self.accept_solution(solution)
+
+                # else: accept the solution with fixed parameters
+                optimiser.add_report(report)
+                fallback: tp.Optional[SubGraph] = optimiser.instance_read(path_output, self, report)
+                if fallback is not None:
+                    fallback.set_reports(solution.get_reports() + fallback.get_reports())
+                    return self.accept_solution(fallback)
+
+                # revert parameters to original state
+                for i, parameter in enumerate(parameters):
+                    parameter.set_from_vector(vectors[i])
+        finally:
+            optimiser.remove_workspace(workspace)
+
+    def add_report(self, report: 'OptimisationReport') -> None:
+        self._reports.append(report)
+
+    def set_reports(self, reports: tp.List['OptimisationReport']) -> None:
+        self._reports = reports
+
+    def get_reports(self) -> tp.List['OptimisationReport']:
+        """ Returns the reports of the optimisation(s) that resulted in this graph. """
+        return self._reports
+
     def accept_solution(self, solution: SubGraph) -> SubGraph:
         self.from_vector(solution.to_vector())
         if self.has_previous():
             solution.set_previous(self.get_previous())
         return solution
 
+    @profiled('graph.copy')
     def copy(self, is_shallow: bool = False) -> SubGraph:
         copy_: SubGraph = copy.copy(self) if is_shallow else copy.deepcopy(self)
         self.copy_attributes_to(copy_)
@@ -887,6 +1023,21 @@ class Graph(NodeContainer):
         for edge in self.get_edges():
             edge.set_metrics()
 
+    # linearisation
+    def linearise(self) -> 'Linearisation':
+        """ Linearises the graph around its current estimate. """
+        from src.framework.graph.Linearisation import Linearisation
+        return Linearisation(self)
+
+    def get_hessian(self) -> 'SubSparseBlockMatrix':
+        """ Returns the sparse block Hessian of the active nodes, in which only the non-zero blocks are set. """
+        return self.linearise().get_hessian()
+
+    def get_marginals(self, nodes: tp.Optional[tp.List[SubNode]] = None) -> tp.List['SubMatrix']:
+        """ Returns the marginal covariances of the given (default: all) active nodes. """
+        from src.framework.math.matrix.Matrix import Matrix
+        return [Matrix(marginal) for marginal in self.linearise().marginals(nodes)]
+
     # timestep
     def timestep(self) -> tp.Optional[int]:
         return self.get_nodes()[-1].get_timestep()
@@ -901,10 +1052,16 @@ class Graph(NodeContainer):
 
     def assign_truth(
             self,
-            graph: SubGraph
+            graph: SubGraph,
+            should_check_consistency: bool = True
     ) -> None:
-        assert graph.is_consistent()
-        assert self.is_similar(graph)
+        """
+        Assigns <graph> as truth: nodes are associated by id, and edges in order by their connectivity-key of spatial
+        node-ids and type. The consistency-check (i.e., zero truth-cost) can be skipped, since it evaluates every edge.
+        """
+        if should_check_consistency:
+            assert graph.is_consistent()
+        assert super().is_similar(graph)
         assert not self.has_truth()
         self._truth = graph
 
@@ -915,17 +1072,25 @@ class Graph(NodeContainer):
                 truth_node: SubNode = graph.get_node(id_)
                 node.assign_truth(truth_node)
 
-        # edges
-        edge_iter: iter = iter(self.get_edges())
-        edge: tp.Optional[SubEdge] = None
+        # edges: every truth-edge is associated with the next edge (after the previous association) of the same key
+        by_key: tp.Dict[EdgeKey, tp.Deque[tp.Tuple[int, SubEdge]]] = self.get_edges_by_key(is_spatial=True)
+        num_spatial: int = sum(len(candidates) for (node_ids, _), candidates in by_key.items() if node_ids)
+        num_spatial_assigned: int = 0
+        index: int = -1
         truth_edge: SubEdge
-        for i, truth_edge in enumerate(graph.get_edges()):
-            is_eligible: bool = False
-            while not is_eligible:
-                edge = next(edge_iter, None)
-                assert edge is not None
-                is_eligible = edge.is_similar(truth_edge)
+        for truth_edge in graph.get_edges():
+            node_ids: tp.Tuple[int, ...] = tuple(node.get_id() for node in truth_edge.get_spatial_nodes())
+            candidates: tp.Deque[tp.Tuple[int, SubEdge]] = by_key[(node_ids, type(truth_edge))]
+            while candidates and candidates[0][0] <= index:
+                candidates.popleft()
+            assert candidates, f'Truth-edge {truth_edge.identifier_class()} has no similar edge.'
+            index, edge = candidates.popleft()
             edge.assign_truth(truth_edge)
+            if node_ids:
+                num_spatial_assigned += 1
+
+        # similarity: all edges between spatial nodes have a truth
+        assert num_spatial_assigned == num_spatial
 
     # subgraphs
     def previous_depth(self) -> int:
@@ -955,42 +1120,36 @@ class Graph(NodeContainer):
         return graphs[::-1]
 
     def find_subgraphs(self) -> tp.List[SubGraph]:
+        """
+        Splits the graph into the snapshots of its timesteps (in a single pass), which are views that share the storage
+        of this graph. A timestep starts at every edge that introduces a spatial node; since nodes are created in order
+        of their ids, this is an edge with a spatial node-id above the highest one so far.
+        """
         assert not self.has_previous()
-        graph: SubGraph = self.__class__()
         subgraphs: tp.List[SubGraph] = []
 
-        # initialise an empty node-set and edge-iterator
-        node_set: tp.Set[SubGraph] = set()
-        edge_iter: iter = iter(self.get_edges())
-        edge: tp.Optional[SubEdge] = next(edge_iter)
-
-        is_completed: bool = False
-        while not is_completed:
-            # add nodes connected to current edge to node-set
-            edges_to_add: tp.List[SubEdge] = []
-            node_set.update(edge.get_spatial_nodes())
-
-            # find all edges contained in the current node-set
-            is_contained = True
-            while is_contained:
-                edges_to_add.append(edge)
-                edge = next(edge_iter, None)
-                if edge is not None:
-                    is_contained = (set(edge.get_spatial_nodes()) <= node_set)
-                else:
-                    is_completed = True
-                    is_contained = False
-
-            # copy graph
-            if not is_completed:
-                timestep: int = len(subgraphs)
-                for edge_to_add in edges_to_add:
-                    for node in edge_to_add.get_nodes():
-                        if not graph.contains_node_id(node.get_id()):
-                            node.set_timestep(timestep)
-                            graph.add_node(node)
-                    graph.add_edge(edge_to_add)
-                subgraphs.append(copy.copy(graph))
+        timestep: int = 0
+        max_id: int = -1
+        seen_ids: tp.Set[int] = set()
+        i: int
+        edge: SubEdge
+        for i, edge in enumerate(self.get_edges()):
+            edge_max_id: int = max((node.get_id() for node in edge.get_spatial_nodes()), default=max_id)
+            if edge_max_id > max_id:
+                if i > 0:
+                    subgraphs.append(GraphView(self, timestep, i))
+                    timestep += 1
+                max_id = edge_max_id
+            for node in edge.get_nodes():
+                if node.get_id() not in seen_ids:
+                    seen_ids.add(node.get_id())
+                    node.set_timestep(timestep)
+
+        # nodes without edges are only part of the full graph
+        node: SubNode
+        for node in self.get_nodes():
+            if node.get_id() not in seen_ids:
+                node.set_timestep(timestep)
         subgraphs.append(self)
 
         # store subgraphs
@@ -1025,6 +1184,8 @@ class Graph(NodeContainer):
         error: float = 0.
         for edge in self.get_edges():
             error += edge.cost()
+        for prior in self._priors:
+            error += prior.cost(self)
         return error
 
     def ate(self) -> float:
@@ -1072,6 +1233,7 @@ class Graph(NodeContainer):
         self._by_name = {}
         self._by_type = {}
         self._edges = []
+        self._priors = []
 
     # copy
     def is_similar(self, graph: SubGraph) -> bool:
@@ -1108,11 +1270,13 @@ class Graph(NodeContainer):
         new._by_type = {type_: copy.copy(elements) for (type_, elements) in self._by_type.items()}  # passed by reference -> copy
         new._by_name = {name: copy.copy(elements) for (name, elements) in self._by_name.items()}  # passed by reference -> copy
         new._edges = copy.copy(self._edges)  # passed by reference -> copy
+        new._priors = copy.copy(self._priors)  # immutable priors
 
         # other attributes
         new._previous = None  # not copied
         new._truth = None  # not copied
         new._atol = self._atol  # passed by value
+        new._reports = []  # not copied
         return new
 
     def __deepcopy__(self, memo: tp.Optional[tp.Dict[int, tp.Any]] = None) -> SubEdge:
@@ -1125,9 +1289,95 @@ class Graph(NodeContainer):
         new._by_type = {type_: copy.deepcopy(elements, memo) for (type_, elements) in self._by_type.items()}  # passed by reference -> copy
         new._by_name = {name: copy.deepcopy(elements, memo) for (name, elements) in self._by_name.items()}  # passed by reference -> copy
         new._edges = copy.deepcopy(self._edges, memo)  # passed by reference -> copy
+        new._priors = copy.copy(self._priors)  # immutable priors
 
         # other attributes
         new._previous = None  # not copied
         new._truth = None  # not copied
         new._atol = self._atol  # passed by value
+        new._reports = []  # not copied
+        return new
+
+
+class GraphView(Graph):
+    """
+    A snapshot of a (full) graph at a timestep, i.e., its first edges and the nodes up to that timestep. It shares the
+    storage of the full graph: its element-containers are only created when these are first accessed. Elements that
+    have changed since are taken from <replacements>, and edges of replaced nodes are copied when accessed.
+    """
+
+    _lazy_attributes: tp.Tuple[str, ...] = (
+        '_nodes', '_spatial_nodes', '_parameter_nodes', '_parameter_names', '_by_type', '_by_name', '_edges', '_priors'
+    )
+
+    _source: Graph
+    _view_timestep: int
+    _num_edges: int
+    _replacements: tp.Dict[int, SubNodeEdge]  # by id(element) of the source
+
+    def __init__(
+            self,
+            source: Graph,
+            timestep: int,
+            num_edges: int,
+            replacements: tp.Optional[tp.Dict[int, SubNodeEdge]] = None
+    ):
+        # the element-containers of Graph.__init__ are deliberately not created
+        self._name = source.get_name()
+        self._previous = None
+        self._truth = None
+        self._atol = source._atol
+        self._reports = []
+
+        self._source = source
+        self._view_timestep = timestep
+        self._num_edges = num_edges
+        self._replacements = {} if replacements is None else replacements
+
+    def __getattr__(self, name: str) -> tp.Any:
+        # only called for attributes that are not set, i.e., the element-containers before their first access
+        if name not in GraphView._lazy_attributes:
+            raise AttributeError(name)
+        self._materialise()
+        return object.__getattribute__(self, name)
+
+    def _materialise(self) -> None:
+        self._nodes = {}
+        self._spatial_nodes = {}
+        self._parameter_nodes = {}
+        self._parameter_names = []
+        self._by_type = {}
+        self._by_name = {}
+        self._edges = []
+        self._priors = []
+        for node in self._source.get_nodes():
+            if node.get_timestep() <= self._view_timestep:
+                self.add_node(self._replacements.get(id(node), node))
+
+        # edges of replaced nodes are copied, such that these refer to the replacements
+        memo: tp.Dict[int, tp.Any] = dict(self._replacements)
+        for edge in self._source.get_edges()[:self._num_edges]:
+            if id(edge) not in memo and any(id(node) in self._replacements for node in edge.get_nodes()):
+                for node in edge.get_nodes():
+                    memo.setdefault(id(node), node)
+                copy.deepcopy(edge, memo)
+            self.add_edge(memo.get(id(edge), edge))
+
+    def timestep(self) -> tp.Optional[int]:
+        return self._view_timestep
+
+    def __copy__(self) -> SubGraph:
+        new = super().__copy__()
+        new._source = self._source
+        new._view_timestep = self._view_timestep
+        new._num_edges = self._num_edges
+        new._replacements = self._replacements
+        return new
+
+    def __deepcopy__(self, memo: tp.Optional[tp.Dict[int, tp.Any]] = None) -> SubGraph:
+        new = super().__deepcopy__(memo)
+        new._source = self._source
+        new._view_timestep = self._view_timestep
+        new._num_edges = self._num_edges
+        new._replacements = self._replacements
         return new
@@ -4,10 +4,13 @@ from datetime import datetime
 
 from src.definitions import get_project_root
 from src.framework.graph.Graph import Node, Edge, Graph
+from src.framework.graph.Prior import Prior
+from src.framework.graph.data.Parser import Parser
 from src.framework.graph.database import database
 
 if tp.TYPE_CHECKING:
-    from src.framework.graph.Graph import SubNode, SubEdge, SubGraph
+    from src.framework.graph.Graph import SubNode, SubEdge, SubGraph, EdgeKey
+    from src.framework.graph.Prior import SubPrior
 
 
 class GraphParser(object):
@@ -18,8 +21,10 @@ class GraphParser(object):
             cls,
             graph: 'SubGraph',
             file: pathlib.Path,
-            should_print: bool = True
+            should_print: bool = True,
+            fixed_ids: tp.Optional[tp.Set[int]] = None
     ) -> None:
+        """ Saves the graph, of which the nodes with <fixed_ids> are (also) written as fixed. """
         if should_print:
             print(f"framework/GraphParser: Saving '{graph.identifier_class_unique()}' to:\n    '{file}'")
         # graph.set_path(file)
@@ -28,19 +33,68 @@ class GraphParser(object):
 
         node: 'SubNode'
         for node in graph.get_nodes():
-            tag: str = cls._database.from_element(node)
-            id_: str = f'{node.get_id()}'
-            data: str = ' '.join(node.write())
-            writer.write(f'{tag} {id_} {data}\n')
-            if node.is_fixed():
-                writer.write(f'FIX {id_}\n')
+            cls.write_node(writer, node, is_fixed=fixed_ids is not None and node.get_id() in fixed_ids)
 
         edge: 'SubEdge'
         for edge in graph.get_edges():
-            tag: str = cls._database.from_element(edge)
-            ids: str = ' '.join([f'{id_}' for id_ in edge.get_node_ids()])
-            data: str = ' '.join(edge.write())
-            writer.write(f'{tag} {ids} {data}\n')
+            cls.write_edge(writer, edge)
+
+        prior: 'SubPrior'
+        for prior in graph.get_priors():
+            cls.write_prior(writer, prior)
+
+    @classmethod
+    def write_node(
+            cls,
+            writer: tp.TextIO,
+            node: 'SubNode',
+            is_fixed: bool = False,
+            is_exact: bool = False
+    ) -> None:
+        """
+        Writes the line(s) of a single node, such that graphs can be streamed to a file element-by-element. The node is
+        written in full precision if <is_exact>.
+        """
+        tag: str = cls._database.from_element(node)
+        id_: str = f'{node.get_id()}'
+        data: str = ' '.join(cls._write_words(node, is_exact))
+        writer.write(f'{tag} {id_} {data}\n')
+        if is_fixed or node.is_fixed():
+            writer.write(f'FIX {id_}\n')
+
+    @classmethod
+    def write_edge(
+            cls,
+            writer: tp.TextIO,
+            edge: 'SubEdge',
+            is_exact: bool = False
+    ) -> None:
+        """ Writes the line of a single edge, of which the nodes should have been written before (see write_node). """
+        tag: str = cls._database.from_element(edge)
+        ids: str = ' '.join([f'{id_}' for id_ in edge.get_node_ids()])
+        data: str = ' '.join(cls._write_words(edge, is_exact))
+        writer.write(f'{tag} {ids} {data}\n')
+
+    @staticmethod
+    def _write_words(
+            element: tp.Union['SubNode', 'SubEdge'],
+            is_exact: bool
+    ) -> tp.List[str]:
+        if not is_exact:
+            return element.write()
+        with Parser.full_precision():
+            return element.write()
+
+    @classmethod
+    def write_prior(
+            cls,
+            writer: tp.TextIO,
+            prior: 'SubPrior'
+    ) -> None:
+        """ Writes the line of a single prior, of which the nodes should have been written before. """
+        ids: str = ' '.join([f'{id_}' for id_ in prior.get_node_ids()])
+        data: str = ' '.join(prior.write())
+        writer.write(f'{Prior.tag()} {ids} {data}\n')
 
     @classmethod
     def save_path_folder(
@@ -50,7 +104,8 @@ class GraphParser(object):
             name: tp.Optional[str] = None,
             relative_to_root: bool = True,
             add_date: bool = False,
-            should_print: bool = True
+            should_print: bool = True,
+            fixed_ids: tp.Optional[tp.Set[int]] = None
     ) -> None:
 
         # path
@@ -70,7 +125,7 @@ class GraphParser(object):
         file: pathlib.Path = (path / f'{name}.g2o').resolve()
 
         # save
-        cls.save(graph, file, should_print=should_print)
+        cls.save(graph, file, should_print=should_print, fixed_ids=fixed_ids)
 
     @classmethod
     def load(
@@ -82,7 +137,8 @@ class GraphParser(object):
     ) -> 'SubGraph':
         nodes: tp.Dict[int, 'SubNode']
         edges: tp.List['SubEdge']
-        nodes, edges = cls.read_graph(file, should_print=should_print)
+        priors: tp.List['SubPrior']
+        nodes, edges, priors = cls.read_graph(file, should_print=should_print)
 
         graph: 'SubGraph' = Graph()
         # graph.set_path(file)
@@ -112,13 +168,24 @@ class GraphParser(object):
                 node = reference_node.copy_attributes_to(node)
             graph.add_node(node)
 
+        reference_edges: tp.Dict['EdgeKey', tp.Deque[tp.Tuple[int, 'SubEdge']]] = {}
+        if reference is not None:
+            reference_edges = reference.get_edges_by_key()
         for edge in edges_sorted:
             if reference is not None:
-                # copy reference content
-                reference_edge = reference.get_edge_from_ids(*(edge.get_node_ids()))
+                # copy reference content (of the first reference-edge with the same connectivity)
+                candidates: tp.Deque[tp.Tuple[int, 'SubEdge']] = reference_edges[(tuple(edge.get_node_ids()), type(edge))]
+                assert candidates, f'Edge {edge.identifier_class()} is not contained in the reference.'
+                _, reference_edge = candidates.popleft()
                 edge = reference_edge.copy_attributes_to(edge)
             graph.add_edge(edge)
 
+        # priors are not changed by optimisation, such that those of the reference are used (in full precision)
+        if reference is not None:
+            priors = reference.get_priors()
+        for prior in priors:
+            graph.add_prior(prior)
+
         if reference is not None:
             reference.copy_attributes_to(graph)
         return graph
@@ -128,12 +195,13 @@ class GraphParser(object):
             cls,
             file: pathlib.Path,
             should_print: bool = True
-    ) -> tp.Tuple[tp.Dict[int, 'SubNode'], tp.List['SubEdge']]:
+    ) -> tp.Tuple[tp.Dict[int, 'SubNode'], tp.List['SubEdge'], tp.List['SubPrior']]:
         if should_print:
             print(f"framework/GraphParser: Reading:\n    '{file}'")
 
         nodes: tp.Dict[int, 'SubNode'] = {}
         edges: tp.List['SubEdge'] = []
+        priors: tp.List['SubPrior'] = []
 
         lines: tp.List[str] = file.open('r').readlines()
         for i, line in enumerate(lines):
@@ -148,6 +216,9 @@ class GraphParser(object):
                 assert id_ in nodes
                 node: 'SubNode' = nodes[id_]
                 node.fix()
+            elif tag == Prior.tag():
+                count: int = words.index('||') - 1
+                priors.append(Prior.read([nodes[int(id_)] for id_ in words[1: count + 1]], words[count + 1:]))
             else:
                 element_type, count = cls._database.from_tag(tag)
 
@@ -179,4 +250,4 @@ class GraphParser(object):
 
                     # add edge
                     edges.append(edge)
-        return nodes, edges
+        return nodes, edges, priors
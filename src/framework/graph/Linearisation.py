@@ -0,0 +1,181 @@
+import typing as tp
+
+import numpy as np
+from src.framework.math.matrix.BlockCholesky import BlockCholesky
+from src.framework.math.matrix.BlockMatrix import SparseBlockMatrix
+from src.framework.math.matrix.Matrix import Matrix
+from src.framework.math.matrix.vector import VectorFactory
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubGraph, SubEdge, SubNode
+    from src.framework.math.matrix.BlockMatrix import SubSparseBlockMatrix
+    from src.framework.math.matrix.vector import SubSizeVector
+
+SubLinearisation = tp.TypeVar('SubLinearisation', bound='Linearisation')
+Key = tp.Tuple[int, int]
+
+
+class Linearisation(object):
+    """
+    Linearises the edges of a graph around its current estimate and assembles the sparse block Hessian
+    H = sum(J^T Omega J) over the active (i.e., non-fixed) nodes. Marginal covariances are obtained from a single sparse
+    block Cholesky-factorisation of H (see BlockCholesky), such that the (dense) inverse is never formed.
+    """
+
+    _epsilon: float = 1e-6
+    _max_solved: int = 8  # maximum number of nodes of which the marginals are solved for, instead of selected inversion
+    _damping: float = 1e-9  # initial relative diagonal damping if the Hessian is not positive-definite
+    _max_damping: float = 1e-3
+
+    _nodes: tp.List['SubNode']
+    _indices: tp.Dict[int, int]  # node-id to block-index
+    _sizes: np.ndarray
+    _offsets: np.ndarray
+
+    _blocks: tp.Dict[Key, np.ndarray]  # lower-triangular blocks (i >= j)
+    _hessian: tp.Optional['SubSparseBlockMatrix']
+    _factor: tp.Optional[BlockCholesky]
+    _covariances: tp.Optional[tp.List[np.ndarray]]  # diagonal blocks of the inverse Hessian (by block-index)
+
+    def __init__(self, graph: 'SubGraph'):
+        self._nodes = graph.get_active_nodes()
+        self._indices = {node.get_id(): i for i, node in enumerate(self._nodes)}
+        self._sizes = np.array([node.dim() for node in self._nodes], dtype=int)
+        self._offsets = np.concatenate(([0], np.cumsum(self._sizes))).astype(int)
+        self._blocks = self._assemble(graph.get_edges())
+        self._hessian = None
+        self._factor = None
+        self._covariances = None
+
+    # edges
+    @classmethod
+    def edge_jacobian(cls, edge: 'SubEdge') -> tp.List[np.ndarray]:
+        """ Returns the (numerical) Jacobians of the error-vector w.r.t. the active nodes of the edge. """
+        jacobians: tp.List[np.ndarray] = []
+        node: 'SubNode'
+        for node in edge.get_active_nodes():
+            jacobians.append(cls._node_jacobian(edge, node))
+        return jacobians
+
+    @classmethod
+    def edge_hessian(cls, edge: 'SubEdge') -> tp.Dict[Key, np.ndarray]:
+        """ Returns the lower-triangular blocks J_i^T Omega J_j (i >= j) of the active nodes of the edge. """
+        return cls._edge_blocks(cls.edge_jacobian(edge), edge.get_info_matrix().array())
+
+    @classmethod
+    def _node_jacobian(cls, edge: 'SubEdge', node: 'SubNode') -> np.ndarray:
+        # central differences on the manifold: the node is incremented with oplus and restored afterwards, without
+        # triggering the (cached) metrics of nodes and edges
+        value: tp.Any = node.get_value()
+        dim: int = node.dim()
+        jacobian: np.ndarray = np.zeros((edge.dim(), dim))
+        vector_type: tp.Type['SubSizeVector'] = VectorFactory.from_dim(dim)
+        try:
+            for k in range(dim):
+                delta: np.ndarray = np.zeros(dim)
+                delta[k] = cls._epsilon
+                node.data().set_value(value)
+                node.data().set_value(node.data().oplus(vector_type(delta)))
+                error_plus: np.ndarray = edge._compute_error_vector().array().ravel()
+                node.data().set_value(value)
+                node.data().set_value(node.data().oplus(vector_type(-delta)))
+                error_minus: np.ndarray = edge._compute_error_vector().array().ravel()
+                jacobian[:, k] = (error_plus - error_minus) / (2 * cls._epsilon)
+        finally:
+            node.data().set_value(value)
+        return jacobian
+
+    @staticmethod
+    def _edge_blocks(
+            jacobians: tp.List[np.ndarray],
+            info_matrix: np.ndarray
+    ) -> tp.Dict[Key, np.ndarray]:
+        blocks: tp.Dict[Key, np.ndarray] = {}
+        weighted: tp.List[np.ndarray] = [info_matrix @ jacobian for jacobian in jacobians]
+        for i, jacobian_i in enumerate(jacobians):
+            for j in range(i + 1):
+                blocks[i, j] = jacobian_i.transpose() @ weighted[j]
+        return blocks
+
+    # hessian
+    def _assemble(self, edges: tp.List['SubEdge']) -> tp.Dict[Key, np.ndarray]:
+        blocks: tp.Dict[Key, np.ndarray] = {}
+        edge: 'SubEdge'
+        for edge in edges:
+            indices: tp.List[int] = [
+                self._indices[node.get_id()] for node in edge.get_nodes() if node.get_id() in self._indices
+            ]
+            if not indices:
+                continue
+            key: Key
+            block: np.ndarray
+            for key, block in self.edge_hessian(edge).items():
+                a, b = indices[key[0]], indices[key[1]]
+                if a < b:
+                    a, b, block = b, a, block.transpose()
+                if (a, b) in blocks:
+                    blocks[a, b] = blocks[a, b] + block
+                else:
+                    blocks[a, b] = block
+        return blocks
+
+    def get_nodes(self) -> tp.List['SubNode']:
+        return self._nodes
+
+    def get_sizes(self) -> tp.List[int]:
+        return self._sizes.tolist()
+
+    def dim(self) -> int:
+        return int(self._offsets[-1])
+
+    def get_blocks(self) -> tp.Dict[Key, np.ndarray]:
+        """ Returns the non-zero lower-triangular blocks (i >= j) of the Hessian. """
+        return self._blocks
+
+    def get_hessian(self) -> 'SubSparseBlockMatrix':
+        """ Returns the full (symmetric) block Hessian, in which only the non-zero blocks are set. """
+        if self._hessian is None:
+            self._hessian = SparseBlockMatrix(self.get_sizes())
+            for (a, b), block in self._blocks.items():
+                self._hessian[a, b] = Matrix(block)
+                if a != b:
+                    self._hessian[b, a] = Matrix(block.transpose())
+        return self._hessian
+
+    # marginals
+    def factorise(self) -> BlockCholesky:
+        """ Returns the (cached) sparse block Cholesky-factorisation of the Hessian. """
+        damping: float = 0.
+        while self._factor is None:
+            try:
+                self._factor = BlockCholesky(self.get_sizes(), self._blocks, damping=damping)
+            except RuntimeError:
+                # e.g., not anchored, or (rounded) information matrices that are not positive-definite
+                damping = self._damping if damping == 0. else 10 * damping
+                assert damping <= self._max_damping, 'Hessian is not positive-definite.'
+                print(f'framework/Linearisation: Hessian is not positive-definite, applying diagonal damping {damping}')
+        return self._factor
+
+    def marginals(self, nodes: tp.Optional[tp.List['SubNode']] = None) -> tp.List[np.ndarray]:
+        """
+        Returns the marginal covariance (i.e., diagonal block of the inverse Hessian) of each (active) node. A few nodes
+        are solved for with the factor, whereas the marginals of more nodes are obtained (and cached) by selected
+        inversion of the factor.
+        """
+        if nodes is None:
+            nodes = self._nodes
+        indices: tp.List[int] = [self._indices[node.get_id()] for node in nodes]
+        if not indices:
+            return []
+        factor: BlockCholesky = self.factorise()
+        if self._covariances is None and len(indices) > self._max_solved:
+            self._covariances = factor.inverse_diagonal()
+        if self._covariances is not None:
+            return [self._covariances[i] for i in indices]
+
+        marginals: tp.List[np.ndarray] = []
+        for i in indices:
+            size: int = int(self._sizes[i])
+            block: np.ndarray = factor.solve({i: np.eye(size)})[i]
+            marginals.append(0.5 * (block + block.transpose()))
+        return marginals
@@ -0,0 +1,119 @@
+import typing as tp
+
+import numpy as np
+from src.framework.graph.data.DataSE import DataSE2
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubGraph, SubNode
+
+SubPrior = tp.TypeVar('SubPrior', bound='Prior')
+
+
+class Prior(object):
+    """
+    A dense Gaussian prior on a set of nodes, e.g., the information of marginalised nodes (i.e., Schur complement). Its
+    error is the difference of the nodes and their linearisation-points (in the oplus-chart), minus the mean; such that
+    its cost is (delta - mean)^T Omega (delta - mean).
+    """
+
+    _tag: str = 'CONSTRAINT_PRIOR'
+
+    _ids: tp.List[int]
+    _sizes: tp.List[int]
+    _points: np.ndarray  # linearisation-points of the nodes (stacked)
+    _mean: np.ndarray
+    _info_matrix: np.ndarray
+
+    def __init__(
+            self,
+            ids: tp.List[int],
+            sizes: tp.List[int],
+            points: np.ndarray,
+            mean: np.ndarray,
+            info_matrix: np.ndarray
+    ):
+        dim: int = sum(sizes)
+        assert len(ids) == len(sizes)
+        assert points.shape == (dim,) and mean.shape == (dim,) and info_matrix.shape == (dim, dim)
+        self._ids = ids
+        self._sizes = sizes
+        self._points = points
+        self._mean = mean
+        self._info_matrix = info_matrix
+
+    @classmethod
+    def from_nodes(
+            cls,
+            nodes: tp.List['SubNode'],
+            mean: np.ndarray,
+            info_matrix: np.ndarray
+    ) -> 'Prior':
+        """ Creates a prior that is linearised at the current values of <nodes>. """
+        points: np.ndarray = np.concatenate([node.to_vector().array().ravel() for node in nodes])
+        return cls([node.get_id() for node in nodes], [node.dim() for node in nodes], points, mean, info_matrix)
+
+    @classmethod
+    def tag(cls) -> str:
+        return cls._tag
+
+    # properties
+    def get_node_ids(self) -> tp.List[int]:
+        return self._ids
+
+    def get_sizes(self) -> tp.List[int]:
+        return self._sizes
+
+    def dim(self) -> int:
+        return len(self._mean)
+
+    def get_mean(self) -> np.ndarray:
+        return self._mean
+
+    def get_info_matrix(self) -> np.ndarray:
+        return self._info_matrix
+
+    # error
+    def get_nodes(self, graph: 'SubGraph') -> tp.List['SubNode']:
+        return [graph.get_node(id_) for id_ in self._ids]
+
+    def delta(self, nodes: tp.List['SubNode']) -> np.ndarray:
+        """ Returns the (stacked) increments of <nodes> (ordered as the node-ids) w.r.t. the linearisation-points. """
+        deltas: tp.List[np.ndarray] = []
+        offset: int = 0
+        for node, size in zip(nodes, self._sizes):
+            delta: np.ndarray = node.to_vector().array().ravel() - self._points[offset: offset + size]
+            if isinstance(node.data(), DataSE2):
+                delta[2] = np.arctan2(np.sin(delta[2]), np.cos(delta[2]))
+            deltas.append(delta)
+            offset += size
+        return np.concatenate(deltas)
+
+    def error_vector(self, nodes: tp.List['SubNode']) -> np.ndarray:
+        return self.delta(nodes) - self._mean
+
+    def cost(self, graph: 'SubGraph') -> float:
+        error: np.ndarray = self.error_vector(self.get_nodes(graph))
+        return float(error @ self._info_matrix @ error)
+
+    # read/write
+    def write(self) -> tp.List[str]:
+        """ Returns the words after the node-ids, in full precision (since the information can be ill-conditioned). """
+        upper: np.ndarray = self._info_matrix[np.triu_indices(self.dim())]
+        floats: np.ndarray = np.concatenate((self._points, self._mean, upper))
+        return ['||'] + [repr(float(element)) for element in floats]
+
+    @classmethod
+    def read(
+            cls,
+            nodes: tp.List['SubNode'],
+            words: tp.List[str]
+    ) -> 'Prior':
+        assert words[0] == '||', f"Prior should be separated from its node-ids by '||', not '{words[0]}'."
+        sizes: tp.List[int] = [node.dim() for node in nodes]
+        dim: int = sum(sizes)
+        floats: np.ndarray = np.array([float(word) for word in words[1:]])
+        assert len(floats) == 2 * dim + dim * (dim + 1) // 2
+        info_matrix: np.ndarray = np.zeros((dim, dim))
+        info_matrix[np.triu_indices(dim)] = floats[2 * dim:]
+        info_matrix = info_matrix + np.triu(info_matrix, 1).transpose()
+        return cls([node.get_id() for node in nodes], sizes, floats[:dim], floats[dim: 2 * dim], info_matrix)
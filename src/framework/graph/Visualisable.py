@@ -1,9 +1,12 @@
 import typing as tp
 from abc import abstractmethod
 
+import numpy as np
 from src.framework.math.lie.transformation import SE3
 from src.framework.math.matrix.vector import Vector3
-from src.gui.viewer.Rgb import RgbTuple, Rgb
+
+if tp.TYPE_CHECKING:
+    from src.gui.viewer.Rgb import RgbTuple
 
 SubVisualisable = tp.TypeVar('SubVisualisable', bound='Visualisable')
 
@@ -11,7 +14,8 @@ SubVisualisable = tp.TypeVar('SubVisualisable', bound='Visualisable')
 class Visualisable(object):
 
     @staticmethod
-    def draw_rgb() -> RgbTuple:
+    def draw_rgb() -> 'RgbTuple':
+        from src.gui.viewer.Rgb import Rgb
         return Rgb.WHITE
 
 
@@ -21,6 +25,16 @@ class DrawEdge(Visualisable):
     def draw_nodeset(self) -> tp.Tuple[Vector3, Vector3]:
         pass
 
+    @classmethod
+    def draw_nodesets(cls, elements: tp.Sequence['DrawEdge']) -> np.ndarray:
+        """ Returns an (n, 2, 3)-array of the end-points of the elements. """
+        nodesets: np.ndarray = np.zeros((len(elements), 2, 3))
+        for i, element in enumerate(elements):
+            a, b = element.draw_nodeset()
+            nodesets[i, 0, :] = a.array()[:, 0]
+            nodesets[i, 1, :] = b.array()[:, 0]
+        return nodesets
+
 
 class DrawPoint(Visualisable):
 
@@ -28,6 +42,14 @@ class DrawPoint(Visualisable):
     def draw_point(self) -> Vector3:
         pass
 
+    @classmethod
+    def draw_points(cls, elements: tp.Sequence['DrawPoint']) -> np.ndarray:
+        """ Returns an (n, 3)-array of the points of the elements. """
+        points: np.ndarray = np.zeros((len(elements), 3))
+        for i, element in enumerate(elements):
+            points[i, :] = element.draw_point().array()[:, 0]
+        return points
+
 
 class DrawAxis(DrawPoint):
 
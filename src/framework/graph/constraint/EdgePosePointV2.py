@@ -38,7 +38,7 @@ class EdgePosePointV2(EdgeV2):
         spatial_nodes: tp.List['NodeSE2'] = self.get_spatial_nodes()
         a: 'NodeSE2' = spatial_nodes[0]
         b: 'NodeV2' = spatial_nodes[1]
-        return Vector2(b.get_value() - a.get_value().translation())
+        return b.get_value() - a.get_value().translation()
 
     # metrics
     def _compute_rpe_translation2(self) -> tp.Optional[float]:
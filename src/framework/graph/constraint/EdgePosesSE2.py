@@ -1,11 +1,12 @@
 import typing as tp
 
+import numpy as np
 from src.framework.graph.Visualisable import DrawEdge
 from src.framework.graph.constraint.EdgeSE2 import EdgeSE2
 from src.framework.math.lie.transformation import SE2
-from src.gui.viewer.Rgb import RgbTuple, Rgb
 
 if tp.TYPE_CHECKING:
+    from src.gui.viewer.Rgb import RgbTuple
     from src.framework.math.lie.rotation import SO2
     from src.framework.math.matrix.square import SubSquare
     from src.framework.math.matrix.vector import Vector2, Vector3
@@ -59,6 +60,16 @@ class EdgePosesSE2(EdgeSE2, DrawEdge):
         vectors: tp.List['Vector3'] = [node.get_value().translation().to_vector3() for node in self.get_spatial_nodes()]
         return vectors[0], vectors[1]
 
+    @classmethod
+    def draw_nodesets(cls, elements: tp.Sequence['EdgePosesSE2']) -> np.ndarray:
+        nodesets: np.ndarray = np.zeros((len(elements), 2, 3))
+        for i, element in enumerate(elements):
+            a, b = element.get_spatial_nodes()
+            nodesets[i, 0, :2] = a.get_value().translation().array()[:, 0]
+            nodesets[i, 1, :2] = b.get_value().translation().array()[:, 0]
+        return nodesets
+
     @staticmethod
-    def draw_rgb() -> RgbTuple:
+    def draw_rgb() -> 'RgbTuple':
+        from src.gui.viewer.Rgb import Rgb
         return Rgb.ORANGE
@@ -1,3 +1,4 @@
+import contextlib
 import typing as tp
 
 import numpy as np
@@ -6,6 +7,8 @@ from src.framework.math.matrix.square import SubSquare, SquareFactory
 
 class Parser(object):
 
+    _decimals: tp.Optional[int] = 5  # None: full precision
+
     # data to words
     @classmethod
     def symmetric_to_list(cls, matrix: SubSquare) -> tp.List[float]:
@@ -21,11 +24,11 @@ class Parser(object):
     def array_to_list(array: np.ndarray) -> tp.List[float]:
         return list(array.flatten())
 
-    @staticmethod
-    def list_to_words(elements: tp.List[float]) -> tp.List[str]:
+    @classmethod
+    def list_to_words(cls, elements: tp.List[float]) -> tp.List[str]:
         words: tp.List[str] = []
         for element in elements:
-            element = float('{:.5f}'.format(element))
+            element = float(element) if cls._decimals is None else float(f'{element:.{cls._decimals}f}')
             if element.is_integer():
                 word = str(int(element))
             else:
@@ -33,6 +36,17 @@ class Parser(object):
             words.append(word)
         return words
 
+    @classmethod
+    @contextlib.contextmanager
+    def full_precision(cls) -> tp.Iterator[None]:
+        """ Writes words in full precision (e.g., of truth-graphs, of which the cost should remain zero) within. """
+        decimals: tp.Optional[int] = cls._decimals
+        cls._decimals = None
+        try:
+            yield
+        finally:
+            cls._decimals = decimals
+
     # words to data
     @classmethod
     def list_to_symmetric(cls, elements: tp.List[float]) -> SubSquare:
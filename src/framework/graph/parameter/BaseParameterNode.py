@@ -80,6 +80,33 @@ class BaseParameterNode(tp.Generic[T], ParameterNode[T]):
         if self.get_specification() == ParameterSpecification.SCALE:
             return self._compose_as_scale(transformation, is_inverse)
 
+    def compose_transformations(
+            self,
+            transformations: tp.List[SE2],
+            is_inverse: bool = False
+    ) -> tp.List[SE2]:
+        """ Composes a batch of transformations at once (equivalent to compose_transformation of each). """
+        if not transformations:
+            return []
+        elements: np.ndarray = np.array([transformation.translation_angle_list() for transformation in transformations])
+        parameter: np.ndarray = np.array(self.to_vector3().to_list())[np.newaxis, :]
+        specification: ParameterSpecification = self.get_specification()
+        if specification == ParameterSpecification.SCALE:
+            if is_inverse:
+                parameter = np.reciprocal(parameter)
+            composed: np.ndarray = elements * parameter
+        else:
+            if is_inverse:
+                parameter = SE2.inverse_arrays(parameter)
+            if specification == ParameterSpecification.BIAS:
+                composed = SE2.compose_arrays(elements, parameter)
+            else:
+                assert specification == ParameterSpecification.OFFSET
+                composed = SE2.compose_arrays(
+                    SE2.compose_arrays(parameter, elements), SE2.inverse_arrays(parameter)
+                )
+        return [SE2.from_translation_angle_elements(*row) for row in composed.tolist()]
+
     def _compose_as_bias(
             self,
             transformation: SE2,
@@ -1,5 +1,6 @@
 import typing as tp
 
+import numpy as np
 from src.framework.graph.Graph import SpatialNode
 from src.framework.graph.Visualisable import DrawAxis
 from src.framework.math.lie.transformation import SE2
@@ -18,4 +19,11 @@ class NodeSE2(SpatialNode[SE2], DrawAxis):
         return delta[0] ** 2 + delta[1] ** 2
 
     def draw_pose(self) -> 'SE3':
-        return self.get_value().to_se3()
\ No newline at end of file
+        return self.get_value().to_se3()
+
+    @classmethod
+    def draw_points(cls, elements: tp.Sequence['NodeSE2']) -> np.ndarray:
+        points: np.ndarray = np.zeros((len(elements), 3))
+        for i, element in enumerate(elements):
+            points[i, :2] = element.get_value().translation().array()[:, 0]
+        return points
@@ -1,5 +1,6 @@
 import typing as tp
 
+import numpy as np
 from src.framework.graph.Graph import SpatialNode
 from src.framework.graph.Visualisable import DrawPoint
 from src.framework.math.matrix.vector import Vector2
@@ -16,3 +17,10 @@ class NodeV2(SpatialNode[Vector2], DrawPoint):
 
     def draw_point(self) -> 'Vector3':
         return self.get_value().to_vector3()
+
+    @classmethod
+    def draw_points(cls, elements: tp.Sequence['NodeV2']) -> np.ndarray:
+        points: np.ndarray = np.zeros((len(elements), 3))
+        for i, element in enumerate(elements):
+            points[i, :2] = element.get_value().array()[:, 0]
+        return points
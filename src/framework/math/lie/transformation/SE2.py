@@ -1,5 +1,6 @@
 import typing as tp
 
+import numpy as np
 from src.framework.math.lie.rotation.SO2 import SO2
 from src.framework.math.lie.transformation.SE3 import SE3
 from src.framework.math.lie.transformation.SE import SE
@@ -63,6 +64,33 @@ class SE2(SE):
                         algebra[1, 2],
                         algebra[1, 0]])
 
+    # vectorised operations on (n, 3)-arrays of (x, y, angle)-elements
+    @staticmethod
+    def compose_arrays(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """ Returns the element-wise compositions a * b of (n, 3)-arrays of translation-angle elements. """
+        a = np.asarray(a, dtype=float).reshape(-1, 3)
+        b = np.asarray(b, dtype=float).reshape(-1, 3)
+        cos: np.ndarray = np.cos(a[:, 2])
+        sin: np.ndarray = np.sin(a[:, 2])
+        angle: np.ndarray = a[:, 2] + b[:, 2]
+        return np.column_stack([
+            a[:, 0] + cos * b[:, 0] - sin * b[:, 1],
+            a[:, 1] + sin * b[:, 0] + cos * b[:, 1],
+            np.arctan2(np.sin(angle), np.cos(angle))
+        ])
+
+    @staticmethod
+    def inverse_arrays(a: np.ndarray) -> np.ndarray:
+        """ Returns the element-wise inverses of an (n, 3)-array of translation-angle elements. """
+        a = np.asarray(a, dtype=float).reshape(-1, 3)
+        cos: np.ndarray = np.cos(a[:, 2])
+        sin: np.ndarray = np.sin(a[:, 2])
+        return np.column_stack([
+            - cos * a[:, 0] - sin * a[:, 1],
+            sin * a[:, 0] - cos * a[:, 1],
+            - a[:, 2]
+        ])
+
     # alternative creators:
     @classmethod
     def from_translation_angle(
@@ -0,0 +1,169 @@
+import heapq
+import typing as tp
+
+import numpy as np
+
+Key = tp.Tuple[int, int]
+
+
+class BlockCholesky(object):
+    """
+    Sparse block Cholesky-factorisation H = L L^T of a symmetric positive-definite block-matrix, of which the blocks are
+    eliminated in (approximate) minimum-degree order to limit the fill-in of L. Besides solves, the factor gives the
+    blocks of the inverse in its own sparsity pattern (i.e., selected inversion), which include all diagonal blocks.
+    """
+
+    _sizes: tp.List[int]
+    _order: tp.List[int]  # elimination order of the block-indices
+    _positions: np.ndarray  # block-index to position in the elimination order
+    _structure: tp.List[tp.List[int]]  # block-index to the (later eliminated) row block-indices of its column in L
+
+    # factor
+    _inverses: tp.List[np.ndarray]  # inverse of the (lower-triangular) diagonal block L_kk
+    _columns: tp.List[tp.Dict[int, np.ndarray]]  # block-index k to the off-diagonal blocks L_ik of its column
+
+    def __init__(
+            self,
+            sizes: tp.List[int],
+            blocks: tp.Dict[Key, np.ndarray],
+            damping: float = 0.
+    ):
+        """
+        Factorises the symmetric matrix of lower-triangular <blocks> (i >= j), to which a relative diagonal <damping> is
+        added if given. Raises a RuntimeError if the (damped) matrix is not positive-definite.
+        """
+        assert damping >= 0.
+        self._sizes = list(sizes)
+        self._analyse(blocks)
+        self._factorise(blocks, damping)
+
+    def get_order(self) -> tp.List[int]:
+        return self._order
+
+    # symbolic
+    def _analyse(self, blocks: tp.Dict[Key, np.ndarray]) -> None:
+        # minimum-degree elimination on the block-graph, of which the neighbours of an eliminated block become a clique
+        n: int = len(self._sizes)
+        adjacency: tp.List[tp.Set[int]] = [set() for _ in range(n)]
+        for a, b in blocks:
+            if a != b:
+                adjacency[a].add(b)
+                adjacency[b].add(a)
+        heap: tp.List[tp.Tuple[int, int]] = [(len(neighbours), i) for i, neighbours in enumerate(adjacency)]
+        heapq.heapify(heap)
+        is_eliminated: np.ndarray = np.zeros(n, dtype=bool)
+
+        self._order = []
+        self._structure = [[] for _ in range(n)]
+        while heap:
+            degree, k = heapq.heappop(heap)
+            if is_eliminated[k] or degree != len(adjacency[k]):
+                continue  # outdated entry
+            is_eliminated[k] = True
+            self._order.append(k)
+            neighbours: tp.Set[int] = adjacency[k]
+            self._structure[k] = list(neighbours)
+            for i in neighbours:
+                adjacency[i] |= neighbours
+                adjacency[i].discard(i)
+                adjacency[i].discard(k)
+                heapq.heappush(heap, (len(adjacency[i]), i))
+            adjacency[k] = set()
+        self._positions = np.empty(n, dtype=int)
+        self._positions[self._order] = np.arange(n)
+
+    # numeric
+    def _factorise(
+            self,
+            blocks: tp.Dict[Key, np.ndarray],
+            damping: float
+    ) -> None:
+        # right-looking: the (remaining) blocks are updated by each eliminated column, in the filled pattern
+        positions: np.ndarray = self._positions
+        diagonal: tp.Dict[int, np.ndarray] = {}
+        lower: tp.Dict[Key, np.ndarray] = {}  # (i, j) with i eliminated after j
+        for (a, b), block in blocks.items():
+            if a == b:
+                diagonal[a] = block
+            elif positions[a] > positions[b]:
+                lower[a, b] = block
+            else:
+                lower[b, a] = block.transpose()
+        for k, size in enumerate(self._sizes):
+            if k not in diagonal:
+                diagonal[k] = np.zeros((size, size))
+        if damping > 0.:
+            scale: float = max([float(np.abs(np.diag(block)).max(initial=0.)) for block in diagonal.values()] + [1.])
+            diagonal = {k: block + damping * scale * np.eye(len(block)) for k, block in diagonal.items()}
+
+        self._inverses = [np.empty((0, 0))] * len(self._sizes)
+        self._columns = [{} for _ in self._sizes]
+        for k in self._order:
+            try:
+                factor: np.ndarray = np.linalg.cholesky(diagonal.pop(k))
+            except np.linalg.LinAlgError:
+                raise RuntimeError('Matrix is not positive-definite.')
+            inverse: np.ndarray = np.linalg.inv(factor)
+            self._inverses[k] = inverse
+            column: tp.Dict[int, np.ndarray] = {i: lower.pop((i, k)) @ inverse.transpose() for i in self._structure[k]}
+            self._columns[k] = column
+            for i, block_i in column.items():
+                diagonal[i] = diagonal[i] - block_i @ block_i.transpose()
+                for j, block_j in column.items():
+                    if positions[i] > positions[j]:
+                        key: Key = (i, j)
+                        update: np.ndarray = block_i @ block_j.transpose()
+                        lower[key] = lower[key] - update if key in lower else -update
+
+    # solves
+    def solve(self, rhs: tp.Dict[int, np.ndarray]) -> tp.Dict[int, np.ndarray]:
+        """ Solves H X = B for the block-rows of B (default: zero), and returns all block-rows of X. """
+        width: int = next(iter(rhs.values())).shape[1]
+        remainder: tp.Dict[int, np.ndarray] = dict(rhs)
+
+        # forward: L Y = B
+        forward: tp.Dict[int, np.ndarray] = {}
+        for k in self._order:
+            if k not in remainder:
+                forward[k] = np.zeros((self._sizes[k], width))
+                continue
+            forward[k] = self._inverses[k] @ remainder.pop(k)
+            for i, block in self._columns[k].items():
+                update: np.ndarray = block @ forward[k]
+                remainder[i] = remainder[i] - update if i in remainder else -update
+
+        # backward: L^T X = Y
+        solution: tp.Dict[int, np.ndarray] = {}
+        for k in reversed(self._order):
+            value: np.ndarray = forward[k]
+            for i, block in self._columns[k].items():
+                value = value - block.transpose() @ solution[i]
+            solution[k] = self._inverses[k].transpose() @ value
+        return solution
+
+    def inverse_diagonal(self) -> tp.List[np.ndarray]:
+        """
+        Returns the diagonal blocks of the inverse, by selected inversion (i.e., Takahashi's equations): only the blocks
+        of the inverse in the pattern of L are computed, from the last eliminated column to the first.
+        """
+        positions: np.ndarray = self._positions
+        diagonal: tp.List[np.ndarray] = [np.empty((0, 0))] * len(self._sizes)
+        lower: tp.Dict[Key, np.ndarray] = {}  # (i, j) with i eliminated after j
+
+        def get(i: int, j: int) -> np.ndarray:
+            if i == j:
+                return diagonal[i]
+            if positions[i] > positions[j]:
+                return lower[i, j]
+            return lower[j, i].transpose()
+
+        for k in reversed(self._order):
+            inverse: np.ndarray = self._inverses[k]
+            unit: tp.Dict[int, np.ndarray] = {i: block @ inverse for i, block in self._columns[k].items()}
+            for i in unit:
+                lower[i, k] = -sum(get(i, j) @ block for j, block in unit.items())
+            block_k: np.ndarray = inverse.transpose() @ inverse
+            for i, block in unit.items():
+                block_k = block_k - block.transpose() @ lower[i, k]
+            diagonal[k] = 0.5 * (block_k + block_k.transpose())
+        return diagonal
@@ -1,17 +1,33 @@
+import math
 import typing as tp
 
 import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
 from src.framework.math.matrix.Matrix import SubMatrix, Matrix
 
 SubBlockMatrix = tp.TypeVar('SubBlockMatrix', bound='BlockMatrix', covariant=True)
 SubSparseBlockMatrix = tp.TypeVar('SubSparseBlockMatrix', bound='SparseBlockMatrix', covariant=True)
+Key = tp.Tuple[int, int]
 
 
 class BlockMatrix(object):
+    """
+    A matrix of blocks, stored as a dictionary of (set) blocks with precomputed block-offsets. The matrix can be
+    converted to scipy sparse formats, which are used for products and (factorisation-based) solves. Blocks are stored
+    read-only, such that these can only be changed by setting them (which invalidates the cache).
+    """
 
     _row_block_sizes: tp.List[int]
     _column_block_sizes: tp.List[int]
-    _blocks: tp.List[tp.List[tp.Optional[SubMatrix]]]
+    _row_offsets: np.ndarray
+    _column_offsets: np.ndarray
+    _blocks: tp.Dict[Key, SubMatrix]
+
+    # cache
+    _csr: tp.Optional[sparse.csr_matrix]
+    _factor: tp.Optional[sparse_linalg.SuperLU]
+    _factor_damping: float
 
     def __init__(
             self,
@@ -21,25 +37,33 @@ class BlockMatrix(object):
         super().__init__()
         if column_block_sizes is None:
             column_block_sizes = block_sizes
-        self._row_block_sizes = block_sizes
-        self._column_block_sizes = column_block_sizes
-
-        self._blocks = [
-            [None for _ in range(len(self._column_block_sizes))] for __ in range(len(self._row_block_sizes))
-        ]
+        self._row_block_sizes = list(block_sizes)
+        self._column_block_sizes = list(column_block_sizes)
+        self._row_offsets = np.concatenate(([0], np.cumsum(self._row_block_sizes))).astype(int)
+        self._column_offsets = np.concatenate(([0], np.cumsum(self._column_block_sizes))).astype(int)
+        self._blocks = {}
+        self._csr = None
+        self._factor = None
+        self._factor_damping = 0.
 
-    def __setitem__(self, key: tp.Tuple[int, int], block: SubMatrix) -> None:
+    def __setitem__(self, key: Key, block: SubMatrix) -> None:
         assert isinstance(key, tuple)
         a, b = key
         assert block.shape()[0] == self._row_block_sizes[a]
         assert block.shape()[1] == self._column_block_sizes[b]
-        self._blocks[a][b] = block
+        block.array().setflags(write=False)
+        self._blocks[a, b] = block
+        self._csr = None
+        self._factor = None
 
-    def __getitem__(self, key: tp.Tuple[int, int]) -> SubMatrix:
+    def __getitem__(self, key: Key) -> SubMatrix:
         assert isinstance(key, tuple)
-        a, b = key
-        block: tp.Optional[SubMatrix] = self._blocks[a][b]
-        return block
+        if key not in self._blocks:
+            raise KeyError(f'Block {key} is not set.')
+        return self._blocks[key]
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._blocks
 
     def __bool__(self) -> bool:
         return not self.is_empty()
@@ -47,49 +71,115 @@ class BlockMatrix(object):
     def shape(self) -> tp.Tuple[int, int]:
         return len(self._row_block_sizes), len(self._column_block_sizes)
 
+    def dims(self) -> tp.Tuple[int, int]:
+        """ Returns the shape of the (scalar) matrix. """
+        return int(self._row_offsets[-1]), int(self._column_offsets[-1])
+
     def get_row_sizes(self) -> tp.List[int]:
         return self._row_block_sizes
 
     def get_column_sizes(self) -> tp.List[int]:
         return self._column_block_sizes
 
+    def get_row_offset(self, index: int) -> int:
+        return int(self._row_offsets[index])
+
+    def get_column_offset(self, index: int) -> int:
+        return int(self._column_offsets[index])
+
+    def get_keys(self) -> tp.List[Key]:
+        """ Returns the (row, column)-indices of the blocks that have been set. """
+        return list(self._blocks.keys())
+
     def is_empty(self) -> bool:
-        empty: bool = True
-        for i, _ in enumerate(self._row_block_sizes):
-            for j, __ in enumerate(self._column_block_sizes):
-                if self._blocks[i][j] is not None:
-                    empty = False
-                    break
-        return empty
+        return not self._blocks
+
+    # conversion
+    def to_coo(self) -> sparse.coo_matrix:
+        """ Returns the matrix in scipy COO-format, in which blocks that are not set are zero. """
+        rows: tp.List[np.ndarray] = []
+        columns: tp.List[np.ndarray] = []
+        values: tp.List[np.ndarray] = []
+        for (a, b), block in self._blocks.items():
+            row, column = np.meshgrid(
+                np.arange(self._row_offsets[a], self._row_offsets[a + 1]),
+                np.arange(self._column_offsets[b], self._column_offsets[b + 1]),
+                indexing='ij'
+            )
+            rows.append(row.ravel())
+            columns.append(column.ravel())
+            values.append(block.array().ravel())
+        if not values:
+            return sparse.coo_matrix(self.dims())
+        return sparse.coo_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(columns))), shape=self.dims()
+        )
+
+    def to_csr(self) -> sparse.csr_matrix:
+        if self._csr is None:
+            self._csr = self.to_coo().tocsr()
+        return self._csr
+
+    def to_csc(self) -> sparse.csc_matrix:
+        return self.to_csr().tocsc()
+
+    def to_bsr(self) -> sparse.bsr_matrix:
+        """ Returns the matrix in scipy BSR-format, with the largest block-size that divides all block-sizes. """
+        blocksize: tp.Tuple[int, int] = (
+            self._gcd(self._row_block_sizes), self._gcd(self._column_block_sizes)
+        )
+        return self.to_csr().tobsr(blocksize=blocksize)
 
     def array(self) -> np.ndarray:
-        row_size: int = sum(self._row_block_sizes)
-        column_size: int = sum(self._column_block_sizes)
-        array: np.ndarray = np.zeros((row_size, column_size))
-        for i, row in enumerate(self._row_block_sizes):
-            for j, column in enumerate(self._column_block_sizes):
-                row_index = sum(self._row_block_sizes[:i])
-                column_index = sum(self._column_block_sizes[:j])
-                block: SubMatrix = self[i, j]
-                assert block is not None
-                for ii in range(row):
-                    for jj in range(column):
-                        array[row_index + ii, column_index + jj] = block[ii, jj]
-        return array
+        return self.to_coo().toarray()
+
+    def matrix(self) -> SubMatrix:
+        return Matrix(self.array())
 
     def diagonal(self) -> SubBlockMatrix:
-        new: SubBlockMatrix = type(self)(self.get_row_sizes())
+        new: SubBlockMatrix = type(self)(self.get_row_sizes(), self.get_column_sizes())
         min_size: int = min(self.shape())
         for i in range(min_size):
-            new[i, i] = self[i, i]
+            if (i, i) in self._blocks:
+                new[i, i] = self._blocks[i, i]
         return new
 
-    def matrix(self) -> SubMatrix:
-        return Matrix(self.array())
+    # products
+    def dot(self, vector: np.ndarray) -> np.ndarray:
+        """ Returns the product with a (scalar) vector or matrix. """
+        return self.to_csr() @ np.asarray(vector, dtype=float)
+
+    def __matmul__(self, vector: np.ndarray) -> np.ndarray:
+        return self.dot(vector)
+
+    # solves
+    def factorise(self, damping: float = 0.) -> sparse_linalg.SuperLU:
+        """
+        Returns the (cached) sparse LU-factorisation of the (square) matrix, to which a relative diagonal <damping> is
+        added if given. Raises a RuntimeError if the (undamped) matrix is singular.
+        """
+        if self._factor is None or self._factor_damping != damping:
+            assert self.dims()[0] == self.dims()[1]
+            assert damping >= 0.
+            matrix: sparse.csc_matrix = self.to_csc()
+            if damping > 0.:
+                scale: float = max(float(np.abs(matrix.diagonal()).max(initial=0.)), 1.)
+                matrix = (matrix + damping * scale * sparse.identity(self.dims()[0])).tocsc()
+            self._factor = sparse_linalg.splu(matrix, permc_spec='MMD_AT_PLUS_A')
+            self._factor_damping = damping
+        return self._factor
+
+    def solve(
+            self,
+            rhs: np.ndarray,
+            damping: float = 0.
+    ) -> np.ndarray:
+        """ Solves the (square) system for a (scalar) right-hand-side vector or matrix (see factorise). """
+        return self.factorise(damping=damping).solve(np.asarray(rhs, dtype=float))
 
     def inverse(self) -> np.ndarray:
-        array = self.array()
-        return np.linalg.pinv(array)
+        """ Returns the (Moore-Penrose pseudo-)inverse, such that a rank-deficient matrix is inverted in its range. """
+        return np.linalg.pinv(self.array())
 
     @classmethod
     def from_array(
@@ -100,22 +190,59 @@ class BlockMatrix(object):
     ):
         if column_block_sizes is None:
             column_block_sizes = block_sizes
-        assert array.shape == (sum(block_sizes), sum(column_block_sizes))
         matrix = cls(block_sizes, column_block_sizes)
-        for i, row in enumerate(block_sizes):
-            for j, column in enumerate(column_block_sizes):
-                row_index = sum(block_sizes[:i])
-                column_index = sum(column_block_sizes[:j])
-                matrix[i, j] = Matrix(
-                    array[
-                        row_index: row_index + block_sizes[i],
-                        column_index: column_index + column_block_sizes[j]
-                    ]
-                )
+        assert array.shape == matrix.dims()
+        for i in range(len(block_sizes)):
+            for j in range(len(column_block_sizes)):
+                block: np.ndarray = array[
+                    matrix._row_offsets[i]: matrix._row_offsets[i + 1],
+                    matrix._column_offsets[j]: matrix._column_offsets[j + 1]
+                ]
+                if matrix._is_stored(block):
+                    matrix[i, j] = Matrix(block)
         return matrix
 
+    @classmethod
+    def from_sparse(
+            cls,
+            matrix: sparse.spmatrix,
+            block_sizes: tp.List[int],
+            column_block_sizes: tp.Optional[tp.List[int]] = None
+    ):
+        """ Creates a block-matrix from a scipy sparse matrix, in which only blocks with non-zeros are set. """
+        if column_block_sizes is None:
+            column_block_sizes = block_sizes
+        new = cls(block_sizes, column_block_sizes)
+        assert matrix.shape == new.dims()
+        csr: sparse.csr_matrix = sparse.csr_matrix(matrix)
+        csr.eliminate_zeros()
+        coo: sparse.coo_matrix = csr.tocoo()
+        row_blocks: np.ndarray = np.searchsorted(new._row_offsets, coo.row, side='right') - 1
+        column_blocks: np.ndarray = np.searchsorted(new._column_offsets, coo.col, side='right') - 1
+        for a, b in set(zip(row_blocks.tolist(), column_blocks.tolist())):
+            new[a, b] = Matrix(
+                csr[new._row_offsets[a]: new._row_offsets[a + 1], new._column_offsets[b]: new._column_offsets[b + 1]]
+                .toarray()
+            )
+        return new
+
+    # helper-methods
+    @staticmethod
+    def _gcd(sizes: tp.List[int]) -> int:
+        gcd: int = 0
+        for size in sizes:
+            gcd = math.gcd(gcd, size)
+        return max(gcd, 1)
+
+    @staticmethod
+    def _is_stored(block: np.ndarray) -> bool:
+        return True
+
 
 class SparseBlockMatrix(BlockMatrix):
+    """ A block-matrix in which blocks that are not set are zero. """
+
+    _zeros: tp.Dict[tp.Tuple[int, int], SubMatrix]  # shared (read-only) zero-blocks per shape
 
     def __init__(
             self,
@@ -123,11 +250,19 @@ class SparseBlockMatrix(BlockMatrix):
             column_block_sizes: tp.Optional[tp.List[int]] = None
     ):
         super().__init__(block_sizes, column_block_sizes)
+        self._zeros = {}
+
+    def __getitem__(self, key: Key) -> SubMatrix:
+        if key in self:
+            return super().__getitem__(key)
+        a, b = key
+        shape: tp.Tuple[int, int] = (self._row_block_sizes[a], self._column_block_sizes[b])
+        if shape not in self._zeros:
+            zero: SubMatrix = Matrix(np.zeros(shape))
+            zero.array().setflags(write=False)
+            self._zeros[shape] = zero
+        return self._zeros[shape]
 
-    def __getitem__(self, key: tp.Tuple[int, int]) -> SubMatrix:
-        block: tp.Optional[SubMatrix] = super().__getitem__(key)
-        if block is None:
-            a, b = key
-            array: np.ndarray = np.zeros((self._row_block_sizes[a], self._column_block_sizes[b]))
-            block = Matrix(array)
-        return block
+    @staticmethod
+    def _is_stored(block: np.ndarray) -> bool:
+        return bool(block.any())
@@ -0,0 +1,146 @@
+import re
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubGraph, SubNode
+
+SubOptimisationReport = tp.TypeVar('SubOptimisationReport', bound='OptimisationReport')
+
+# verbose g2o-output, e.g.: 'iteration= 0	 chi2= 1234.567	 time= 0.001	 cumTime= 0.001	 edges= 100 ...'
+_number: str = r'([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|[-+]?nan|[-+]?inf)'
+_iteration_pattern: tp.Pattern = re.compile(
+    rf'iteration=\s*(\d+)\s+chi2=\s*{_number}\s+time=\s*{_number}\s+cumTime=\s*{_number}'
+)
+_initial_pattern: tp.Pattern = re.compile(rf'Initial chi2\s*=\s*{_number}')
+
+
+class OptimisationReport(object):
+    """ The problem-size, timings and convergence of a single optimisation (i.e., g2o-solve). """
+
+    _relative_tolerance: float = 1e-3  # relative chi2-decrease below which a solve is considered converged
+
+    # solver
+    solver: str
+    max_iterations: int
+    timestep: tp.Optional[int]
+
+    # problem-size
+    num_nodes: int
+    num_edges: int
+    num_fixed: int
+    dim: int  # free dimension (i.e., of the non-fixed nodes)
+
+    # timings [s]
+    write_time: float
+    process_time: float
+    solve_time: float
+    read_time: float
+
+    # convergence
+    iterations: int
+    initial_chi2: tp.Optional[float]
+    final_chi2: tp.Optional[float]
+    chi2s: tp.List[float]
+    is_success: bool
+
+    def __init__(
+            self,
+            solver: str,
+            max_iterations: int,
+            graph: 'SubGraph'
+    ):
+        self.solver = solver
+        self.max_iterations = max_iterations
+        self.timestep = graph.timestep() if graph.get_nodes() else None
+
+        nodes: tp.List['SubNode'] = graph.get_nodes()
+        self.num_nodes = len(nodes)
+        self.num_edges = len(graph.get_edges())
+        self.num_fixed = 0
+        self.dim = 0
+        for node in nodes:
+            if node.is_fixed():
+                self.num_fixed += 1
+            else:
+                self.dim += node.dim()
+
+        self.write_time = 0.
+        self.process_time = 0.
+        self.solve_time = 0.
+        self.read_time = 0.
+
+        self.iterations = 0
+        self.initial_chi2 = None
+        self.final_chi2 = None
+        self.chi2s = []
+        self.is_success = False
+
+    def parse_output(self, output: str) -> None:
+        """ Reads the iterations, chi2-values and (cumulative) solve-time from the verbose g2o-output. """
+        match: tp.Optional[tp.Match] = _initial_pattern.search(output)
+        if match is not None:
+            self.initial_chi2 = float(match.group(1))
+        for match in _iteration_pattern.finditer(output):
+            self.chi2s.append(float(match.group(2)))
+            self.solve_time = float(match.group(4))
+        self.iterations = len(self.chi2s)
+        if self.chi2s:
+            self.final_chi2 = self.chi2s[-1]
+            if self.initial_chi2 is None:
+                self.initial_chi2 = self.chi2s[0]
+
+    # properties
+    def total_time(self) -> float:
+        return self.write_time + self.process_time + self.read_time
+
+    def overhead_time(self) -> float:
+        """ Returns the time that is not spent on solving (i.e., serialisation, process start-up and parsing). """
+        return self.total_time() - self.solve_time
+
+    def is_converged(self) -> bool:
+        """ Returns whether g2o terminated early or if the chi2 no longer decreased (relatively) in the last iteration. """
+        if not self.is_success or not self.chi2s:
+            return False
+        if self.iterations < self.max_iterations:
+            return True
+        if len(self.chi2s) < 2:
+            return False
+        previous: float = self.chi2s[-2]
+        return abs(previous - self.chi2s[-1]) <= self._relative_tolerance * max(abs(previous), 1e-12)
+
+    def to_dict(self) -> tp.Dict[str, tp.Any]:
+        return {
+            'solver': self.solver, 'timestep': self.timestep,
+            'num_nodes': self.num_nodes, 'num_edges': self.num_edges, 'num_fixed': self.num_fixed, 'dim': self.dim,
+            'write_time': self.write_time, 'process_time': self.process_time, 'solve_time': self.solve_time,
+            'read_time': self.read_time, 'total_time': self.total_time(),
+            'iterations': self.iterations, 'initial_chi2': self.initial_chi2, 'final_chi2': self.final_chi2,
+            'is_success': self.is_success, 'is_converged': self.is_converged()
+        }
+
+    @staticmethod
+    def aggregate(reports: tp.List['SubOptimisationReport']) -> tp.Dict[str, float]:
+        """ Returns the number of solves, their total timings and iterations, and the fraction that converged. """
+        num: int = len(reports)
+        return {
+            'solves': num,
+            'write_time': sum(report.write_time for report in reports),
+            'process_time': sum(report.process_time for report in reports),
+            'solve_time': sum(report.solve_time for report in reports),
+            'read_time': sum(report.read_time for report in reports),
+            'total_time': sum(report.total_time() for report in reports),
+            'iterations': sum(report.iterations for report in reports),
+            'converged': sum(report.is_converged() for report in reports) / num if num else 0.
+        }
+
+    def __repr__(self) -> str:
+        chi2: str = 'n/a'
+        if self.initial_chi2 is not None and self.final_chi2 is not None:
+            chi2 = f'{self.initial_chi2:.3f} -> {self.final_chi2:.3f}'
+        return (
+            f'{self.solver} ({self.num_nodes} nodes, {self.num_edges} edges): '
+            f'{self.iterations} iterations, chi2 {chi2}, {"converged" if self.is_converged() else "not converged"}, '
+            f'{1000 * self.total_time():.1f} ms (write {1000 * self.write_time:.1f}, '
+            f'solve {1000 * self.solve_time:.1f} of process {1000 * self.process_time:.1f}, '
+            f'read {1000 * self.read_time:.1f})'
+        )
@@ -1,13 +1,19 @@
+import shutil
 import subprocess
+import time
 import typing as tp
+import uuid
 from enum import Enum
 from pathlib import Path
 
 from src.definitions import get_project_root
 from src.framework.graph.GraphParser import GraphParser
+from src.framework.optimiser.OptimisationReport import OptimisationReport
+from src.utils.Profiler import profiler, profiled
 
 if tp.TYPE_CHECKING:
     from src.framework.graph.Graph import SubGraph
+    from src.framework.optimiser.SolverSelector import CalibrationTable, SolverSelector
 
 class Library(Enum):
     CHOLMOD = 'CHOLMOD'
@@ -25,6 +31,15 @@ class Solver(Enum):
 
 class Optimiser(object):
 
+    _max_iterations: int = 5  # g2o's default
+    _temp_folder: str = 'graphs/temp'  # (relative to the project-root) in which workspaces are created
+
+    _library: Library
+    _solver: Solver
+    _selector: tp.Optional['SolverSelector']  # selects the library and solver per graph, if set (i.e., auto-mode)
+    _is_speculative: bool
+    _reports: tp.List[OptimisationReport]
+
     solvers = {
         Library.CHOLMOD: {
             Solver.GN: 'gn_var_cholmod',
@@ -59,6 +74,9 @@ class Optimiser(object):
     ):
         self._library = library
         self._solver = solver
+        self._selector = None
+        self._is_speculative = False
+        self._reports = []
 
     # solver
     def set(
@@ -82,6 +100,23 @@ class Optimiser(object):
     def get_solver(self) -> Solver:
         return self._solver
 
+    def set_auto(
+            self,
+            is_auto: bool = True,
+            table: tp.Optional['CalibrationTable'] = None
+    ) -> None:
+        """
+        Sets whether the library and solver are selected per graph from a calibration-table (default: the one produced
+        by 'python -m src.benchmarks.solvers'). The set library and solver are used if no calibration applies.
+        """
+        self._selector = None
+        if is_auto:
+            from src.framework.optimiser.SolverSelector import SolverSelector
+            self._selector = SolverSelector(table=table)
+
+    def is_auto(self) -> bool:
+        return self._selector is not None
+
     @classmethod
     def get_libraries(cls) -> tp.List[Library]:
         return list(cls.solvers.keys())
@@ -101,19 +136,98 @@ class Optimiser(object):
     ) -> str:
         return cls.solvers[library][solver]
 
+    def set_speculative(self, is_speculative: bool = True) -> None:
+        """
+        Sets whether Graph.optimise solves its parameter-fixed fallback concurrently with the actual optimisation
+        (instead of only after the actual solution is rejected).
+        """
+        self._is_speculative = is_speculative
+
+    def is_speculative(self) -> bool:
+        return self._is_speculative
+
+    # reports
+    def get_reports(self) -> tp.List[OptimisationReport]:
+        """ Returns the reports of the optimisations by this instance (e.g., during a simulation-run). """
+        return self._reports
+
+    def clear_reports(self) -> None:
+        self._reports = []
+
+    def add_report(self, report: OptimisationReport) -> None:
+        """ Records the report of a solve that was not recorded by instance_solve (e.g., a speculative one). """
+        self._reports.append(report)
+
+    # workspaces
+    @classmethod
+    def unique_workspace(cls, prefix: str) -> str:
+        """ Returns a new workspace (i.e., temp-folder) in <prefix>, which is not used by any other call. """
+        return f'{prefix}/{uuid.uuid4().hex}'
+
+    @classmethod
+    def remove_workspace(cls, workspace: str) -> None:
+        shutil.rmtree(get_project_root() / cls._temp_folder / workspace, ignore_errors=True)
+
+    @profiled('optimise')
     def instance_optimise(
             self,
             graph,
             should_print: bool = False,
-            compute_marginals: bool = False
+            compute_marginals: bool = False,
+            workspace: tp.Optional[str] = None,
+            fixed_ids: tp.Optional[tp.Set[int]] = None
     ) -> tp.Optional['SubGraph']:
-        return self.optimise(
+        """ Optimises the graph and records the report, which is also attached to the solution. """
+        path_output, report = self.instance_solve(
+            graph,
+            should_print=should_print,
+            compute_marginals=compute_marginals,
+            workspace=workspace,
+            fixed_ids=fixed_ids
+        )
+        return self.instance_read(path_output, graph, report, should_print=should_print)
+
+    def instance_solve(
+            self,
             graph,
-            self._library,
-            self._solver,
+            should_print: bool = False,
+            compute_marginals: bool = False,
+            workspace: tp.Optional[str] = None,
+            fixed_ids: tp.Optional[tp.Set[int]] = None,
+            should_record: bool = True
+    ) -> tp.Tuple[Path, OptimisationReport]:
+        """ Solves the graph with the (selected) library and solver, and records the report if <should_record>. """
+        library: Library = self._library
+        solver: Solver = self._solver
+        if self.is_auto():
+            selection: tp.Optional[tp.Tuple[Library, Solver]] = self._selector.select(graph)
+            if selection is not None:
+                library, solver = selection
+        path_output, report = self.solve(
+            graph,
+            library,
+            solver,
             should_print=should_print,
-            compute_marginals=compute_marginals
+            compute_marginals=compute_marginals,
+            workspace=workspace,
+            fixed_ids=fixed_ids
         )
+        if should_record:
+            self._reports.append(report)
+        return path_output, report
+
+    def instance_read(
+            self,
+            path_output: Path,
+            graph,
+            report: OptimisationReport,
+            should_print: bool = False
+    ) -> tp.Optional['SubGraph']:
+        """ Reads the solution of a solve (if successful) and attaches its report. """
+        solution: tp.Optional['SubGraph'] = self.read_solution(path_output, graph, report, should_print=should_print)
+        if solution is not None:
+            solution.add_report(report)
+        return solution
 
     @classmethod
     def optimise(
@@ -122,38 +236,107 @@ class Optimiser(object):
             library: Library = Library.CHOLMOD,
             solver: Solver = Solver.GN,
             should_print: bool = False,
-            compute_marginals: bool = False
+            compute_marginals: bool = False,
+            workspace: tp.Optional[str] = None
     ) -> tp.Optional['SubGraph']:
+        """ Optimises the graph with g2o; concurrent calls must use distinct workspaces (i.e., temp-folders). """
+        solution, _ = cls.optimise_with_report(
+            graph, library, solver,
+            should_print=should_print, compute_marginals=compute_marginals, workspace=workspace
+        )
+        return solution
+
+    @classmethod
+    @profiled('optimise')
+    def optimise_with_report(
+            cls,
+            graph: 'SubGraph',
+            library: Library = Library.CHOLMOD,
+            solver: Solver = Solver.GN,
+            should_print: bool = False,
+            compute_marginals: bool = False,
+            workspace: tp.Optional[str] = None,
+            fixed_ids: tp.Optional[tp.Set[int]] = None
+    ) -> tp.Tuple[tp.Optional['SubGraph'], OptimisationReport]:
+        """
+        Optimises the graph with g2o and returns the solution (if any) and the report of the optimisation. The nodes with
+        <fixed_ids> are fixed in addition to the fixed nodes of the graph, without modifying the graph.
+        """
+        path_output, report = cls.solve(
+            graph, library, solver,
+            should_print=should_print, compute_marginals=compute_marginals, workspace=workspace, fixed_ids=fixed_ids
+        )
+        return cls.read_solution(path_output, graph, report, should_print=should_print), report
+
+    @classmethod
+    def solve(
+            cls,
+            graph: 'SubGraph',
+            library: Library = Library.CHOLMOD,
+            solver: Solver = Solver.GN,
+            should_print: bool = False,
+            compute_marginals: bool = False,
+            workspace: tp.Optional[str] = None,
+            fixed_ids: tp.Optional[tp.Set[int]] = None
+    ) -> tp.Tuple[Path, OptimisationReport]:
+        """ Writes the graph and runs g2o, without reading the solution; returns the output-path and the report. """
+        solver_string: str = cls.get_solver_string(library, solver)
+        report: OptimisationReport = OptimisationReport(solver_string, cls._max_iterations, graph)
+
         root: Path = get_project_root()
-        relative_to: str = 'graphs/temp'
-        GraphParser.save_path_folder(graph, relative_to, 'before', should_print=should_print)
+        relative_to: str = cls._temp_folder
+        if workspace is not None:
+            relative_to += f'/{workspace}'
+        start: float = time.perf_counter()
+        with profiler.section('optimise.write'):
+            GraphParser.save_path_folder(graph, relative_to, 'before', should_print=should_print, fixed_ids=fixed_ids)
+        report.write_time = time.perf_counter() - start
 
         path_g2o_bin: Path = (root / 'g2o/bin/g2o').resolve()
         path_input: Path = (root / (relative_to + '/before.g2o')).resolve()
         path_output: Path = (root / (relative_to + '/after.g2o')).resolve()
-        path_summary: Path = (root / (relative_to + '/summary.g2o')).resolve()
         path_output.unlink(missing_ok=True)
 
-        solver_string: str = cls.get_solver_string(library, solver)
         commands: tp.List[str] = [
             str(path_g2o_bin),
             '-solver', solver_string,
-            '-o', str(path_output)
+            '-i', str(cls._max_iterations),
+            '-o', str(path_output),
+            '-v'
         ]
-        if should_print:
-            commands.append('-v')
         if compute_marginals:
             commands.append('-computeMarginals')
         commands.append(str(path_input))
 
+        # the (verbose) output is always captured for the report, and only printed if <should_print>
+        start = time.perf_counter()
+        with profiler.section('optimise.solve'):
+            if should_print:
+                print(f"framework/Optimiser: Issuing command '{' '.join(commands)}'")
+            process = subprocess.run(commands, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        report.process_time = time.perf_counter() - start
+        report.parse_output(process.stdout)
+        report.is_success = path_output.exists()
         if should_print:
-            print(f"framework/Optimiser: Issuing command '{' '.join(commands)}'")
-            process = subprocess.run(commands)
-        else:
-            process = subprocess.run(commands, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+            print(process.stdout)
+        return path_output, report
 
-        if path_output.exists():
+    @classmethod
+    def read_solution(
+            cls,
+            path_output: Path,
+            graph: 'SubGraph',
+            report: OptimisationReport,
+            should_print: bool = False
+    ) -> tp.Optional['SubGraph']:
+        """ Reads the solution of a (successful) solve of <graph> and adds the read-time to its report. """
+        if not report.is_success:
+            return None
+        start: float = time.perf_counter()
+        with profiler.section('optimise.read'):
             solution: 'SubGraph' = GraphParser.load(path_output, reference=graph, should_print=should_print)
-            # graph.copy_attributes_to(solution)
-            return solution
-        return None
+        report.read_time = time.perf_counter() - start
+        if should_print:
+            print(f'framework/Optimiser: {report}')
+        # graph.copy_attributes_to(solution)
+        return solution
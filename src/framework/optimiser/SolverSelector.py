@@ -0,0 +1,164 @@
+import json
+import pathlib
+import typing as tp
+
+import numpy as np
+from src.definitions import get_project_root
+from src.framework.graph.Graph import ParameterNode
+from src.framework.graph.spatial.NodeSE2 import NodeSE2
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubGraph, SubNode
+    from src.framework.optimiser.Optimiser import Library, Solver
+
+calibration_path: pathlib.Path = (get_project_root() / 'benchmarks' / 'solver_calibration.json').resolve()
+
+
+class GraphStatistics(object):
+    """ The size and structure of a graph that determine which library and solver are fastest. """
+
+    num_nodes: int
+    num_edges: int
+    dim: int  # free dimension (i.e., of the non-fixed nodes)
+    num_parameters: int
+    parameter_edges: int  # edges that are connected to a parameter-node
+    closures: int  # edges between non-consecutive poses
+
+    def __init__(
+            self,
+            num_nodes: int,
+            num_edges: int,
+            dim: int,
+            num_parameters: int,
+            parameter_edges: int,
+            closures: int
+    ):
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self.dim = dim
+        self.num_parameters = num_parameters
+        self.parameter_edges = parameter_edges
+        self.closures = closures
+
+    @classmethod
+    def from_graph(cls, graph: 'SubGraph') -> 'GraphStatistics':
+        nodes: tp.List['SubNode'] = graph.get_nodes()
+        dim: int = sum(node.dim() for node in nodes if not node.is_fixed())
+        num_parameters: int = sum(isinstance(node, ParameterNode) for node in nodes)
+
+        pose_indices: tp.Dict[int, int] = {}
+        for node in nodes:
+            if isinstance(node, NodeSE2):
+                pose_indices[node.get_id()] = len(pose_indices)
+
+        parameter_edges: int = 0
+        closures: int = 0
+        for edge in graph.get_edges():
+            indices: tp.List[int] = []
+            for node in edge.get_nodes():
+                if isinstance(node, ParameterNode):
+                    parameter_edges += 1
+                    break
+            for node in edge.get_nodes():
+                if node.get_id() in pose_indices:
+                    indices.append(pose_indices[node.get_id()])
+            if len(indices) == 2 and abs(indices[1] - indices[0]) > 1:
+                closures += 1
+        return cls(len(nodes), len(graph.get_edges()), dim, num_parameters, parameter_edges, closures)
+
+    def features(self) -> np.ndarray:
+        """ Returns the (scaled) features of which the distance between graphs is measured. """
+        num_edges: int = max(self.num_edges, 1)
+        return np.array([
+            np.log10(1 + self.dim),
+            self.parameter_edges / num_edges,
+            self.closures / num_edges
+        ])
+
+    def to_dict(self) -> tp.Dict[str, int]:
+        return {
+            'num_nodes': self.num_nodes, 'num_edges': self.num_edges, 'dim': self.dim,
+            'num_parameters': self.num_parameters, 'parameter_edges': self.parameter_edges, 'closures': self.closures
+        }
+
+    @classmethod
+    def from_dict(cls, dict_: tp.Dict[str, int]) -> 'GraphStatistics':
+        return cls(**dict_)
+
+
+class CalibrationTable(object):
+    """ The timings of every library and solver on representative graphs, as measured on this machine. """
+
+    _rows: tp.List[tp.Tuple[GraphStatistics, tp.Dict[str, float]]]  # statistics and timing per solver-string
+    _meta: tp.Dict[str, tp.Any]
+
+    def __init__(self, meta: tp.Optional[tp.Dict[str, tp.Any]] = None):
+        self._rows = []
+        self._meta = {} if meta is None else meta
+
+    def is_empty(self) -> bool:
+        return len(self._rows) == 0
+
+    def add(self, statistics: GraphStatistics, timings: tp.Dict[str, float]) -> None:
+        """ Adds the <timings> (in seconds, infinite if failed) of the solver-strings on a graph of <statistics>. """
+        self._rows.append((statistics, timings))
+
+    def best(self, statistics: GraphStatistics) -> tp.Optional[str]:
+        """ Returns the fastest solver-string on the calibrated graph that is nearest to <statistics>. """
+        if self.is_empty():
+            return None
+        features: np.ndarray = statistics.features()
+        distances: tp.List[float] = [float(np.linalg.norm(row.features() - features)) for row, _ in self._rows]
+        timings: tp.Dict[str, float] = self._rows[int(np.argmin(distances))][1]
+        solver_string: str = min(timings, key=timings.get)
+        if not np.isfinite(timings[solver_string]):
+            return None
+        return solver_string
+
+    # save load
+    def save(self, path: pathlib.Path = calibration_path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rows: tp.List[tp.Dict[str, tp.Any]] = [
+            {'statistics': statistics.to_dict(), 'timings': timings} for statistics, timings in self._rows
+        ]
+        with open(path, 'w') as file:
+            json.dump({'meta': self._meta, 'rows': rows}, file, indent=2)
+
+    @classmethod
+    def load(cls, path: pathlib.Path = calibration_path) -> 'CalibrationTable':
+        assert path.is_file(), f"Calibration-table '{path}' not found; run 'python -m src.benchmarks.solvers'."
+        with open(path, 'r') as file:
+            dict_: tp.Dict[str, tp.Any] = json.load(file)
+        table: CalibrationTable = cls(dict_.get('meta'))
+        for row in dict_['rows']:
+            table.add(GraphStatistics.from_dict(row['statistics']), row['timings'])
+        return table
+
+
+class SolverSelector(object):
+    """ Selects the library and solver for a graph from a calibration-table. """
+
+    _table: CalibrationTable
+    _map: tp.Dict[str, tp.Tuple['Library', 'Solver']]  # solver-string to (library, solver)
+
+    def __init__(self, table: tp.Optional[CalibrationTable] = None):
+        from src.framework.optimiser.Optimiser import Optimiser
+        if table is None:
+            table = CalibrationTable.load() if calibration_path.is_file() else CalibrationTable()
+            if table.is_empty():
+                print('framework/SolverSelector: No calibration-table found; the default solver is used.')
+        self._table = table
+        self._map = {
+            solver_string: (library, solver)
+            for library, solvers in Optimiser.solvers.items() for solver, solver_string in solvers.items()
+        }
+
+    def get_table(self) -> CalibrationTable:
+        return self._table
+
+    def select(self, graph: 'SubGraph') -> tp.Optional[tp.Tuple['Library', 'Solver']]:
+        """ Returns the (library, solver) that was fastest on the most similar calibrated graph, if any. """
+        solver_string: tp.Optional[str] = self._table.best(GraphStatistics.from_graph(graph))
+        if solver_string is None or solver_string not in self._map:
+            return None
+        return self._map[solver_string]
@@ -9,6 +9,7 @@ from src.framework.graph.GraphParser import GraphParser
 from src.framework.simulation.Sensor import SensorFactory
 from src.framework.simulation.Simulation import PlainSimulation, OptimisingSimulation, PostSimulation
 from src.utils import GeoHash2D
+from src.utils.Profiler import profiler, profiled
 
 if tp.TYPE_CHECKING:
     from src.framework.graph.data.DataFactory import Quantity
@@ -42,6 +43,9 @@ class BiSimulation(object):
     _truth_sim: tp.Optional['SubSimulation']
     _estimate_sim: tp.Optional['SubSimulation']
 
+    # callback
+    _step_callback: tp.Optional[tp.Callable[[float], None]]
+
     def __init__(
             self,
             name: tp.Optional[str] = None,
@@ -63,6 +67,8 @@ class BiSimulation(object):
         self._truth_sim = None
         self._estimate_sim = None
 
+        self._step_callback = None
+
         # configure
         self.configure()
 
@@ -79,6 +85,11 @@ class BiSimulation(object):
     def set_optimiser(self, optimiser: 'Optimiser') -> None:
         self._optimiser = optimiser
 
+    # callback
+    def set_step_callback(self, callback: tp.Optional[tp.Callable[[float], None]]) -> None:
+        """ Sets a callback that is called with the timestep after every step (e.g., to report progress or abort). """
+        self._step_callback = callback
+
     # simulations
     def has_simulations(self) -> bool:
         return self._truth_sim is not None and self._estimate_sim is not None
@@ -144,6 +155,7 @@ class BiSimulation(object):
         return self.truth_simulation().get_timestep()
 
     # edges
+    @profiled('add_edge')
     def add_edge(
             self,
             sensor_name: str,
@@ -180,6 +192,7 @@ class BiSimulation(object):
         self.add_edge(sensor_name, [from_id, to_id], transformation)
 
     # odometry
+    @profiled('add_odometry')
     def add_odometry(
             self,
             sensor_name: str,
@@ -215,12 +228,14 @@ class BiSimulation(object):
         transformation: 'SE2' = pose - self.get_current_pose()
         self.add_odometry(sensor_name, transformation)
 
+    @profiled('auto_odometry')
     def auto_odometry(
             self,
             sensor_name: str
     ) -> None:
         assert self.has_path()
-        pose: 'SE2' = self._path.next()
+        with profiler.section('path.next'):
+            pose: 'SE2' = self._path.next()
         self.add_odometry_to(sensor_name, pose)
 
     # gps
@@ -237,6 +252,7 @@ class BiSimulation(object):
         self.add_edge(sensor_name, [current_id], translation)
 
     # loop-closure
+    @profiled('try_closure')
     def try_closure(
             self,
             sensor_name: str,
@@ -266,6 +282,7 @@ class BiSimulation(object):
                 # closure_id: int = self._rng.choice(closures)
                 current_id: int = self.get_current_id()
                 self.add_poses_edge(sensor_name, closure_id, current_id)
+                profiler.count('closures')
                 return True
         return False
 
@@ -408,23 +425,36 @@ class BiSimulation(object):
     # simulation
     def step(self) -> None:
         self.truth_simulation().step()
-        self.estimate_simulation().step()
+        with profiler.section('step'):
+            self.estimate_simulation().step()
         self.print(f'framework/Simulation: Time: {self.timestep():.2f}')
+        if self._step_callback is not None:
+            self._step_callback(self.timestep())
 
     def run(self, should_save: bool = False) -> 'SubGraph':
-        self.reset()
-        self.initialise()
-        self.simulate()
-        print('\nframework/Simulation: Finalising simulation...')
-        self.finalise()
+        if profiler.is_enabled():
+            profiler.begin_run()
+        with profiler.section('run'):
+            self.reset()
+            self.initialise()
+            self.simulate()
+            print('\nframework/Simulation: Finalising simulation...')
+            with profiler.section('finalise'):
+                self.finalise()
 
         if should_save:
             self.save()
+        if profiler.is_enabled():
+            print(profiler.summary(f"framework/Simulation: Profile of '{self._name}'"))
+            trace: tp.Optional[pathlib.Path] = profiler.end_run(self._name)
+            if trace is not None:
+                print(f"framework/Simulation: Trace saved as '{trace}'")
         return self.estimate_simulation().graph()
 
     def monte_carlo(
             self,
-            num: int
+            num: int,
+            callback: tp.Optional[tp.Callable[[int, int], None]] = None
     ) -> tp.List['SubGraph']:
         graphs: tp.List['SubGraph'] = []
         for i in range(num):
@@ -432,6 +462,8 @@ class BiSimulation(object):
             print(f'framework/Simulation: Monte Carlo step {i + 1}/{num}...')
             estimate = self.run()
             graphs.append(estimate)
+            if callback is not None:
+                callback(i + 1, num)
         return graphs
 
     # simulation
@@ -5,6 +5,7 @@ import numpy as np
 from src.framework.graph.parameter.ParameterNodeFactory import ParameterNodeFactory
 from src.framework.graph.parameter.ParameterSpecification import ParameterSpecification
 from src.framework.math.matrix.vector.Vector import Vector
+from src.utils.RingBuffer import RingBuffer
 
 if tp.TYPE_CHECKING:
     from src.framework.graph.Graph import SubEdge, SubParameterNode
@@ -72,6 +73,21 @@ class Parameter(object):
     ) -> 'SE2':
         return self._node.compose_transformation(transformation, is_inverse)
 
+    def retire(self, edges: tp.List['SubEdge']) -> None:
+        """ Disconnects the parameter from <edges> and composes it into their measurements, in a single batch. """
+        node: 'SubParameterNode' = self.node()
+        transformations: tp.List['SE2'] = node.compose_transformations(
+            [edge.to_transformation() for edge in edges], is_inverse=False
+        )
+        for edge, transformation in zip(edges, transformations):
+            edge.remove_node_id(node.get_id())
+            edge.set_from_transformation(transformation)
+        self._sim.update_edges(edges)
+
+    def release(self, edges: tp.List['SubEdge']) -> None:
+        """ Registers that <edges> are about to be marginalised, after which these can no longer change. """
+        pass
+
 
 class StaticParameter(Parameter):
 
@@ -104,6 +120,93 @@ class StaticParameter(Parameter):
             edge.set_from_transformation(node.decompose(edge.to_transformation()))
 
 
+class TrajectoryParameter(StaticParameter):
+    """
+    A time-varying (truth-)parameter that stores its value-trajectory compactly, per timestep, and only creates a new
+    node when its value changes (more than <resolution>). Its value is optionally evaluated lazily from <function>.
+    """
+
+    _initial_capacity: int = 64
+
+    _function: tp.Optional[tp.Callable[[int], 'Quantity']]
+    _resolution: float
+    _timesteps: np.ndarray
+    _values: np.ndarray
+    _size: int
+
+    def __init__(
+            self,
+            simulation: 'SubSimulation',
+            value: 'Quantity',
+            specification: ParameterSpecification,
+            function: tp.Optional[tp.Callable[[int], 'Quantity']] = None,
+            resolution: float = 0.,
+            name: tp.Optional[str] = None,
+            index: int = 0
+    ):
+        super().__init__(
+            simulation,
+            value,
+            specification,
+            name=name,
+            index=index,
+            is_visible=True
+        )
+        assert resolution >= 0.
+        self._function = function
+        self._resolution = resolution
+
+        dim: int = self.node().dim()
+        self._timesteps = np.zeros(self._initial_capacity, dtype=int)
+        self._values = np.zeros((self._initial_capacity, dim))
+        self._size = 0
+        self._record()
+
+    def update(
+            self,
+            value: 'Quantity'
+    ) -> 'SubParameterNode':
+        node: 'SubParameterNode' = self.node()
+        current: np.ndarray = node.get_value().array()
+        if not np.allclose(value.array(), current, rtol=0., atol=self._resolution):
+            node = super().update(value)
+        self._record()
+        return node
+
+    def trajectory(self) -> tp.Tuple[np.ndarray, np.ndarray]:
+        """ Returns the (n,)-timesteps and the corresponding (n, dim)-values (as node-vectors) of the trajectory. """
+        return self._timesteps[:self._size].copy(), self._values[:self._size].copy()
+
+    def value_at(self, timestep: int) -> np.ndarray:
+        """ Returns the value (as node-vector) at <timestep>, i.e., the last value recorded at or before it. """
+        assert self._size > 0
+        i: int = int(np.searchsorted(self._timesteps[:self._size], timestep, side='right')) - 1
+        return self._values[max(i, 0)].copy()
+
+    def add_edge(
+            self,
+            edge: 'SubEdge'
+    ) -> None:
+        if self._function is not None:
+            self.update(self._function(self.simulation().get_timestep()))
+        super().add_edge(edge)
+
+    # helper-methods
+    def _record(self) -> None:
+        """ Records the current value at the current timestep (overwriting a value recorded at the same timestep). """
+        timestep: int = self.simulation().get_timestep()
+        vector: np.ndarray = np.asarray(self.node().to_vector().array(), dtype=float).ravel()
+        if self._size > 0 and self._timesteps[self._size - 1] == timestep:
+            self._values[self._size - 1] = vector
+            return
+        if self._size == len(self._timesteps):
+            self._timesteps = np.concatenate([self._timesteps, np.zeros_like(self._timesteps)])
+            self._values = np.concatenate([self._values, np.zeros_like(self._values)])
+        self._timesteps[self._size] = timestep
+        self._values[self._size] = vector
+        self._size += 1
+
+
 class TimelyBatchParameter(StaticParameter):
     _batch_size: int
     _edge_count: int
@@ -146,10 +249,11 @@ class TimelyBatchParameter(StaticParameter):
 class SlidingParameter(Parameter):
     _window_size: int
 
-    _in: tp.List['SubEdge']
-    _is_closures: tp.List[bool]
+    _in: RingBuffer['SubEdge']
+    _is_closures: RingBuffer[bool]
     _between: tp.List['SubEdge']
     _out: tp.List['SubEdge']
+    _released: tp.Set[int]  # edges in the window (by id(edge)) that are marginalised, and therefore not retired
 
     def __init__(
             self,
@@ -170,10 +274,11 @@ class SlidingParameter(Parameter):
         )
         self._window_size = window_size
 
-        self._in = []
-        self._is_closures = []
+        self._in = RingBuffer['SubEdge'](window_size)
+        self._is_closures = RingBuffer[bool](window_size)
         self._between = []
         self._out = []
+        self._released = set()
 
     def get_window(self) -> int:
         return self._window_size
@@ -188,28 +293,38 @@ class SlidingParameter(Parameter):
         node: 'SubParameterNode' = self.node()
         edge.add_node(node)
 
-        if len(self._in) < self._window_size:
-            self._in.append(edge)  # append <node>
-            self._is_closures.append(False)  # append <is_closure>
-        else:
-            self._between = self._between + self._in[:1]  # push in first element of <_in>
-            self._in = self._in[1:] + [edge]  # push in <node> and push out first element
-            self._is_closures = self._is_closures[1:] + [False]  # push in <is_closure> and push out first element
+        # push in <edge> and <is_closure>; the oldest edge is pushed out (into <_between>) if the window is full
+        expelled: tp.Optional['SubEdge'] = self._in.push(edge)
+        self._is_closures.push(False)
+        if expelled is not None:
+            if id(expelled) in self._released:
+                self._released.remove(id(expelled))
+            else:
+                self._between.append(expelled)
 
         # if any closures are present in the previously connected edges, the window size is reduced to its default value
-        if len(self._is_closures) > 1 and self._is_closures[-2]:
-            for edge_ in self._between:
-                edge_.remove_node_id(node.get_id())
-                edge_.set_from_transformation(node.compose_transformation(edge_.to_transformation(), is_inverse=False))
-                self._out.append(edge_)
+        if len(self._is_closures) > 1 and self._is_closures[-2] and self._between:
+            self.retire(self._between)
+            self._out += self._between
             self._between = []
 
+    def release(self, edges: tp.List['SubEdge']) -> None:
+        # edges that have left the window are retired before, and edges in the window keep the parameter after
+        keys: tp.Set[int] = {id(edge) for edge in edges}
+        retired: tp.List['SubEdge'] = [edge for edge in self._between if id(edge) in keys]
+        if retired:
+            self.retire(retired)
+            self._out += retired
+            self._between = [edge for edge in self._between if id(edge) not in keys]
+        self._released.update(id(edge) for edge in self._in if id(edge) in keys)
+
 
 class OldSlidingParameter(Parameter):
     _window_size: int
 
-    _in: tp.List['SubEdge']
+    _in: RingBuffer['SubEdge']
     _out: tp.List['SubEdge']
+    _released: tp.Set[int]  # edges in the window (by id(edge)) that are marginalised, and therefore not retired
 
     def __init__(
             self,
@@ -230,8 +345,9 @@ class OldSlidingParameter(Parameter):
         )
         self._window_size = window_size
 
-        self._in = []
+        self._in = RingBuffer['SubEdge'](window_size)
         self._out = []
+        self._released = set()
 
     def get_window(self) -> int:
         return self._window_size
@@ -246,9 +362,13 @@ class OldSlidingParameter(Parameter):
         node: 'SubParameterNode' = self.node()
         edge.add_node(node)
 
-        self._in.append(edge)
-        if len(self._in) > self._window_size:
-            first: 'SubEdge' = self._in[0]
-            first.remove_node_id(node.get_id())
-            first.set_from_transformation(node.compose_transformation(first.to_transformation(), is_inverse=False))
-            self._in = self._in[1:]
+        expelled: tp.Optional['SubEdge'] = self._in.push(edge)
+        if expelled is not None:
+            if id(expelled) in self._released:
+                self._released.remove(id(expelled))
+            else:
+                self.retire([expelled])
+
+    def release(self, edges: tp.List['SubEdge']) -> None:
+        keys: tp.Set[int] = {id(edge) for edge in edges}
+        self._released.update(id(edge) for edge in self._in if id(edge) in keys)
@@ -1,3 +1,4 @@
+import os
 import pathlib
 import typing as tp
 from abc import abstractmethod
@@ -6,8 +7,6 @@ import numpy as np
 from src.framework.graph.GraphParser import GraphParser
 from src.framework.graph.spatial.NodeSE2 import NodeSE2
 from src.framework.math.lie.transformation import SE2
-from src.framework.math.matrix.vector import Vector2
-from src.framework.math.matrix.vector import Vector3
 
 if tp.TYPE_CHECKING:
     from src.framework.graph.Graph import SubGraph
@@ -27,6 +26,59 @@ class Path(object):
         pass
 
 
+class PoseCache(object):
+    """
+    A process-wide cache of the (x, y, angle)-poses of g2o-files, keyed by path and modification time. The poses are
+    also stored in a binary '.poses.npy'-file next to the g2o-file, such that later loads are a single memory-mapped read.
+    """
+
+    _cache: tp.Dict[str, tp.Tuple[tp.Tuple[int, int], np.ndarray]] = {}
+
+    @staticmethod
+    def cache_path(path: pathlib.Path) -> pathlib.Path:
+        return path.with_name(f'{path.name}.poses.npy')
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> np.ndarray:
+        """ Returns the (n, 3)-array of NodeSE2-poses in <path>, which is parsed only if not cached. """
+        path = pathlib.Path(path).resolve()
+        stat: os.stat_result = path.stat()
+        stamp: tp.Tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+        key: str = str(path)
+        if key not in cls._cache or cls._cache[key][0] != stamp:
+            cls._cache[key] = (stamp, cls._load(path, stat))
+        return cls._cache[key][1]
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._cache = {}
+
+    @classmethod
+    def _load(cls, path: pathlib.Path, stat: os.stat_result) -> np.ndarray:
+        cache_path: pathlib.Path = cls.cache_path(path)
+        if cache_path.is_file() and cache_path.stat().st_mtime_ns >= stat.st_mtime_ns:
+            try:
+                return np.load(cache_path, mmap_mode='r')
+            except (OSError, ValueError):
+                print(f"framework/PoseCache: Ignoring unreadable cache '{cache_path}'")
+
+        graph: 'SubGraph' = GraphParser.load(path)
+        nodes: tp.List[NodeSE2] = graph.get_of_type(NodeSE2)
+        poses: np.ndarray = np.array(
+            [node.get_value().translation_angle_list() for node in nodes], dtype=float
+        ).reshape(-1, 3)
+
+        # written to a temporary file first, such that concurrent processes never read a partial cache
+        temporary: pathlib.Path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+        try:
+            with open(temporary, 'wb') as file:
+                np.save(file, poses)
+            os.replace(temporary, cache_path)
+        except OSError:
+            print(f"framework/PoseCache: Could not write cache '{cache_path}'")
+        return poses
+
+
 class InputPath(Path):
     _path: tp.Optional[pathlib.Path]
     _poses: tp.Optional[tp.List[SE2]]
@@ -71,21 +123,31 @@ class InputPath(Path):
 
     def load_input_file(self) -> None:
         assert self.has_input_file()
-        self.set_input_graph(GraphParser.load(self._path))
+        self._poses = [SE2.from_translation_angle_elements(*pose) for pose in PoseCache.load(self._path).tolist()]
 
 
 class ManhattanPath(Path):
+    """
+    A random walk on a Manhattan-grid, of which the turns (at block-corners) keep it within a square domain.
+    Poses are generated in chunks (see <generate>) and consumed one at a time by <next>.
+    """
+
+    _chunk_size: int = 256
+
     _block_size: int
     _step_size: float
     _domain: float
     _step_count: int
 
-    _current: SE2
+    _current: np.ndarray  # translation-angle elements of the current (unperturbed) pose
     _seed: int
     _step_rng: np.random.RandomState
     _sidestep_rng: np.random.RandomState
-    _sidesteps_x: tp.List[float]
-    _sidesteps_y: tp.List[float]
+    _sidesteps: np.ndarray  # (<= 3, 2)-array of the most recent sidesteps, from oldest to newest
+    _buffer: np.ndarray  # (n, 3)-array of generated poses, of which those from <_buffer_index> are not yet consumed
+    _buffer_index: int
+    _buffer_state: tp.Optional[tp.Tuple[tp.Any, ...]]  # generator-state before the buffer was generated
+    _transformations: tp.Dict[tp.Tuple[float, float], np.ndarray]
 
     def __init__(
             self,
@@ -96,58 +158,136 @@ class ManhattanPath(Path):
         self._block_size = 4
         self._step_size = 1.
         self._domain = 50.
+        self._transformations = {}
         self.reset()
 
     def reset(self) -> None:
-        self._current = SE2.from_translation_angle_elements(0., 0., 0.)
+        self._current = np.zeros(3)
         self._step_count = 0
+        self._sidesteps = np.zeros((0, 2))
+        self._buffer = np.zeros((0, 3))
+        self._buffer_index = 0
+        self._buffer_state = None
         self.set_rng(self._seed)
-        self._sidesteps_x = []
-        self._sidesteps_y = []
 
     def set_block_size(self, block_size: int) -> None:
+        self._discard_buffer()
         self._block_size = block_size
 
     def set_step_size(self, step_size: float) -> None:
+        self._discard_buffer()
         self._step_size = step_size
 
     def set_domain(self, domain: float) -> None:
+        self._discard_buffer()
         self._domain = domain
 
     def next(self) -> SE2:
-        self._step_count += 1
-        angle: float = 0.
-        if self._step_count == self._block_size:
-            angle = self.generate_new_angle()
-            self._step_count = 0
-
-        transformation: SE2 = SE2.from_translation_angle_elements(self._step_size, 0., angle)
-        new: SE2 = self._current + transformation
-        self._current = new
-        # return new
-        sidestep: np.ndarray = self._sidestep_rng.multivariate_normal(
-            mean=[0, 0], cov=0.16 * np.eye(2)
-        )
-        self._sidesteps_x = [sidestep[0]] + self._sidesteps_x[:3]
-        self._sidesteps_y = [sidestep[1]] + self._sidesteps_y[:3]
-        return new.oplus(Vector3(np.mean(self._sidesteps_x), np.mean(self._sidesteps_y), 0.))
+        if self._buffer_index == len(self._buffer):
+            self._buffer_state = self._get_state()
+            self._buffer = self._generate(self._chunk_size)
+            self._buffer_index = 0
+        pose: np.ndarray = self._buffer[self._buffer_index]
+        self._buffer_index += 1
+        return SE2.from_translation_angle_elements(pose[0], pose[1], pose[2])
+
+    def generate(self, num: int) -> np.ndarray:
+        """ Returns the (num, 3)-array of the next <num> poses, i.e., the poses that <num> calls of <next> return. """
+        buffered: np.ndarray = self._buffer[self._buffer_index:self._buffer_index + num]
+        self._buffer_index += len(buffered)
+        if len(buffered) == num:
+            return buffered.copy()
+        return np.concatenate([buffered, self._generate(num - len(buffered))])
 
     def generate_new_angle(self) -> float:
         angle = np.deg2rad(self._step_rng.choice([90., -90.]))
-        translation: Vector2 = self._current.translation()
-        if np.max(np.abs(translation.array())) > self._domain - self._step_count:
-            proposed: SE2 = self._current + \
-                            SE2.from_translation_angle_elements(self._step_size, 0., angle) + \
-                            SE2.from_translation_angle_elements(self._step_count * self._step_size, 0., 0.)
-            if not self.is_in_domain(proposed):
+        if np.max(np.abs(self._current[:2])) > self._domain - self._step_count:
+            proposed: np.ndarray = self._compose(self._current, self._transformation(self._step_size, angle))
+            proposed = self._compose(proposed, self._transformation(self._step_count * self._step_size, 0.))
+            if not self.is_in_domain(proposed[:2]):
                 angle += np.pi
         return angle
 
-    def is_in_domain(self, pose: SE2) -> bool:
-        translation: Vector2 = pose.translation()
-        return np.max(np.abs(translation.array())) <= self._domain
+    def is_in_domain(self, translation: np.ndarray) -> bool:
+        return np.max(np.abs(translation)) <= self._domain
+
+    # helper-methods
+    def _get_state(self) -> tp.Tuple[tp.Any, ...]:
+        return (
+            self._current, self._step_count, self._sidesteps,
+            self._step_rng.get_state(), self._sidestep_rng.get_state()
+        )
+
+    def _set_state(self, state: tp.Tuple[tp.Any, ...]) -> None:
+        self._current, self._step_count, self._sidesteps, step_state, sidestep_state = state
+        self._step_rng.set_state(step_state)
+        self._sidestep_rng.set_state(sidestep_state)
+
+    def _discard_buffer(self) -> None:
+        """
+        Discards the poses that are generated but not yet consumed, by regenerating only the consumed ones from the state
+        before the buffer, such that a change of configuration takes effect at the next pose (as without buffering).
+        """
+        if self._buffer_index < len(self._buffer):
+            self._set_state(self._buffer_state)
+            if self._buffer_index > 0:
+                self._generate(self._buffer_index)
+        self._buffer = np.zeros((0, 3))
+        self._buffer_index = 0
+        self._buffer_state = None
+
+    def _generate(self, num: int) -> np.ndarray:
+        """ Generates the next <num> poses (as translation-angle elements) and advances the path. """
+        poses: np.ndarray = np.zeros((num, 3))
+
+        # walk: the steps within a block share a transformation, such that only the turns are generated per block
+        straight: np.ndarray = self._transformation(self._step_size, 0.)
+        current: np.ndarray = self._current
+        for i in range(num):
+            self._step_count += 1
+            transformation: np.ndarray = straight
+            if self._step_count == self._block_size:
+                self._current = current
+                angle: float = self.generate_new_angle()
+                self._step_count = 0
+                transformation = self._transformation(self._step_size, angle)
+            current = self._compose(current, transformation)
+            poses[i] = current
+        self._current = current
+
+        # sidesteps: each pose is offset by the mean of (up to) the 4 most recent sidesteps
+        sidesteps: np.ndarray = self._sidestep_rng.multivariate_normal(
+            mean=[0, 0], cov=0.16 * np.eye(2), size=num
+        )
+        history: int = len(self._sidesteps)
+        padded: np.ndarray = np.concatenate([sidesteps[::-1], self._sidesteps[::-1], np.zeros((3 - history, 2))])
+        total: np.ndarray = padded[:num] + padded[1:num + 1]
+        total = total + padded[2:num + 2]
+        total = total + padded[3:num + 3]
+        counts: np.ndarray = np.minimum(np.arange(history + num, history, -1), 4)
+        poses[:, :2] += (total / counts[:, np.newaxis])[::-1]
+        self._sidesteps = np.concatenate([self._sidesteps, sidesteps])[-3:]
+        return poses
+
+    def _transformation(self, x: float, angle: float) -> np.ndarray:
+        """ Returns the (cached) matrix of the transformation of <x> forward and then <angle>. """
+        key: tp.Tuple[float, float] = (x, angle)
+        if key not in self._transformations:
+            self._transformations[key] = SE2.from_translation_angle_elements(x, 0., angle).array()
+        return self._transformations[key]
+
+    @staticmethod
+    def _compose(pose: np.ndarray, transformation: np.ndarray) -> np.ndarray:
+        """ Composes the translation-angle elements <pose> with the matrix <transformation>, as SE2 does. """
+        cos: float = np.cos(pose[2])
+        sin: float = np.sin(pose[2])
+        matrix: np.ndarray = np.array([[cos, -sin, pose[0]],
+                                       [sin, cos, pose[1]],
+                                       [0., 0., 1.]]) @ transformation
+        return np.array([matrix[0, 2], matrix[1, 2], np.arctan2(matrix[1, 0], matrix[0, 0])])
 
     def set_rng(self, seed: tp.Optional[int] = None) -> None:
+        self._discard_buffer()
         self._seed = seed
         self._step_rng = np.random.RandomState(seed)
         self._sidestep_rng = np.random.RandomState(seed)
@@ -2,7 +2,6 @@ import typing as tp
 from abc import abstractmethod
 
 import numpy as np
-from matplotlib import pyplot as plt
 from src.framework.graph.parameter.ParameterNodeFactory import ParameterNodeFactory
 from src.framework.math.matrix.square import SquareFactory
 from src.framework.math.matrix.vector import VectorFactory, Vector2
@@ -48,12 +47,28 @@ SubSpatialBatchAnalyser = tp.TypeVar('SubSpatialBatchAnalyser', bound='SpatialBa
 
 
 class SpatialBatchAnalyser(PostAnalyser):
+    """
+    Batches the edges spatially into <num_batches> parameters by k-means clustering of the edge-centres. Consecutive
+    post-processing steps warm-start the clustering from the previous centroids, reuse the parameter-nodes and only
+    reassign the edges of which the cluster changed.
+    """
+
     _name: str
     _init_value: 'Quantity'
     _specification: 'ParameterSpecification'
     _index: int
     _num_batches: int
+    _should_plot: bool
     _nodes: tp.Optional[tp.List['SubParameterNode']]
+    _labels: np.ndarray  # cluster-label of each (previously clustered) edge
+    _centroids: tp.Optional[np.ndarray]
+
+    # endpoint-index of the edges: (flat) rows of the endpoints of each edge
+    _endpoints: tp.List['SubSpatialNode']
+    _endpoint_rows: tp.Dict[int, int]
+    _rows: tp.List[int]
+    _owners: tp.List[int]
+    _num_indexed: int
 
     def __init__(
             self,
@@ -62,7 +77,8 @@ class SpatialBatchAnalyser(PostAnalyser):
             value: 'Quantity',
             specification: 'ParameterSpecification',
             num_batches: int,
-            index: int = 0
+            index: int = 0,
+            should_plot: bool = False
     ):
         super().__init__(sim)
         self._name = name
@@ -70,69 +86,102 @@ class SpatialBatchAnalyser(PostAnalyser):
         self._specification = specification
         self._index = index
         self._num_batches = num_batches
+        self._should_plot = should_plot
         self._nodes = None
+        self._labels = np.zeros(0, dtype=int)
+        self._centroids = None
 
-    def post_process(self) -> None:
-        if self._nodes is not None:
-            for node in self._nodes:
-                id_: int = node.get_id()
-                self._sim.graph().remove_node_id(id_)
+        self._endpoints = []
+        self._endpoint_rows = {}
+        self._rows = []
+        self._owners = []
+        self._num_indexed = 0
 
-                edges: tp.List['SubEdge'] = self.edges()
-                for edge in edges:
-                    if edge.contains_node_id(id_):
-                        edge.remove_node_id(id_)
+    def set_should_plot(self, should_plot: bool) -> None:
+        self._should_plot = should_plot
 
-        # calculate edge centres
+    # centres
+    def _index_edges(self) -> None:
+        """ Indexes the endpoints of the edges that have been added since the previous call. """
         edges: tp.List['SubEdge'] = self.edges()
-        averages: np.ndarray = np.zeros((2, len(edges)))
-        for i, edge in enumerate(edges):
-            endpoints: tp.List['SubSpatialNode'] = edge.get_spatial_nodes()
-            translations: np.ndarray = np.zeros((2, len(endpoints)))
-            for j, endpoint in enumerate(endpoints):
-                translations[:, j] = endpoint.get_value().translation().array().flatten()
-            averages[:, i] = np.mean(translations, axis=1)
-
-        # perform k-means clustering
+        for i in range(self._num_indexed, len(edges)):
+            for endpoint in edges[i].get_spatial_nodes():
+                id_: int = endpoint.get_id()
+                if id_ not in self._endpoint_rows:
+                    self._endpoint_rows[id_] = len(self._endpoints)
+                    self._endpoints.append(endpoint)
+                self._rows.append(self._endpoint_rows[id_])
+                self._owners.append(i)
+        self._num_indexed = len(edges)
+
+    def edge_centres(self) -> np.ndarray:
+        """ Returns the (n, 2)-array of the mean translation of the endpoints of each edge. """
+        self._index_edges()
+        num_edges: int = self._num_indexed
+        translations: np.ndarray = np.array(
+            [endpoint.get_value().translation().array().ravel() for endpoint in self._endpoints]
+        ).reshape(-1, 2)
+        owners: np.ndarray = np.array(self._owners, dtype=int)
+        sums: np.ndarray = np.zeros((num_edges, 2))
+        np.add.at(sums, owners, translations[np.array(self._rows, dtype=int)])
+        counts: np.ndarray = np.bincount(owners, minlength=num_edges)
+        return sums / counts[:, np.newaxis]
+
+    # clustering
+    def cluster(self, centres: np.ndarray) -> tp.Tuple[np.ndarray, np.ndarray]:
+        """ Returns the cluster-labels of the centres and the centroids, warm-started from the previous centroids. """
         from sklearn.cluster import KMeans
-        k = KMeans(n_clusters=self._num_batches, random_state=0)
-        # k = KMeans(n_clusters=self._num_batches, init='k-means++', max_iter=300, n_init=10, random_state=0)
-        k.fit_predict(averages.transpose())
-
-        # create parameters
-        parameters: tp.List['SubParameterNode'] = []
-        for i in range(self._num_batches):
-            parameter: 'SubParameterNode' = ParameterNodeFactory.from_value(
-                self._name,
-                self._init_value,
-                specification=self._specification,
-                index=self._index
-            )
-            translation: Vector2 = Vector2(k.cluster_centers_[i, :])
-            parameter.set_translation(translation)
-            self._sim.add_node(parameter)
-            parameters.append(parameter)
-        self._nodes = parameters
-
-        # assign parameters
-        # label_dict: tp.Dict[int, int] = {}
-        # label_counter: int = 0
-        for i, edge in enumerate(edges):
-            label: int = k.labels_[i]
-            # if label not in label_dict:
-            #     label_dict[label] = label_counter
-            #     label_counter += 1
-            # index: int = label_dict[label]
-            parameter: 'SubParameterNode' = parameters[label]
-            edge.add_node(parameter)
-
-        centres: np.ndarray = k.cluster_centers_.transpose()
+        k: KMeans
+        if self._centroids is None:
+            k = KMeans(n_clusters=self._num_batches, random_state=0)
+        else:
+            k = KMeans(n_clusters=self._num_batches, init=self._centroids, n_init=1, random_state=0)
+        k.fit(centres)
+        return k.labels_.astype(int), k.cluster_centers_
+
+    def post_process(self) -> None:
+        edges: tp.List['SubEdge'] = self.edges()
+        centres: np.ndarray = self.edge_centres()
+        labels, centroids = self.cluster(centres)
+
+        # create parameters, or move the existing ones (which keep their estimate) to the new centroids
+        if self._nodes is None:
+            self._nodes = []
+            for i in range(self._num_batches):
+                parameter: 'SubParameterNode' = ParameterNodeFactory.from_value(
+                    self._name,
+                    self._init_value,
+                    specification=self._specification,
+                    index=self._index
+                )
+                self._sim.add_node(parameter)
+                self._nodes.append(parameter)
+        parameters: tp.List['SubParameterNode'] = self._nodes
+        for i, parameter in enumerate(parameters):
+            parameter.set_translation(Vector2(centroids[i, :]))
+
+        # (re)assign parameters: only to new edges and to edges of which the label changed, of which the metrics are
+        # deferred until these are next accessed
+        num_previous: int = len(self._labels)
+        changed: np.ndarray = np.flatnonzero(labels[:num_previous] != self._labels)
+        for i in changed.tolist():
+            edges[i].remove_node_id(parameters[self._labels[i]].get_id(), is_deferred=True)
+            edges[i].add_node(parameters[labels[i]], is_deferred=True)
+        for i in range(num_previous, len(edges)):
+            edges[i].add_node(parameters[labels[i]], is_deferred=True)
+        self._labels = labels
+        self._centroids = centroids
+
+        if self._should_plot:
+            self.plot(centres)
+
+    def plot(self, centres: np.ndarray) -> None:
+        from matplotlib import pyplot as plt
         fig, ax = plt.subplots()
-        ax.scatter(averages[0, :], averages[1, :])
-        ax.scatter(centres[0, :], centres[1, :], s=300, c='red', alpha=0.5)
+        ax.scatter(centres[:, 0], centres[:, 1], c=self._labels)
+        ax.scatter(self._centroids[:, 0], self._centroids[:, 1], s=300, c='red', alpha=0.5)
         ax.set_aspect('equal')
         fig.show()
-        print('done')
 
 
 SubVarianceAnalyser = tp.TypeVar('SubVarianceAnalyser', bound='VarianceAnalyser')
@@ -166,6 +215,7 @@ class VectorList(object):
     def plot(self) -> None:
         dim: int = self._dim
         lists: tp.List[tp.List[float]] = self.to_lists()
+        from matplotlib import pyplot as plt
         fig, axes = plt.subplots(dim, 1)
         for i, ax in enumerate(np.array(axes).flatten()):
             ax.plot(lists[i])
@@ -7,6 +7,7 @@ from src.framework.math.lie.transformation import SE2
 from src.framework.math.matrix.square import SquareFactory
 from src.framework.math.matrix.vector import VectorFactory, Vector2, Vector3
 from src.framework.simulation.Parameter import StaticParameter
+from src.utils.Profiler import profiled
 
 if tp.TYPE_CHECKING:
     from src.framework.graph.data import SubData
@@ -66,6 +67,7 @@ class Sensor(tp.Generic[T]):
     def set_rng(self, seed: tp.Optional[int] = None) -> None:
         self._rng = np.random.RandomState(seed)
 
+    @profiled('sensor.noise')
     def generate_noise(self) -> 'SubSizeVector':
         dim: int = self.dim()
         vector_type: tp.Type['SubSizeVector'] = VectorFactory.from_dim(dim)
@@ -1,6 +1,7 @@
 import typing as tp
 from abc import abstractmethod, ABC
 
+from src.framework.graph.FixedLagSmoother import FixedLagSmoother
 from src.framework.graph.GraphManager import GraphManager
 from src.framework.graph.constraint.EdgeFactory import EdgeFactory
 from src.framework.graph.spatial.SpatialNodeFactory import SpatialNodeFactory
@@ -8,7 +9,7 @@ from src.framework.math.lie.transformation import SE2
 from src.framework.optimiser.Optimiser import Optimiser
 from src.framework.simulation.Model import Model
 from src.framework.simulation.Parameter import StaticParameter, TimelyBatchParameter, SlidingParameter, \
-    OldSlidingParameter
+    OldSlidingParameter, TrajectoryParameter
 from src.framework.simulation.PostAnalyser import SpatialBatchAnalyser
 
 if tp.TYPE_CHECKING:
@@ -16,6 +17,7 @@ if tp.TYPE_CHECKING:
     from src.framework.graph.data.DataFactory import Quantity
     from src.framework.graph.parameter.ParameterSpecification import ParameterSpecification
     from src.framework.graph.spatial.NodeSE2 import NodeSE2
+    from src.framework.optimiser.OptimisationReport import OptimisationReport
     from src.framework.simulation.Model import SubModel
     from src.framework.simulation.Parameter import SubParameter
     from src.framework.simulation.PostAnalyser import SubPostAnalyser
@@ -49,6 +51,7 @@ class Simulation(GraphManager):
     def reset(self) -> None:
         super().reset()
         self._model.reset()
+        self._optimiser.clear_reports()
 
         # reset graph
         self._pose_ids = []
@@ -156,6 +159,10 @@ class Simulation(GraphManager):
         assert self.has_optimiser()
         return self._optimiser
 
+    def get_reports(self) -> tp.List['OptimisationReport']:
+        """ Returns the reports of the optimisations during the current run. """
+        return self.get_optimiser().get_reports()
+
     def set_previous(self, previous: 'SubGraph') -> None:
         """ Sets a previous graph. """
         self.graph().set_previous(previous)
@@ -178,6 +185,28 @@ class Simulation(GraphManager):
         )
         return self._model.add_parameter(sensor_name, parameter_name, parameter)
 
+    def add_trajectory_parameter(
+            self,
+            sensor_name: str,
+            parameter_name: str,
+            value: 'Quantity',
+            specification: 'ParameterSpecification',
+            function: tp.Optional[tp.Callable[[int], 'Quantity']] = None,
+            resolution: float = 0.,
+            index: int = 0
+    ) -> 'SubParameterNode':
+        """ Adds a time-varying parameter that only creates a new node when its value changes. """
+        parameter: 'SubParameter' = TrajectoryParameter(
+            self,
+            value,
+            specification,
+            function=function,
+            resolution=resolution,
+            name=parameter_name,
+            index=index
+        )
+        return self._model.add_parameter(sensor_name, parameter_name, parameter)
+
     def update_parameter(
             self,
             sensor_name: str,
@@ -196,6 +225,10 @@ class Simulation(GraphManager):
         """ Registers the addition of a loop closure constraint. """
         pass
 
+    def update_edges(self, edges: tp.List['SubEdge']) -> None:
+        """ Registers the removal of nodes (e.g., retired parameters) from edges that are already added. """
+        pass
+
 
 class PlainSimulation(Simulation):
 
@@ -217,18 +250,57 @@ class PlainSimulation(Simulation):
 class OptimisingSimulation(Simulation, ABC):
     _has_closure: bool  # indicates whether a closure has occurred at this step
     _last_cost: tp.Optional[float]
+    _fixed_lag: tp.Optional[int]  # window of the smoother of the next run
+    _smoother: tp.Optional[FixedLagSmoother]  # bounds the optimisation to a window of poses (if set)
 
     def __init__(self, optimiser: tp.Optional[Optimiser] = None):
+        self._fixed_lag = None
+        self._smoother = None
         super().__init__(optimiser=optimiser)
         self._has_closure = False
         self._last_cost = None
         self.set_timestep(0)
 
     def reset(self) -> None:
+        # the smoother is (re)created before the first pose is added
+        self._smoother = None if self._fixed_lag is None else FixedLagSmoother(self._fixed_lag)
         super().reset()
         self._has_closure = False
         self._last_cost = None
 
+    # fixed-lag
+    def set_fixed_lag(self, window: tp.Optional[int]) -> None:
+        """
+        Optimises only the last <window> poses (or the full graph if None), of which older poses are marginalised and
+        frozen. Edges of sliding parameters that are marginalised either keep (in their window) or have retired (after
+        their window) the parameter. Takes effect at the next reset.
+        """
+        assert window is None or window > 0
+        self._fixed_lag = window
+
+    def get_smoother(self) -> tp.Optional[FixedLagSmoother]:
+        return self._smoother
+
+    def add_node(
+            self,
+            node: 'SubNode',
+            id_: tp.Optional[int] = None
+    ) -> 'SubNode':
+        node = super().add_node(node, id_=id_)
+        if self._smoother is not None:
+            self._smoother.add_node(node)
+        return node
+
+    def add_edge(self, edge: 'SubEdge') -> 'SubEdge':
+        edge = super().add_edge(edge)
+        if self._smoother is not None:
+            self._smoother.add_edge(edge)
+        return edge
+
+    def update_edges(self, edges: tp.List['SubEdge']) -> None:
+        if self._smoother is not None:
+            self._smoother.update_edges(edges)
+
     def add_odometry(
             self,
             sensor_name: str,
@@ -244,6 +316,9 @@ class OptimisingSimulation(Simulation, ABC):
                 parameter.report_closure()
 
     def step(self) -> 'SubGraph':
+        if self._smoother is not None:
+            return self._step_fixed_lag()
+
         graph: 'SubGraph' = self.graph()
         solution: tp.Optional['SubGraph'] = None
         if self._has_closure:
@@ -259,6 +334,33 @@ class OptimisingSimulation(Simulation, ABC):
         self.increment_timestep()
         return solution
 
+    def _step_fixed_lag(self) -> 'SubGraph':
+        """ Optimises the window of the smoother, after which the poses that have left the window are marginalised. """
+        graph: 'SubGraph' = self.graph()
+        solution: tp.Optional['SubGraph'] = None
+        if self._has_closure:
+            cost_threshold: tp.Optional[float] = 0.
+            if self._last_cost is not None:
+                cost_threshold = 2 * self._last_cost
+            solution = self._smoother.window().optimise(self.get_optimiser(), cost_threshold=cost_threshold)
+            if solution is not None:
+                self._last_cost = solution.cost()
+
+        # sliding parameters retire the edges that are marginalised, such that marginalised edges no longer change
+        edges: tp.List['SubEdge'] = self._smoother.get_expelled_edges()
+        for sensor in self.model().get_sensors():
+            for parameter in sensor.get_parameters():
+                parameter.release(edges)
+        self._smoother.marginalise()
+
+        snapshot: 'SubGraph' = self._smoother.snapshot(graph, self.get_timestep())
+        if solution is not None:
+            snapshot.set_reports(solution.get_reports())
+        self.set_previous(snapshot)
+
+        self.increment_timestep()
+        return snapshot
+
     def add_timely_parameter(
             self,
             sensor_name: str,
@@ -350,7 +452,8 @@ class PostSimulation(Simulation):
             value: 'Quantity',
             specification: 'ParameterSpecification',
             num_batches: int,
-            index: int = 0
+            index: int = 0,
+            should_plot: bool = False
     ):
         analyser: 'SubPostAnalyser' = SpatialBatchAnalyser(
             self,
@@ -358,7 +461,8 @@ class PostSimulation(Simulation):
             value,
             specification,
             num_batches,
-            index=index
+            index=index,
+            should_plot=should_plot
         )
         self.add_analyser(sensor_name, analyser)
 
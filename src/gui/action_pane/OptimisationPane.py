@@ -43,8 +43,36 @@ class OptimisationPane(QtWidgets.QWidget):
         self._optimisation_handler.signal_update.connect(self._handle_graph_selection_update)
         layout.addWidget(self._button_optimise)
 
+        # progress
+        self._progress = QtWidgets.QProgressBar(parent=self)
+        self._progress.setVisible(False)
+        layout.addWidget(self._progress)
+
+        self._button_cancel = QtWidgets.QPushButton(parent=self)
+        self._button_cancel.setText('Cancel')
+        self._button_cancel.setEnabled(False)
+        self._button_cancel.clicked.connect(self._optimisation_handler.cancel)
+        layout.addWidget(self._button_cancel)
+
+        self._optimisation_handler.signal_progress.connect(self._handle_progress)
+        self._optimisation_handler.signal_busy.connect(self._handle_busy)
+
     def _handle_graph_selection_update(self, signal: int):
-        self._button_optimise.setEnabled(True if signal == self._optimisation_handler.get_signal_filled() else False)
+        self._update_button_optimise()
+
+    def _update_button_optimise(self) -> None:
+        handler: OptimisationHandler = self._optimisation_handler
+        self._button_optimise.setEnabled(handler.has_graph() and not handler.is_busy())
 
     def _handle_optimise(self):
-        self._optimisation_handler.optimise(should_print=True)
\ No newline at end of file
+        self._optimisation_handler.optimise(should_print=True)
+
+    def _handle_progress(self, done: int, total: int) -> None:
+        self._progress.setMaximum(total)
+        self._progress.setValue(done)
+
+    def _handle_busy(self, is_busy: bool) -> None:
+        self._update_button_optimise()
+        self._button_cancel.setEnabled(is_busy)
+        self._progress.setVisible(is_busy)
+        self._progress.reset()
@@ -3,6 +3,7 @@ import typing as tp
 from src.gui.utils.GroupComboBox import GroupComboBox
 from src.simulation.simulations import simulations
 if tp.TYPE_CHECKING:
+    from src.simulation.simulations import SimulationEntry
     from src.framework.simulation.BiSimulation import SubSimulation
     from src.gui.modules.SimulationHandler import SimulationHandler
     from src.gui.utils.GroupComboBox import GroupItem
@@ -10,7 +11,7 @@ if tp.TYPE_CHECKING:
 
 class SimulationBox(GroupComboBox):
     _sim_handler: 'SimulationHandler'
-    _elements: tp.List[tp.Optional['SubSimulation']]
+    _elements: tp.List[tp.Optional['SimulationEntry']]
 
     # constructor
     def __init__(
@@ -42,13 +43,17 @@ class SimulationBox(GroupComboBox):
             group: 'GroupItem' = self.add_group(section)
             self._elements.append(None)
 
-            for simulation in simulations.simulations(section):
-                group.add_child(simulation.get_name())
-                self._elements.append(simulation)
+            # simulations are only listed by name; they are constructed when selected
+            entry: 'SimulationEntry'
+            for entry in simulations.entries(section):
+                group.add_child(entry.get_name())
+                self._elements.append(entry)
         self.blockSignals(False)
 
     # handlers
     def _handle_index_change(self, index):
         if index >= 0:
-            simulation: 'SubSimulation' = self._elements[index]
-            self._sim_handler.set_simulation(simulation)
+            entry: tp.Optional['SimulationEntry'] = self._elements[index]
+            if entry is not None:
+                simulation: 'SubSimulation' = entry.instantiate()
+                self._sim_handler.set_simulation(simulation)
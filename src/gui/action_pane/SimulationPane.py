@@ -30,17 +30,44 @@ class SimulationPane(QtWidgets.QWidget):
         simulator_box = SimulationBox(self._simulation_handler, parent=self)
         layout.addWidget(LabelPane(simulator_box, 'Choose a simulation:'))
 
-        button_simulate = QtWidgets.QPushButton(self)
-        button_simulate.setText('Simulate graph')
-        button_simulate.clicked.connect(self._simulation_handler.simulate)
-        layout.addWidget(button_simulate)
+        self._button_simulate = QtWidgets.QPushButton(self)
+        self._button_simulate.setText('Simulate graph')
+        self._button_simulate.clicked.connect(self._simulation_handler.simulate)
+        layout.addWidget(self._button_simulate)
 
-        button_mc = QtWidgets.QPushButton(self)
-        button_mc.setText('Monte Carlo simulation')
-        button_mc.clicked.connect(self._handle_mc)
-        layout.addWidget(button_mc)
+        self._button_mc = QtWidgets.QPushButton(self)
+        self._button_mc.setText('Monte Carlo simulation')
+        self._button_mc.clicked.connect(self._handle_mc)
+        layout.addWidget(self._button_mc)
+
+        # progress
+        self._progress = QtWidgets.QProgressBar(self)
+        self._progress.setVisible(False)
+        layout.addWidget(self._progress)
+
+        self._button_cancel = QtWidgets.QPushButton(self)
+        self._button_cancel.setText('Cancel')
+        self._button_cancel.setEnabled(False)
+        self._button_cancel.clicked.connect(self._simulation_handler.cancel)
+        layout.addWidget(self._button_cancel)
+
+        self._simulation_handler.signal_progress.connect(self._handle_progress)
+        self._simulation_handler.signal_busy.connect(self._handle_busy)
 
         layout.addWidget(LabelPane(config, 'Simulation parameters:'))
 
     def _handle_mc(self) -> None:
         return self._simulation_handler.monte_carlo(3)
+
+
+    def _handle_progress(self, done: int, total: int) -> None:
+        # a total of 0 gives a busy-indicator
+        self._progress.setMaximum(total)
+        self._progress.setValue(done if total else 0)
+
+    def _handle_busy(self, is_busy: bool) -> None:
+        self._button_simulate.setEnabled(not is_busy)
+        self._button_mc.setEnabled(not is_busy)
+        self._button_cancel.setEnabled(is_busy)
+        self._progress.setVisible(is_busy)
+        self._progress.reset()
@@ -0,0 +1,323 @@
+import typing as tp
+
+from PyQt5 import QtCore, QtGui
+from src.gui.modules.TreeNode import Toggle
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubElement, SubGraph
+    from src.gui.modules.TreeNode import TopTreeNode, GraphTreeNode, TrajectoryTreeNode
+
+SubBrowserItem = tp.TypeVar('SubBrowserItem', bound='BrowserItem')
+
+
+class BrowserItem(object):
+    """
+    A light-weight row of the browser-model. Children of graphs and element-groups are only created when requested.
+    """
+
+    ROOT: int = 0
+    TRAJECTORY: int = 1
+    GRAPH: int = 2
+    GROUP: int = 3
+    ELEMENT: int = 4
+
+    parent: tp.Optional[SubBrowserItem]
+    level: int
+    obj: tp.Any  # tree-node, element-tree-node (or None) or graph-element
+    row: int
+    children: tp.Optional[tp.List[SubBrowserItem]]  # None if not (yet) fetched
+
+    graph: tp.Optional['SubGraph']  # graph of which the children have been fetched (for graphs and element-groups)
+    name: tp.Optional[str]  # element-name (for element-groups)
+
+    def __init__(
+            self,
+            parent: tp.Optional[SubBrowserItem],
+            level: int,
+            obj: tp.Any = None,
+            row: int = 0,
+            graph: tp.Optional['SubGraph'] = None,
+            name: tp.Optional[str] = None
+    ):
+        self.parent = parent
+        self.level = level
+        self.obj = obj
+        self.row = row
+        self.children = [] if level in (self.ROOT, self.TRAJECTORY) else None
+        self.graph = graph
+        self.name = name
+
+    def is_fetched(self) -> bool:
+        return self.children is not None
+
+    def elements(self) -> tp.List['SubElement']:
+        assert self.level == self.GROUP
+        return self.graph.get_of_name(self.name)
+
+
+class BrowserModel(QtCore.QAbstractItemModel):
+    """
+    A model of the tree of trajectories, graphs, element-groups and graph-elements. Element-rows are created lazily
+    (in batches) when a group is expanded, and graph-rows are inserted/removed incrementally by 'sync'.
+    """
+
+    _tree: 'TopTreeNode'
+    _root: BrowserItem
+    _batch_size: int = 500
+
+    def __init__(
+            self,
+            tree: 'TopTreeNode',
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self._tree = tree
+        self._root = BrowserItem(None, BrowserItem.ROOT)
+
+    # public methods
+    def get_object(self, index: QtCore.QModelIndex) -> tp.Any:
+        if not index.isValid():
+            return None
+        return index.internalPointer().obj
+
+    def sync(self) -> None:
+        """ Inserts and removes only the rows of trajectories and graphs that have been added or removed. """
+        self._sync_children(self._root, self._tree.get_children(), BrowserItem.TRAJECTORY)
+        trajectory_item: BrowserItem
+        for trajectory_item in self._root.children:
+            trajectory_node: 'TrajectoryTreeNode' = trajectory_item.obj
+            self._sync_children(trajectory_item, trajectory_node.get_children(), BrowserItem.GRAPH)
+
+            # graphs that show another timestep (or of which the element-nodes are rebuilt) lose their fetched groups
+            graph_item: BrowserItem
+            for graph_item in trajectory_item.children:
+                if graph_item.is_fetched() and self._is_outdated(graph_item):
+                    self._clear_children(graph_item)
+
+            self._emit_changed(trajectory_item)
+            if trajectory_item.children:
+                self._emit_changed(trajectory_item.children[0], trajectory_item.children[-1])
+
+    def refresh_checks(self) -> None:
+        """ Updates the check-boxes of all rows (that have been created) after a toggle. """
+        self._refresh_checks(self._root)
+
+    # QAbstractItemModel
+    def index(
+            self,
+            row: int,
+            column: int,
+            parent: QtCore.QModelIndex = QtCore.QModelIndex()
+    ) -> QtCore.QModelIndex:
+        item: BrowserItem = self._item(parent)
+        if not item.is_fetched() or not 0 <= row < len(item.children):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, item.children[row])
+
+    def parent(self, index: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        parent: BrowserItem = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QtCore.QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        item: BrowserItem = self._item(parent)
+        return len(item.children) if item.is_fetched() else 0
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 2
+
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        item: BrowserItem = self._item(parent)
+        if item.level == BrowserItem.ELEMENT:
+            return False
+        if item.is_fetched() and not self.canFetchMore(parent):
+            return bool(item.children)
+        return True
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        item: BrowserItem = self._item(parent)
+        if item.level == BrowserItem.GRAPH:
+            return not item.is_fetched()
+        if item.level == BrowserItem.GROUP:
+            return not item.is_fetched() or len(item.children) < len(item.elements())
+        return False
+
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None:
+        item: BrowserItem = self._item(parent)
+        if item.level == BrowserItem.GRAPH:
+            graph: 'SubGraph' = item.obj.get_graph()
+            names: tp.List[str] = graph.get_names()
+            item.graph = graph
+            item.children = []
+            if names:
+                self.beginInsertRows(parent, 0, len(names) - 1)
+                item.children = [
+                    BrowserItem(item, BrowserItem.GROUP, obj=self._element_node(item.obj, name), row=i, graph=graph, name=name)
+                    for i, name in enumerate(names)
+                ]
+                self.endInsertRows()
+        elif item.level == BrowserItem.GROUP:
+            if item.children is None:
+                item.children = []
+            elements: tp.List['SubElement'] = item.elements()
+            first: int = len(item.children)
+            last: int = min(first + self._batch_size, len(elements)) - 1
+            if last >= first:
+                self.beginInsertRows(parent, first, last)
+                item.children += [
+                    BrowserItem(item, BrowserItem.ELEMENT, obj=elements[i], row=i) for i in range(first, last + 1)
+                ]
+                self.endInsertRows()
+
+    def data(
+            self,
+            index: QtCore.QModelIndex,
+            role: int = QtCore.Qt.DisplayRole
+    ) -> tp.Any:
+        if not index.isValid():
+            return None
+        item: BrowserItem = index.internalPointer()
+        column: int = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            return self._text(item, column)
+        if role == QtCore.Qt.CheckStateRole and column == 0 and isinstance(item.obj, Toggle):
+            return QtCore.Qt.Checked if item.obj.is_checked() else QtCore.Qt.Unchecked
+        if role == QtCore.Qt.ForegroundRole and column == 0 and item.level == BrowserItem.GRAPH:
+            return QtGui.QBrush(QtGui.QColor('#00a000' if self._is_truth(item) else '#ff0000'))
+        return None
+
+    def setData(
+            self,
+            index: QtCore.QModelIndex,
+            value: tp.Any,
+            role: int = QtCore.Qt.EditRole
+    ) -> bool:
+        item: BrowserItem = index.internalPointer()
+        if role == QtCore.Qt.CheckStateRole and isinstance(item.obj, Toggle):
+            checked: bool = value == QtCore.Qt.Checked
+            if item.obj.is_checked() != checked:
+                # broadcasts the toggle, which (via 'refresh_checks') updates the check-boxes
+                item.obj.toggle()
+            return True
+        return False
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        flags: QtCore.Qt.ItemFlags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        if index.column() == 0 and isinstance(index.internalPointer().obj, Toggle):
+            flags |= QtCore.Qt.ItemIsUserCheckable
+        return flags
+
+    def headerData(
+            self,
+            section: int,
+            orientation: QtCore.Qt.Orientation,
+            role: int = QtCore.Qt.DisplayRole
+    ) -> tp.Any:
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return ['Object', 'Type'][section]
+        return None
+
+    # helper-methods
+    def _item(self, index: QtCore.QModelIndex) -> BrowserItem:
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def _model_index(self, item: BrowserItem, column: int = 0) -> QtCore.QModelIndex:
+        if item is self._root:
+            return QtCore.QModelIndex()
+        return self.createIndex(item.row, column, item)
+
+    @staticmethod
+    def _element_node(graph_node: 'GraphTreeNode', name: str) -> tp.Optional[Toggle]:
+        if graph_node.has_key(name):
+            return graph_node.get_child(name)
+        return None
+
+    @classmethod
+    def _is_outdated(cls, graph_item: BrowserItem) -> bool:
+        graph_node: 'GraphTreeNode' = graph_item.obj
+        if graph_item.graph is not graph_node.get_graph():
+            return True
+        return any(group.obj is not cls._element_node(graph_node, group.name) for group in graph_item.children)
+
+    @staticmethod
+    def _is_truth(item: BrowserItem) -> bool:
+        trajectory_node: 'TrajectoryTreeNode' = item.parent.obj
+        return trajectory_node.has_truth() and trajectory_node.get_truth() == item.obj.get_graph_container()
+
+    def _text(self, item: BrowserItem, column: int) -> str:
+        if item.level == BrowserItem.TRAJECTORY:
+            return item.obj.get_gui_name() if column == 0 else f'({len(item.obj.get_children())})'
+        if item.level == BrowserItem.GRAPH:
+            if column == 1:
+                return f'({len(item.obj.get_graph().get_names())})'
+            name: str = item.obj.get_gui_name()
+            return f'[truth] {name}' if self._is_truth(item) else name
+        if item.level == BrowserItem.GROUP:
+            if column == 1:
+                return f'({len(item.elements())})'
+            text: str = f"'{item.name}' ({item.graph.get_type_of_name(item.name).__name__})"
+            return text if item.obj is not None else f'—  {text}'
+        element: 'SubElement' = item.obj
+        return f'({element.identifier()})' if column == 0 else f'{type(element).__name__}'
+
+    def _sync_children(
+            self,
+            item: BrowserItem,
+            objects: tp.List[tp.Any],
+            level: int
+    ) -> None:
+        parent: QtCore.QModelIndex = self._model_index(item)
+
+        # remove rows of objects that no longer exist (back-to-front, such that rows remain valid)
+        ids: tp.Set[int] = {id(obj) for obj in objects}
+        for row in reversed(range(len(item.children))):
+            if id(item.children[row].obj) not in ids:
+                self.beginRemoveRows(parent, row, row)
+                del item.children[row]
+                self.endRemoveRows()
+        self._renumber(item)
+
+        # insert rows of new objects
+        for row, obj in enumerate(objects):
+            if row >= len(item.children) or item.children[row].obj is not obj:
+                self.beginInsertRows(parent, row, row)
+                item.children.insert(row, BrowserItem(item, level, obj=obj, row=row))
+                self._renumber(item)
+                self.endInsertRows()
+
+    def _clear_children(self, item: BrowserItem) -> None:
+        if item.children:
+            self.beginRemoveRows(self._model_index(item), 0, len(item.children) - 1)
+            item.children = None
+            self.endRemoveRows()
+        else:
+            item.children = None
+        item.graph = None
+
+    @staticmethod
+    def _renumber(item: BrowserItem) -> None:
+        for row, child in enumerate(item.children):
+            child.row = row
+
+    def _emit_changed(self, first: BrowserItem, last: tp.Optional[BrowserItem] = None) -> None:
+        if last is None:
+            last = first
+        self.dataChanged.emit(self._model_index(first, 0), self._model_index(last, 1))
+
+    def _refresh_checks(self, item: BrowserItem) -> None:
+        if not item.children or item.level == BrowserItem.GROUP:
+            return
+        self.dataChanged.emit(
+            self._model_index(item.children[0]), self._model_index(item.children[-1]), [QtCore.Qt.CheckStateRole]
+        )
+        for child in item.children:
+            self._refresh_checks(child)
@@ -1,10 +1,11 @@
 import functools
 import typing as tp
 
-from PyQt5 import QtCore, QtWidgets, QtGui
-from src.framework.graph.Graph import Node, Edge, SubElement
+from PyQt5 import QtCore, QtWidgets
+from src.framework.graph.Graph import Node, Edge
 from src.framework.graph.Visualisable import Visualisable, DrawPoint, DrawEdge
-from src.gui.modules.TreeNode import GraphTreeNode, TrajectoryTreeNode, Toggle
+from src.gui.info_pane.BrowserModel import BrowserModel
+from src.gui.modules.TreeNode import GraphTreeNode, TrajectoryTreeNode
 from src.gui.utils.PopUp import PopUp
 
 if tp.TYPE_CHECKING:
@@ -14,13 +15,14 @@ if tp.TYPE_CHECKING:
     from src.framework.graph.Visualisable import SubVisualisable
     from src.gui.info_pane.InspectorTree import InspectorTree
     from src.gui.info_pane.TimestepBox import TimestepBox
-    from src.gui.modules.TreeNode import SubTreeNode, SubToggle, TopTreeNode, ElementTreeNode
+    from src.gui.modules.TreeNode import SubTreeNode, TopTreeNode
     from src.gui.viewer.Viewer import Viewer
 
 
-class BrowserTree(QtWidgets.QTreeWidget):
+class BrowserTree(QtWidgets.QTreeView):
 
     _tree: 'TopTreeNode'
+    _model: BrowserModel
     _inspector: 'InspectorTree'
     _timestep_box: 'TimestepBox'
     _viewer: 'Viewer'
@@ -40,17 +42,18 @@ class BrowserTree(QtWidgets.QTreeWidget):
         self._timestep_box = timestep_box
         self._viewer = viewer
 
+        # model
+        self._model = BrowserModel(tree, parent=self)
+        self.setModel(self._model)
+        self._model.rowsInserted.connect(self._handle_rows_inserted)
+
         # formatting
-        self.headerItem().setText(0, 'Object')
-        self.headerItem().setText(1, 'Type')
         self.setColumnWidth(0, 300)
         self.setAlternatingRowColors(True)
+        self.setUniformRowHeights(True)
 
         # selection
-        self.itemSelectionChanged.connect(self._handle_selection)
-
-        # checking
-        self.itemChanged.connect(self._handle_checked)
+        self.selectionModel().currentChanged.connect(self._handle_selection)
 
         # context menus
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
@@ -59,119 +62,28 @@ class BrowserTree(QtWidgets.QTreeWidget):
         # update
         self._tree.signal_update.connect(self._handle_signal)
 
-    def _construct_browser(self):
-        self.clear()
-
-        trajectory_node: TrajectoryTreeNode
-        for trajectory_node in self._tree.get_children():
-
-            # trajectory-container
-            graph_nodes: tp.List[GraphTreeNode] = trajectory_node.get_children()
-            trajectory_item: QtWidgets.QTreeWidgetItem = self._construct_tree_item(
-                trajectory_node.get_gui_name(),
-                f'({len(graph_nodes)})',
-                None
-            )
-            trajectory_item.setCheckState(
-                0, QtCore.Qt.Checked if trajectory_node.is_checked() else QtCore.Qt.Unchecked
-            )
-            trajectory_item.obj = trajectory_node
-            self.addTopLevelItem(trajectory_item)
-            trajectory_item.setExpanded(True)
-
-            graph_node: GraphTreeNode
-            for graph_node in graph_nodes:
-
-                # graph-container
-                graph: 'SubGraph' = graph_node.get_graph()
-                is_truth: bool = trajectory_node.has_truth() and trajectory_node.get_truth() == graph_node.get_graph_container()
-                name: str = graph_node.get_gui_name()
-                if is_truth:
-                    name = f'[truth] {name}'
-
-                names: tp.List[str] = graph.get_names()
-                graph_item: QtWidgets.QTreeWidgetItem = self._construct_tree_item(
-                    name,
-                    f'({len(names)})',
-                    trajectory_item
-                )
-
-                if is_truth:
-                    graph_item.setForeground(0, QtGui.QBrush(QtGui.QColor("#00a000")))
-                else:
-                    graph_item.setForeground(0, QtGui.QBrush(QtGui.QColor("#ff0000")))
-
-                # graph-container: checkbox
-                graph_item.setCheckState(
-                    0, QtCore.Qt.Checked if graph_node.is_checked() else QtCore.Qt.Unchecked
-                )
-                graph_item.obj = graph_node
-
-                name: str
-                for name in names:
-
-                    # elements-container
-                    elements: tp.List[SubElement] = graph.get_of_name(name)
-                    elements_item: QtWidgets.QTreeWidgetItem = self._construct_tree_item(
-                        f"'{name}' ({graph.get_type_of_name(name).__name__})",
-                        f'({len(elements)})',
-                        graph_item
-                    )
-
-                    # elements-container: checkbox
-                    if graph_node.has_key(name):
-                        elements_node: 'ElementTreeNode' = graph_node.get_child(name)
-                        elements_item.setCheckState(
-                            0, QtCore.Qt.Checked if elements_node.is_checked() else QtCore.Qt.Unchecked
-                        )
-                        elements_item.obj = elements_node
-                    else:
-                        text: str = elements_item.text(0)
-                        elements_item.setText(0, "{}  {}".format(u'\u2014', text))
-
-                    for element in elements:
-
-                        # element
-                        element_item = self._construct_tree_item(
-                            f'({element.identifier()})',
-                            f'{type(element).__name__}',
-                            elements_item
-                        )
-                        element_item.obj = element
-
-    def _update_browser(self):
-        for i in range(self.topLevelItemCount()):
-            graph_item: QtWidgets.QTreeWidgetItem = self.topLevelItem(i)
-            if hasattr(graph_item, 'obj'):
-                graph_container: GraphTreeNode = graph_item.obj
-                graph_item.setCheckState(
-                    0, QtCore.Qt.Checked if graph_container.is_checked() else QtCore.Qt.Unchecked
-                )
-                for j in range(graph_item.childCount()):
-                    element_item: QtWidgets.QTreeWidgetItem = graph_item.child(j)
-                    if hasattr(element_item, 'obj'):
-                        element_container: 'ElementTreeNode' = element_item.obj
-                        element_item.setCheckState(
-                            0, QtCore.Qt.Checked if element_container.is_checked() else QtCore.Qt.Unchecked
-                        )
-
     # handlers
     def _handle_signal(self, signal: int):
         if signal > 0:
             # tree contents have been changed (i.e., a graph added or removed)
-            self._construct_browser()
+            self._model.sync()
         elif signal == 0:
-            self._construct_browser()
+            self._model.sync()
             self._inspector.clear()
             self._timestep_box.clear()
         else:
             # element has been toggled
-            self._update_browser()
+            self._model.refresh_checks()
 
-    def _handle_selection(self):
-        item = self.currentItem()
-        if hasattr(item, 'obj'):
-            obj: tp.Union['SubTreeNode', SubVisualisable] = item.obj
+    def _handle_rows_inserted(self, parent: QtCore.QModelIndex, first: int, last: int):
+        # trajectories are expanded when added
+        if not parent.isValid():
+            for row in range(first, last + 1):
+                self.setExpanded(self._model.index(row, 0, parent), True)
+
+    def _handle_selection(self, current: QtCore.QModelIndex, *_):
+        obj: tp.Union['SubTreeNode', 'SubVisualisable', None] = self._model.get_object(current)
+        if obj is not None:
             if isinstance(obj, GraphTreeNode):
                 self._inspector.display_graph(obj.get_graph())
                 self._timestep_box.set_node(obj)
@@ -370,9 +282,8 @@ class BrowserTree(QtWidgets.QTreeWidget):
     def _handle_context_menu(self, point):
         index = self.indexAt(point)
         if index.isValid():
-            item = self.itemAt(point)
-            if hasattr(item, 'obj'):
-                obj: tp.Union['SubTreeNode', SubVisualisable] = item.obj
+            obj: tp.Union['SubTreeNode', 'SubVisualisable', None] = self._model.get_object(index)
+            if obj is not None:
 
                 # if graph
                 if isinstance(obj, TrajectoryTreeNode):
@@ -392,30 +303,3 @@ class BrowserTree(QtWidgets.QTreeWidget):
                             self._viewer.focus(obj.draw_point())
                         elif isinstance(obj, DrawEdge):
                             self._viewer.focus(obj.draw_nodeset()[0])
-
-    def _handle_checked(self, item: QtWidgets.QTreeWidgetItem, column: int):
-        """
-        Handler for checking checkboxes. Checking checkboxes is done via:
-        - widget interaction by user
-        - setCheckState, which is called from '_construct_browser' and '_update_browser' (via handling of
-          self._container.signal_update)
-        """
-        checked: bool = item.checkState(column) == QtCore.Qt.Checked
-        if hasattr(item, 'obj') and isinstance(item.obj, Toggle):
-            toggle: 'SubToggle' = item.obj
-
-            # check if by checked by user:
-            if toggle.is_checked() != checked:
-                toggle.toggle()
-
-    # helper-methods
-    @staticmethod
-    def _construct_tree_item(
-            object_string: str,
-            type_string: str,
-            root: tp.Optional[tp.Union[QtWidgets.QTreeWidget, QtWidgets.QTreeWidgetItem]]
-    ):
-        item = QtWidgets.QTreeWidgetItem(root)
-        item.setText(0, object_string)
-        item.setText(1, type_string)
-        return item
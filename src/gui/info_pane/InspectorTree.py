@@ -3,6 +3,7 @@ import typing as tp
 
 from PyQt5 import QtGui, QtWidgets
 from src.framework.graph.Graph import SubGraph, Graph, SubEdge, SubNode, SubElement, Node, SpatialNode, ParameterNode
+from src.framework.graph.Linearisation import Linearisation
 from src.framework.graph.data.DataFactory import Quantity
 from src.framework.math.Dimensional import Dimensional
 from src.framework.math.lie.Lie import Lie
@@ -10,7 +11,7 @@ from src.framework.math.lie.rotation.SO import SO
 from src.framework.math.lie.transformation import SE2
 from src.framework.math.lie.transformation.SE import SE
 from src.framework.math.matrix.BlockMatrix import SubBlockMatrix
-from src.framework.math.matrix.Matrix import SubMatrix
+from src.framework.math.matrix.Matrix import SubMatrix, Matrix
 
 Item = tp.Union[QtWidgets.QTreeWidget, QtWidgets.QTreeWidgetItem]
 
@@ -19,11 +20,13 @@ class Indicator(enum.Enum):
     HESSIAN: int = 0
     MARGINAL: int = 1
     TRUE: int = 2
+    MARGINAL_NODE: int = 3
 
 
 class InspectorTree(QtWidgets.QTreeWidget):
 
     obj: tp.Optional[tp.Union[SubGraph, SubNode, SubEdge]]
+    _linearisation: tp.Optional[Linearisation]  # of the displayed graph, once its Hessian or marginals are requested
 
     # constructor
     def __init__(self, *args, **kwargs):
@@ -35,6 +38,7 @@ class InspectorTree(QtWidgets.QTreeWidget):
         self.itemSelectionChanged.connect(self.handle_expand)
 
         self.obj = None
+        self._linearisation = None
 
     # graph
     def display_graph(
@@ -43,6 +47,7 @@ class InspectorTree(QtWidgets.QTreeWidget):
     ):
         self.clear()
         self.obj = graph
+        self._linearisation = None
         self._construct_graph_tree(graph, self.invisibleRootItem())
 
     def _construct_graph_tree(
@@ -95,28 +100,35 @@ class InspectorTree(QtWidgets.QTreeWidget):
 
     def _construct_hessian(self, item: QtWidgets.QTreeWidgetItem, graph: SubGraph) -> None:
         active_nodes: tp.List[SubNode] = graph.get_active_nodes()
-        hessian: SubBlockMatrix = graph.get_hessian()
+        hessian: SubBlockMatrix = self._get_linearisation(graph).get_hessian()
         item.setText(1, str(hessian.shape()))
-        for i, node_i in enumerate(active_nodes):
-            for j, node_j in enumerate(active_nodes):
-                if j <= i and not hessian[i, j].is_zero():
-                    self._construct_tree_property_from_value(
-                        item,
-                        f'({node_i.get_id()}, {node_j.get_id()})',
-                        hessian[i, j]
-                    )
+        # only the (lower-triangular) blocks that are set are displayed
+        for i, j in sorted(key for key in hessian.get_keys() if key[1] <= key[0]):
+            self._construct_tree_property_from_value(
+                item,
+                f'({active_nodes[i].get_id()}, {active_nodes[j].get_id()})',
+                hessian[i, j]
+            )
 
     def _construct_marginal(self, item: QtWidgets.QTreeWidgetItem, graph: SubGraph) -> None:
+        # the marginal of a node is only computed once its item is selected
         nodes: tp.List[SubNode] = graph.get_active_nodes()
-        marginals: tp.List[SubMatrix] = graph.get_marginals()
-        item.setText(1, f'({len(marginals)})')
-        for i, node in enumerate(nodes):
+        item.setText(1, f'({len(nodes)})')
+        for node in nodes:
             id_: int = node.get_id()
-            self._construct_tree_property_from_value(
-                item,
-                f'({id_}, {id_})',
-                marginals[i]
-            )
+            sub_node = self._construct_tree_property(item, f'({id_}, {id_})', '(...)')
+            sub_node.obj = Indicator.MARGINAL_NODE
+            sub_node.node = node
+
+    def _construct_marginal_node(self, item: QtWidgets.QTreeWidgetItem, graph: SubGraph) -> None:
+        marginal: SubMatrix = Matrix(self._get_linearisation(graph).marginals([item.node])[0])
+        item.setText(1, str(marginal))
+        item.setToolTip(1, marginal.to_string())
+
+    def _get_linearisation(self, graph: SubGraph) -> Linearisation:
+        if self._linearisation is None:
+            self._linearisation = graph.linearise()
+        return self._linearisation
 
     # handlers
     def handle_expand(self):
@@ -130,6 +142,9 @@ class InspectorTree(QtWidgets.QTreeWidget):
                 elif obj == Indicator.MARGINAL:
                     self._construct_marginal(item, self.obj)
                     delattr(item, 'obj')
+                elif obj == Indicator.MARGINAL_NODE:
+                    self._construct_marginal_node(item, self.obj)
+                    delattr(item, 'obj')
                 elif obj == Indicator.TRUE:
                     self.display_graph(self.obj.get_truth())
 
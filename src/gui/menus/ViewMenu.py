@@ -30,6 +30,12 @@ class ViewMenu(Menu):
             handler=self._viewer.toggle_grid,
             checked=True
         )
+        self.add_action(
+            menu=self,
+            name='&Level of Detail',
+            handler=self._viewer.toggle_lod,
+            checked=True
+        )
         self._construct_container_section()
         self.addSeparator()
         self.add_action(
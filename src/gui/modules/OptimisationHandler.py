@@ -1,9 +1,12 @@
+import os
 import typing as tp
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 from PyQt5 import QtCore
 from src.framework.graph.Graph import SubGraph, Graph
 from src.framework.optimiser.Optimiser import Optimiser
 from src.gui.modules.TreeNode import GraphTreeNode, TrajectoryTreeNode
+from src.gui.modules.Worker import Worker
 
 
 class OptimisationHandler(QtCore.QObject):
@@ -11,10 +14,14 @@ class OptimisationHandler(QtCore.QObject):
     _optimiser: Optimiser
     _graph_node: tp.Optional[GraphTreeNode]
     _include_history: bool
+    _worker: tp.Optional[Worker]
+    _num_threads: int
 
     _signal_filled: int = 1
     _signal_empty: int = 0
     signal_update = QtCore.pyqtSignal(int)
+    signal_progress = QtCore.pyqtSignal(int, int)  # (done, total)
+    signal_busy = QtCore.pyqtSignal(bool)
 
     # constructor
     def __init__(self, optimiser: Optimiser):
@@ -22,6 +29,9 @@ class OptimisationHandler(QtCore.QObject):
         self._optimiser = optimiser
         self._graph_node = None
         self._include_history = False
+        self._worker = None
+        # the optimisations run in g2o sub-processes, so threads suffice for parallelism
+        self._num_threads = max(1, (os.cpu_count() or 2) - 1)
 
     @classmethod
     def get_signal_filled(cls) -> int:
@@ -45,32 +55,91 @@ class OptimisationHandler(QtCore.QObject):
             )
             self.signal_update.emit(self._signal_filled)
         else:
+            self._graph_node = None
             self.signal_update.emit(self._signal_empty)
 
+    def has_graph(self) -> bool:
+        return self._graph_node is not None
+
     def set_include_history(self, include_history: bool = True) -> None:
         self._include_history = include_history
 
     def get_include_history(self) -> bool:
         return self._include_history
 
+    # background work
+    def is_busy(self) -> bool:
+        return self._worker is not None
+
+    def cancel(self) -> None:
+        if self._worker is not None:
+            print('gui/OptimisationHandler: Cancelling...')
+            self._worker.cancel()
+
     def optimise(self, should_print: bool = True) -> None:
         assert self._graph_node is not None
+        assert not self.is_busy(), 'An optimisation is already running.'
         graph: SubGraph = self._graph_node.get_graph()
 
         subgraphs: tp.List[SubGraph] = [graph]
         if self._include_history:
             subgraphs = graph.subgraphs()
 
-        subsolutions: tp.List[SubGraph] = []
-        for subgraph in subgraphs:
+        trajectory_node: TrajectoryTreeNode = self._graph_node.get_parent()
+        worker: Worker = Worker(lambda worker_: self._optimise_subgraphs(worker_, subgraphs, should_print))
+        worker.signals.progress.connect(self.signal_progress)
+        worker.signals.finished.connect(trajectory_node.add_graph)
+        worker.signals.finished.connect(self._handle_done)
+        worker.signals.cancelled.connect(self._handle_cancelled)
+        worker.signals.failed.connect(self._handle_failed)
+        self._worker = worker
+        self.signal_busy.emit(True)
+        worker.start()
+
+    def _optimise_subgraphs(
+            self,
+            worker: Worker,
+            subgraphs: tp.List[SubGraph],
+            should_print: bool
+    ) -> SubGraph:
+        """ Optimises all subgraphs in parallel (each in its own workspace) and chains the solutions. """
+        num: int = len(subgraphs)
+        # only a single optimisation prints, as the output of parallel runs would interleave
+        should_print = should_print and num == 1
+
+        def optimise_subgraph(index: int) -> SubGraph:
+            worker.check_cancelled()
+            subgraph: SubGraph = subgraphs[index]
             print(f"gui/OptimisationHandler: Optimising '{subgraph.identifier_class_unique()}'...")
-            subsolution: SubGraph = self._optimiser.instance_optimise(subgraph, compute_marginals=False, should_print=should_print)
+            return self._optimiser.instance_optimise(
+                subgraph, compute_marginals=False, should_print=should_print, workspace=f'optimisation-{index}'
+            )
+
+        subsolutions: tp.List[tp.Optional[SubGraph]] = [None] * num
+        with ThreadPoolExecutor(max_workers=min(self._num_threads, num)) as executor:
+            futures: tp.Dict[Future, int] = {executor.submit(optimise_subgraph, i): i for i in range(num)}
+            for count, future in enumerate(as_completed(futures)):
+                subsolutions[futures[future]] = future.result()
+                worker.report(count + 1, num)
+                if worker.is_cancelled():
+                    for remaining in futures:
+                        remaining.cancel()
+                    worker.check_cancelled()
+
+        for i, subsolution in enumerate(subsolutions):
             assert subsolution is not None
-            if subsolutions:
-                subsolution.set_previous(subsolutions[-1])
-            subsolutions.append(subsolution)
+            if i > 0:
+                subsolution.set_previous(subsolutions[i - 1])
+        return Graph.from_subgraphs(subsolutions)
 
-        solution: SubGraph = Graph.from_subgraphs(subsolutions)
+    def _handle_done(self, *_) -> None:
+        self._worker = None
+        self.signal_busy.emit(False)
 
-        trajectory_node: TrajectoryTreeNode = self._graph_node.get_parent()
-        trajectory_node.add_graph(solution)
+    def _handle_cancelled(self) -> None:
+        print('gui/OptimisationHandler: Optimisation cancelled')
+        self._handle_done()
+
+    def _handle_failed(self, trace: str) -> None:
+        print(f'gui/OptimisationHandler: Optimisation failed:\n{trace}')
+        self._handle_done()
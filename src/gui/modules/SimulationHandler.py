@@ -3,9 +3,9 @@ import typing as tp
 from PyQt5.QtCore import QObject, pyqtSignal
 from src.gui.action_pane.ConfigurationTree import ConfigurationTree
 from src.gui.modules.TreeNode import TopTreeNode
+from src.gui.modules.Worker import Worker
 
 if tp.TYPE_CHECKING:
-    from src.framework.graph.Graph import SubGraph
     from src.framework.simulation.BiSimulation import SubSimulation
 
 
@@ -13,8 +13,11 @@ class SimulationHandler(QObject):
     _tree: TopTreeNode
     _config: ConfigurationTree
     _simulation: tp.Optional['SubSimulation']
+    _worker: tp.Optional[Worker]
 
     signal_update = pyqtSignal(int)
+    signal_progress = pyqtSignal(int, int)  # (done, total); total = 0 if unknown
+    signal_busy = pyqtSignal(bool)
 
     # constructor
     def __init__(
@@ -27,6 +30,7 @@ class SimulationHandler(QObject):
         self._tree = tree
         self._config = config
         self._simulation = None
+        self._worker = None
 
     def set_simulation(self, simulation: 'SubSimulation'):
         simulation.set_optimiser(self._tree.optimiser())
@@ -43,15 +47,78 @@ class SimulationHandler(QObject):
     def get_simulation(self) -> 'SubSimulation':
         return self._simulation
 
+    # background work
+    def is_busy(self) -> bool:
+        return self._worker is not None
+
+    def cancel(self) -> None:
+        if self._worker is not None:
+            print('gui/SimulationHandler: Cancelling...')
+            self._worker.cancel()
+
+    def _start(
+            self,
+            task: tp.Callable[[Worker], tp.Any],
+            handle_result: tp.Callable[[tp.Any], None]
+    ) -> None:
+        assert not self.is_busy(), 'A simulation is already running.'
+        worker: Worker = Worker(task)
+        worker.signals.progress.connect(self.signal_progress)
+        worker.signals.finished.connect(handle_result)
+        worker.signals.finished.connect(self._handle_done)
+        worker.signals.cancelled.connect(self._handle_cancelled)
+        worker.signals.failed.connect(self._handle_failed)
+        self._worker = worker
+        self.signal_busy.emit(True)
+        worker.start()
+
+    def _run_task(
+            self,
+            worker: Worker,
+            function: tp.Callable[[], tp.Any],
+            should_report_steps: bool = True
+    ) -> tp.Any:
+        steps: tp.List[int] = [0]
+
+        def step_callback(_: float) -> None:
+            # cancellation is checked every step, such that a run aborts promptly
+            worker.check_cancelled()
+            steps[0] += 1
+            if should_report_steps:
+                worker.report(steps[0], 0)
+
+        self._simulation.set_step_callback(step_callback)
+        try:
+            return function()
+        finally:
+            self._simulation.set_step_callback(None)
+
+    def _handle_done(self, *_) -> None:
+        self._worker = None
+        self.signal_busy.emit(False)
+
+    def _handle_cancelled(self) -> None:
+        print('gui/SimulationHandler: Simulation cancelled')
+        self._handle_done()
+
+    def _handle_failed(self, trace: str) -> None:
+        print(f'gui/SimulationHandler: Simulation failed:\n{trace}')
+        self._handle_done()
+
     def simulate(self) -> None:
         print(f"gui/SimulationHandler: Simulating trajectory with '{self._simulation.get_name()}'...")
-        graph_estimate: 'SubGraph' = self._simulation.run()
-        self._tree.add_graph(
-            graph_estimate,
-            origin=self._simulation.get_name()
+        name: str = self._simulation.get_name()
+        self._start(
+            lambda worker: self._run_task(worker, self._simulation.run),
+            lambda graph: self._tree.add_graph(graph, origin=name)
         )
 
     def monte_carlo(self, num) -> None:
         print(f"gui/SimulationHandler: Monte Carlo simulation with '{self._simulation.get_name()}' (with n = {num})...")
-        graphs: tp.List['SubGraph'] = self._simulation.monte_carlo(num)
-        self._tree.add_graphs(graphs, self._simulation.get_name())
+        name: str = self._simulation.get_name()
+        self._start(
+            lambda worker: self._run_task(
+                worker, lambda: self._simulation.monte_carlo(num, callback=worker.report), should_report_steps=False
+            ),
+            lambda graphs: self._tree.add_graphs(graphs, name)
+        )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing as tp
 from abc import abstractmethod
+from collections import OrderedDict
 
 from PyQt5 import QtCore
 from src.framework.analysis.Analyser import Analyser
@@ -229,12 +230,18 @@ class ElementTreeNode(GraphicsTreeNode):
             self,
             parent: GraphTreeNode,  # parent-node
             types: tp.List[Type],  # supported graphics-types
-            elements: tp.List['SubElement']  # graph-elements
+            elements: tp.List['SubElement'],  # graph-elements
+            previous: tp.Optional[ElementTreeNode] = None  # node of the same graph-elements at another timestep
     ):
         super().__init__(parent)
         self._elements = elements
         self._graphics = {}
 
+        # the graphics of the elements shared with the previous node are reused
+        start: int = 0
+        if previous is not None:
+            start = previous.count_shared(elements)
+
         # for all of the given graphics-item-types
         element_type = self.get_element_type()
         type_: tp.Type['SubGraphicsItem']
@@ -243,10 +250,38 @@ class ElementTreeNode(GraphicsTreeNode):
             # if a graphics-item-type is defined for the element-type
             if type_.check(element_type):
                 # create the graphics-item
-                graphic: 'SubGraphicsItem' = type_.from_elements(elements)
+                graphic: 'SubGraphicsItem'
+                if previous is not None and previous.contains_graphic(type_) and start > 0:
+                    graphic = type_.extend(previous.get_graphics_item(type_), elements, start)
+                else:
+                    graphic = type_.from_elements(elements)
 
                 self.add_toggle(type_)
                 self._graphics[type_] = graphic
+        if previous is not None:
+            self.copy_checked(previous)
+
+    def copy_checked(self, other: ElementTreeNode) -> None:
+        """ Copies the (toggle-)states of another node of the same graph-elements, without broadcasting. """
+        self.set_checked(other.is_checked(), should_broadcast=False)
+        for type_ in self.get_types():
+            if other.contains_graphic(type_):
+                self.get_toggle(type_).set_checked(other.get_toggle(type_).is_checked(), should_broadcast=False)
+
+    def count_shared(self, elements: tp.List['SubElement']) -> int:
+        """ Returns the length of the common prefix of the stored graph-elements and the given graph-elements. """
+        count: int = 0
+        for own, other in zip(self._elements, elements):
+            if own is not other:
+                break
+            count += 1
+        return count
+
+    def is_identical(self, elements: tp.List['SubElement']) -> bool:
+        return len(elements) == len(self._elements) and self.count_shared(elements) == len(elements)
+
+    def get_graphics_item(self, type_: Type) -> 'SubGraphicsItem':
+        return self._graphics[type_]
 
     def get_element_type(self) -> tp.Type['SubElement']:
         """ Returns graph-element-type of stored elements. """
@@ -280,6 +315,8 @@ class GraphTreeNode(GraphicsTreeNode):
     _types: tp.List[Type]  # supported
     _graph_container: 'SubGraphContainer'  # graph-container
     _index: tp.Optional[int]  # current time-stamp
+    _cache: tp.Dict[int, tp.Dict[str, ElementTreeNode]]  # LRU-cache of child-nodes per index
+    _cache_size: int = 64
 
     def __init__(
             self,
@@ -293,28 +330,44 @@ class GraphTreeNode(GraphicsTreeNode):
         self._types = types
         self._graph_container = graph_container
         self._index = len(graph_container.get_timesteps()) - 1
+        self._cache = OrderedDict()
         self.init_graph(graph_container.get_graph())
+        self._cache[self._index] = dict(self._children)
 
-    def init_graph(self, graph: 'SubGraph'):
+    def reset_cache(self) -> None:
+        """ Discards the cached child-nodes (e.g., after the graph-container changed) and rebuilds the current index. """
+        previous: tp.Dict[str, ElementTreeNode] = self._children
         self.clear_children()
+        self._cache = OrderedDict()
+        self._index = min(self._index, len(self._graph_container.get_timesteps()) - 1)
+        self.init_graph(self.get_graph())
+        for name, node in self._children.items():
+            if name in previous:
+                node.copy_checked(previous[name])
+        self._cache[self._index] = dict(self._children)
 
-        # for all of the given graphics-item-types
-        type_: Type
-        for type_ in self._types:
+    def init_graph(self, graph: 'SubGraph'):
+        previous: tp.Dict[str, ElementTreeNode] = self._children
+        self.clear_children()
 
-            # for all of the element-types in the graph
-            name: str
-            for name in graph.get_names():
+        # for all of the element-types in the graph
+        name: str
+        for name in graph.get_names():
+            element_type: tp.Type['SubElement'] = graph.get_type_of_name(name)
+            types: tp.List[Type] = [type_ for type_ in self._types if type_.check(element_type)]
 
-                # if a graphics-item-type is defined for the element-type
-                if type_.check(graph.get_type_of_name(name)):
+            # if a graphics-item-type is defined for the element-type
+            if types:
 
-                    # create a subtree-element for each graph-element
-                    elements: tp.List['SubElement'] = graph.get_of_name(name)
-                    node: ElementTreeNode = ElementTreeNode(self, self._types, elements)
-                    self.add_child(node)
+                # create a subtree-element for each graph-element (reusing the currently displayed one)
+                elements: tp.List['SubElement'] = graph.get_of_name(name)
+                node: tp.Optional[ElementTreeNode] = previous.get(name)
+                if node is None or not node.is_identical(elements):
+                    node = ElementTreeNode(self, self._types, elements, previous=node)
+                self.add_child(node)
 
-                    # if a toggle is not yet defined
+                # if a toggle is not yet defined
+                for type_ in types:
                     if type_ not in self._toggles:
                         self.add_toggle(type_)
 
@@ -324,7 +377,19 @@ class GraphTreeNode(GraphicsTreeNode):
     # timestep
     def set_index(self, index: int):
         self._index = index
-        self.init_graph(self.get_graph())
+        if index in self._cache:
+            # cached nodes take over the states of the currently displayed ones (as newly created nodes do)
+            previous: tp.Dict[str, ElementTreeNode] = self._children
+            self._cache.move_to_end(index)
+            self._children = dict(self._cache[index])
+            for name, node in self._children.items():
+                if name in previous and previous[name] is not node:
+                    node.copy_checked(previous[name])
+        else:
+            self.init_graph(self.get_graph())
+            self._cache[index] = dict(self._children)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
         self.broadcast(self.get_id())
 
     def get_index(self) -> int:
@@ -359,6 +424,9 @@ class GraphTreeNode(GraphicsTreeNode):
 
     def find_subgraphs(self) -> None:
         self._graph_container.find_subgraphs()
+        self._index = len(self._graph_container.get_timesteps()) - 1
+        self.reset_cache()
+        self.broadcast(self.get_id())
 
     # TreeNode
     def get_key(self) -> str:
@@ -0,0 +1,67 @@
+import traceback
+import typing as tp
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+SubWorker = tp.TypeVar('SubWorker', bound='Worker')
+
+
+class Cancelled(Exception):
+    """ Raised from within a task (e.g., by a step-callback) to abort it after a cancellation request. """
+    pass
+
+
+class WorkerSignals(QObject):
+    progress = pyqtSignal(int, int)  # (done, total)
+    finished = pyqtSignal(object)  # result
+    failed = pyqtSignal(str)  # traceback
+    cancelled = pyqtSignal()
+
+
+class Worker(QRunnable):
+    """ Runs a task on the global thread-pool; the task receives the worker to report progress and poll cancellation. """
+
+    _task: tp.Callable[['SubWorker'], tp.Any]
+    _is_cancelled: bool
+    signals: WorkerSignals
+
+    # constructor
+    def __init__(self, task: tp.Callable[['SubWorker'], tp.Any]):
+        super().__init__()
+        self.setAutoDelete(False)
+        self._task = task
+        self._is_cancelled = False
+        self.signals = WorkerSignals()
+
+    # cancellation
+    def cancel(self) -> None:
+        self._is_cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
+    def check_cancelled(self) -> None:
+        """ Raises Cancelled if a cancellation was requested. """
+        if self._is_cancelled:
+            raise Cancelled()
+
+    # progress
+    def report(self, done: int, total: int) -> None:
+        self.signals.progress.emit(done, total)
+
+    # QRunnable
+    def run(self) -> None:
+        try:
+            result: tp.Any = self._task(self)
+        except Cancelled:
+            self.signals.cancelled.emit()
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+        else:
+            if self._is_cancelled:
+                self.signals.cancelled.emit()
+            else:
+                self.signals.finished.emit(result)
+
+    def start(self) -> None:
+        QThreadPool.globalInstance().start(self)
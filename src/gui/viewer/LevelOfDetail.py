@@ -0,0 +1,144 @@
+import typing as tp
+
+import numpy as np
+from src.utils.GridIndex2D import GridIndex2D
+
+# (x_min, y_min, x_max, y_max)
+Region = tp.Tuple[float, float, float, float]
+
+
+class LevelOfDetail(object):
+    """
+    Selects which elements of a graphics-item to draw: elements outside the visible region are culled and, when zoomed
+    out, elements are aggregated to one representative per (power-of-two sized) cell of a few pixels.
+    """
+
+    _positions: np.ndarray
+    _lengths: tp.Optional[np.ndarray]
+    _index: GridIndex2D
+    _long_ids: np.ndarray  # elements that are not in the index, but culled by their bounding-box
+    _long_boxes: np.ndarray  # (m, 4)-array of the regions of the long elements
+    _pixels: float
+    _max_elements: int
+
+    _key: tp.Optional[tp.Tuple]
+    _selection: tp.Optional[np.ndarray]
+
+    def __init__(
+            self,
+            positions: np.ndarray,
+            index: GridIndex2D,
+            lengths: tp.Optional[np.ndarray] = None,
+            long_ids: tp.Optional[np.ndarray] = None,
+            long_boxes: tp.Optional[np.ndarray] = None,
+            pixels: float = 3.,
+            max_elements: int = 100000
+    ):
+        self._positions = positions
+        self._index = index
+        self._lengths = lengths
+        self._long_ids = np.zeros(0, dtype=int) if long_ids is None else long_ids
+        self._long_boxes = np.zeros((0, 4)) if long_boxes is None else long_boxes
+        self._pixels = pixels
+        self._max_elements = max_elements
+        self._key = None
+        self._selection = None
+
+    # constructors
+    @staticmethod
+    def cell_size(positions: np.ndarray) -> float:
+        """ Returns a cell-size that puts, on average, a handful of elements in an occupied cell. """
+        if len(positions) < 2:
+            return 1.
+        extent: float = float(np.max(np.ptp(positions, axis=0)))
+        return max(extent / np.sqrt(len(positions)), 1e-3)
+
+    @classmethod
+    def from_points(cls, points: np.ndarray, **kwargs) -> 'LevelOfDetail':
+        positions: np.ndarray = np.asarray(points, dtype=float).reshape(-1, 3)[:, :2]
+        index: GridIndex2D = GridIndex2D(positions, cls.cell_size(positions))
+        return cls(positions, index, **kwargs)
+
+    @classmethod
+    def from_nodesets(cls, nodesets: np.ndarray, **kwargs) -> 'LevelOfDetail':
+        nodesets = np.asarray(nodesets, dtype=float).reshape(-1, 2, 3)[:, :, :2]
+        count: int = len(nodesets)
+        size: float = cls.cell_size(nodesets.reshape(-1, 2))
+        lengths: np.ndarray = np.linalg.norm(nodesets[:, 1] - nodesets[:, 0], axis=1)
+
+        # short edges are indexed by both end-points, which lie within the (one-cell) padding of a region they cross;
+        # longer edges can cross a region with both end-points far outside it, such that these are culled by their
+        # bounding-box instead
+        is_long: np.ndarray = lengths > size
+        short_ids: np.ndarray = np.flatnonzero(~is_long)
+        index: GridIndex2D = GridIndex2D(nodesets[short_ids].reshape(-1, 2), size, ids=np.repeat(short_ids, 2))
+        long_ids: np.ndarray = np.flatnonzero(is_long)
+        long_boxes: np.ndarray = np.hstack((nodesets[long_ids].min(axis=1), nodesets[long_ids].max(axis=1)))
+
+        # edges are aggregated by their mid-point
+        return cls(
+            nodesets.mean(axis=1), index, lengths=lengths, long_ids=long_ids, long_boxes=long_boxes, **kwargs
+        )
+
+    # public methods
+    def count(self) -> int:
+        return len(self._positions)
+
+    def select(
+            self,
+            region: tp.Optional[Region],
+            pixel_size: tp.Optional[float]
+    ) -> tp.Optional[np.ndarray]:
+        """ Returns the sorted indices of the elements to draw, or None if all elements should be drawn. """
+        size: float = self._index.size()
+
+        # the region is snapped to the index-cells and the aggregation to power-of-two levels, such that the selection
+        # only has to be recomputed when crossing a cell (panning) or level (zooming)
+        level: tp.Optional[int] = None
+        if pixel_size is not None and self._pixels * pixel_size > size:
+            level = int(np.ceil(np.log2(self._pixels * pixel_size / size)))
+        snapped: tp.Optional[tp.Tuple[int, ...]] = None
+        if region is not None:
+            snapped = tuple(int(value) for value in np.floor(np.asarray(region) / size))
+        key: tp.Tuple = (snapped, level)
+        if key != self._key:
+            self._key = key
+            self._selection = self._select(snapped, level)
+        return self._selection
+
+    # helper-methods
+    def _select(
+            self,
+            snapped: tp.Optional[tp.Tuple[int, ...]],
+            level: tp.Optional[int]
+    ) -> tp.Optional[np.ndarray]:
+        size: float = self._index.size()
+        indices: np.ndarray
+        if snapped is not None:
+            # pad by one cell, such that elements just outside the region (e.g., edge end-points) are kept
+            x_min, y_min, x_max, y_max = snapped
+            padded: np.ndarray = np.array([x_min - 1, y_min - 1, x_max + 2, y_max + 2]) * size
+            indices = self._index.query(*padded)
+            boxes: np.ndarray = self._long_boxes
+            is_overlapping: np.ndarray = (boxes[:, 0] <= padded[2]) & (boxes[:, 2] >= padded[0]) \
+                & (boxes[:, 1] <= padded[3]) & (boxes[:, 3] >= padded[1])
+            if np.any(is_overlapping):
+                indices = np.union1d(indices, self._long_ids[is_overlapping])
+        else:
+            indices = np.arange(self.count())
+
+        if level is not None and len(indices):
+            coarse: float = size * 2 ** level
+            keys: np.ndarray = np.floor(self._positions[indices] / coarse).astype(np.int64)
+            _, first = np.unique(keys, axis=0, return_index=True)
+            representatives: np.ndarray = indices[first]
+            if self._lengths is not None:
+                # edges that span multiple pixels remain visible individually
+                representatives = np.union1d(representatives, indices[self._lengths[indices] >= coarse])
+            indices = np.sort(representatives)
+
+        if len(indices) > self._max_elements:
+            indices = indices[::int(np.ceil(len(indices) / self._max_elements))]
+        if len(indices) == self.count():
+            return None
+        return indices
@@ -0,0 +1,111 @@
+import typing as tp
+
+import numpy as np
+from OpenGL.GL import *
+from OpenGL.arrays import vbo
+from src.gui.viewer.Rgb import RgbTuple
+
+
+class VertexBuffer(object):
+    """ A pair of vertex- and colour-VBOs that are (re-)uploaded only on the first draw after a change. """
+
+    _vertices: np.ndarray
+    _colours: np.ndarray
+    _vertex_vbo: tp.Optional[vbo.VBO]
+    _colour_vbo: tp.Optional[vbo.VBO]
+    _is_dirty: bool
+
+    def __init__(self):
+        self._vertices = np.zeros((0, 3), dtype=np.float32)
+        self._colours = np.zeros((0, 4), dtype=np.float32)
+        self._vertex_vbo = None
+        self._colour_vbo = None
+        self._is_dirty = True
+
+    @staticmethod
+    def uniform_colours(
+            count: int,
+            colour: RgbTuple,
+            alpha: float = 0.5
+    ) -> np.ndarray:
+        return np.tile(np.array([*colour, alpha], dtype=np.float32), (count, 1))
+
+    def set_data(
+            self,
+            vertices: np.ndarray,
+            colours: np.ndarray
+    ) -> None:
+        """ Stores (n, 3)-vertices and (n, 4)-colours, to be uploaded on the next draw. """
+        vertices = np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3)
+        colours = np.ascontiguousarray(colours, dtype=np.float32).reshape(-1, 4)
+        assert len(vertices) == len(colours)
+        self._vertices = vertices
+        self._colours = colours
+        self._is_dirty = True
+
+    def count(self) -> int:
+        return len(self._vertices)
+
+    def vertices(self) -> np.ndarray:
+        return self._vertices
+
+    def _upload(self) -> None:
+        if self._vertex_vbo is None:
+            self._vertex_vbo = vbo.VBO(self._vertices, usage=GL_STATIC_DRAW)
+            self._colour_vbo = vbo.VBO(self._colours, usage=GL_STATIC_DRAW)
+        else:
+            self._vertex_vbo.set_array(self._vertices)
+            self._colour_vbo.set_array(self._colours)
+        self._is_dirty = False
+
+    def draw(
+            self,
+            mode: int,
+            first: int = 0,
+            count: tp.Optional[int] = None
+    ) -> None:
+        """ Draws (a contiguous range of) the buffer with a single array draw call. """
+        if count is None:
+            count = self.count() - first
+        if count <= 0:
+            return
+        if self._is_dirty:
+            self._upload()
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        try:
+            self._vertex_vbo.bind()
+            glVertexPointer(3, GL_FLOAT, 0, self._vertex_vbo)
+            self._colour_vbo.bind()
+            glColorPointer(4, GL_FLOAT, 0, self._colour_vbo)
+            glDrawArrays(mode, first, count)
+        finally:
+            self._colour_vbo.unbind()
+            glDisableClientState(GL_COLOR_ARRAY)
+            glDisableClientState(GL_VERTEX_ARRAY)
+
+    def draw_indices(
+            self,
+            mode: int,
+            indices: np.ndarray
+    ) -> None:
+        """ Draws a subset of the vertices with a single indexed draw call. """
+        if not len(indices):
+            return
+        if self._is_dirty:
+            self._upload()
+        indices = np.ascontiguousarray(indices, dtype=np.uint32)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        try:
+            self._vertex_vbo.bind()
+            glVertexPointer(3, GL_FLOAT, 0, self._vertex_vbo)
+            self._colour_vbo.bind()
+            glColorPointer(4, GL_FLOAT, 0, self._colour_vbo)
+            self._colour_vbo.unbind()
+            glDrawElements(mode, len(indices), GL_UNSIGNED_INT, indices)
+        finally:
+            glDisableClientState(GL_COLOR_ARRAY)
+            glDisableClientState(GL_VERTEX_ARRAY)
@@ -8,6 +8,7 @@ from src.framework.math.matrix.vector import Vector3
 from src.gui.modules.TreeNode import TopTreeNode
 from src.gui.viewer.Grid import Grid
 if tp.TYPE_CHECKING:
+    from src.gui.viewer.LevelOfDetail import Region
     from src.gui.viewer.items.GraphicsItem import SubGLGraphicsItem
 
 
@@ -28,6 +29,7 @@ class Viewer(gl.GLViewWidget):
         self._tree.signal_update.connect(self.update_items)
         self._is_grid = True
         self._grid = Grid(size=(100, 100), spacing=(1, 1))
+        self._is_lod = True
         self.update_items()
 
     # public methods
@@ -63,6 +65,50 @@ class Viewer(gl.GLViewWidget):
         self._is_grid = not self._is_grid
         self.update_items()
 
+    # level-of-detail
+    def is_lod(self) -> bool:
+        return self._is_lod
+
+    def toggle_lod(self):
+        self._is_lod = not self._is_lod
+        self.update()
+
+    def pixel_size(self) -> float:
+        """ Returns the (world) size of a pixel at the camera centre. """
+        distance: float = self.opts['distance']
+        return distance * 2. * np.tan(0.5 * self.opts['fov'] * np.pi / 180.) / max(self.width(), 1)
+
+    def visible_region(self) -> tp.Optional['Region']:
+        """ Returns the bounding-box of the visible part of the xy-plane, or None if it is unbounded. """
+        elevation: float = np.radians(self.opts['elevation'])
+        azimuth: float = np.radians(self.opts['azimuth'])
+        centre: QVector3D = self.opts['center']
+        backward: np.ndarray = np.array([
+            np.cos(elevation) * np.cos(azimuth), np.cos(elevation) * np.sin(azimuth), np.sin(elevation)
+        ])
+        camera: np.ndarray = np.array([centre.x(), centre.y(), centre.z()]) + self.opts['distance'] * backward
+
+        # the (horizontal) field-of-view spans the width, and the height follows from the aspect-ratio
+        right: np.ndarray = np.array([-np.sin(azimuth), np.cos(azimuth), 0.])
+        up: np.ndarray = np.cross(backward, right)
+        tan_x: float = np.tan(0.5 * np.radians(self.opts['fov']))
+        tan_y: float = tan_x * self.height() / max(self.width(), 1)
+
+        # intersect the corner-rays of the frustum with the xy-plane
+        points: tp.List[np.ndarray] = []
+        for sign_x in (-1., 1.):
+            for sign_y in (-1., 1.):
+                direction: np.ndarray = -backward + sign_x * tan_x * right + sign_y * tan_y * up
+                if abs(direction[2]) < 1e-12:
+                    return None
+                distance: float = -camera[2] / direction[2]
+                if distance <= 0.:
+                    return None
+                points.append(camera[:2] + distance * direction[:2])
+        x_min, y_min = np.min(points, axis=0)
+        x_max, y_max = np.max(points, axis=0)
+        return float(x_min), float(y_min), float(x_max), float(y_max)
+
     # PyQtGraph override:
     def pan(self, dx, dy, dz, relative='global'):
         if relative == 'view-upright':
@@ -54,3 +54,12 @@ class Axes(GraphicsItem):
     def from_elements(cls, elements: tp.List[DrawAxis]) -> Axes:
         poses: tp.List[SE3] = [element.draw_pose() for element in elements]
         return cls(poses)
+
+    @classmethod
+    def extend(cls, previous: Axes, elements: tp.List[DrawAxis], start: int) -> Axes:
+        poses: tp.List[SE3] = previous._poses[:start] + [element.draw_pose() for element in elements[start:]]
+        return cls(
+            poses,
+            width=previous._width,
+            size=previous._size
+        )
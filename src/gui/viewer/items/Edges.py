@@ -2,18 +2,17 @@ from __future__ import annotations
 
 import typing as tp
 
+import numpy as np
 from OpenGL.GL import *
 from src.framework.graph.Visualisable import DrawEdge
-from src.framework.math.matrix.vector import Vector3
-from src.gui.viewer.Drawer import Drawer
+from src.gui.viewer.LevelOfDetail import LevelOfDetail
 from src.gui.viewer.Rgb import Rgb, RgbTuple
+from src.gui.viewer.VertexBuffer import VertexBuffer
 from src.gui.viewer.items.GraphicsItem import GraphicsItem
 
 if tp.TYPE_CHECKING:
     from src.framework.graph.Visualisable import SubVisualisable
 
-Nodeset = tp.Tuple[Vector3, Vector3]
-
 
 class Edges(GraphicsItem):
     name = 'Constraint edges'
@@ -21,16 +20,43 @@ class Edges(GraphicsItem):
     # constructor
     def __init__(
             self,
-            nodesets: tp.List[Nodeset],
+            nodesets: np.ndarray,
             colour: tp.Optional[RgbTuple] = Rgb.WHITE,
             width: float = 2,
             gl_options: str = 'translucent'
     ):
         super().__init__(colour)
-        self._nodesets: tp.List[Nodeset] = nodesets
+        self._buffer: VertexBuffer = VertexBuffer()
+        self._nodesets: np.ndarray = np.zeros((0, 2, 3))
+        self._lod: tp.Optional[LevelOfDetail] = None
         # settings
         self._width: float = width
         self.setGLOptions(gl_options)
+        self.set_nodesets(nodesets)
+
+    # data
+    def set_nodesets(self, nodesets: np.ndarray) -> None:
+        """ Sets the (n, 2, 3)-array of edge end-points; the buffer is re-uploaded on the next paint. """
+        self._nodesets = np.asarray(nodesets, dtype=float).reshape(-1, 2, 3)
+        self._lod = None
+        self._update_buffer()
+
+    def get_nodesets(self) -> np.ndarray:
+        return self._nodesets
+
+    def set_colour(self, colour: RgbTuple) -> None:
+        super().set_colour(colour)
+        self._update_buffer()
+
+    def _update_buffer(self) -> None:
+        vertices: np.ndarray = self._nodesets.reshape(-1, 3)
+        self._buffer.set_data(vertices, VertexBuffer.uniform_colours(len(vertices), self._colour))
+        self.update()
+
+    def get_lod(self) -> LevelOfDetail:
+        if self._lod is None:
+            self._lod = LevelOfDetail.from_nodesets(self._nodesets)
+        return self._lod
 
     # public method
     def paint(self):
@@ -42,12 +68,11 @@ class Edges(GraphicsItem):
         glDepthMask(False)  #
 
         glLineWidth(self._width)
-        glBegin(GL_LINES)
-
-        for nodeset in self._nodesets:
-            Drawer.line(*nodeset, colour=self._colour)
-
-        glEnd()
+        indices: tp.Optional[np.ndarray] = self.get_lod().select(*self.view_state())
+        if indices is None:
+            self._buffer.draw(GL_LINES)
+        else:
+            self._buffer.draw_indices(GL_LINES, np.stack([2 * indices, 2 * indices + 1], axis=1).ravel())
 
     # constructor method
     @staticmethod
@@ -56,8 +81,19 @@ class Edges(GraphicsItem):
 
     @classmethod
     def from_elements(cls, elements: tp.List[DrawEdge]) -> Edges:
-        poses: tp.List[Nodeset] = [element.draw_nodeset() for element in elements]
+        nodesets: np.ndarray = type(elements[0]).draw_nodesets(elements) if elements else np.zeros((0, 2, 3))
         return cls(
-            poses,
+            nodesets,
             colour=Rgb.similar(DrawEdge.draw_rgb())
         )
+
+    @classmethod
+    def extend(cls, previous: Edges, elements: tp.List[DrawEdge], start: int) -> Edges:
+        nodesets: np.ndarray = previous.get_nodesets()[:start]
+        if start < len(elements):
+            nodesets = np.concatenate([nodesets, type(elements[0]).draw_nodesets(elements[start:])])
+        return cls(
+            nodesets,
+            colour=previous.get_colour(),
+            width=previous._width
+        )
@@ -6,6 +6,7 @@ from src.gui.viewer.Rgb import Rgb, RgbTuple
 
 if tp.TYPE_CHECKING:
     from src.framework.graph.Visualisable import SubVisualisable
+    from src.gui.viewer.LevelOfDetail import Region
 
 SubGLGraphicsItem = tp.TypeVar('SubGLGraphicsItem', bound='GLGraphicsItem')
 SubGraphicsItem = tp.TypeVar('SubGraphicsItem', bound='GraphicsItem')
@@ -25,6 +26,14 @@ class GraphicsItem(GLGraphicsItem):
     def get_colour(self) -> RgbTuple:
         return self._colour
 
+    # level-of-detail
+    def view_state(self) -> tp.Tuple[tp.Optional['Region'], tp.Optional[float]]:
+        """ Returns the visible region and the size of a pixel of the view, if the view supports level-of-detail. """
+        view = self.view()
+        if view is None or not getattr(view, 'is_lod', lambda: False)():
+            return None, None
+        return view.visible_region(), view.pixel_size()
+
     # eligibility method
     @staticmethod
     @abstractmethod
@@ -36,3 +45,15 @@ class GraphicsItem(GLGraphicsItem):
     @abstractmethod
     def from_elements(cls, elements: tp.List['SubVisualisable']) -> SubGraphicsItem:
         pass
+
+    @classmethod
+    def extend(
+            cls,
+            previous: SubGraphicsItem,
+            elements: tp.List['SubVisualisable'],
+            start: int
+    ) -> SubGraphicsItem:
+        """ Creates a graphics-item for <elements>, given an item <previous> of the same kind for <elements[:start]>. """
+        graphic: SubGraphicsItem = cls.from_elements(elements)
+        graphic.set_colour(previous.get_colour())
+        return graphic
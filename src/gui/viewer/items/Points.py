@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import typing as tp
 
+import numpy as np
 from OpenGL.GL import *
 from src.framework.graph.Visualisable import SubVisualisable, DrawPoint
-from src.framework.math.matrix.vector import Vector3
-from src.gui.viewer.Drawer import Drawer
+from src.gui.viewer.LevelOfDetail import LevelOfDetail
 from src.gui.viewer.Rgb import Rgb, RgbTuple
+from src.gui.viewer.VertexBuffer import VertexBuffer
 from src.gui.viewer.items.GraphicsItem import GraphicsItem
 
 if tp.TYPE_CHECKING:
@@ -19,14 +20,40 @@ class Points(GraphicsItem):
     # constructor
     def __init__(
             self,
-            points: tp.List[Vector3],
+            points: np.ndarray,
             colour: tp.Optional[RgbTuple] = Rgb.WHITE,
             width: float = 4
     ):
         super().__init__(colour)
-        self._points: tp.List[Vector3] = points
+        self._buffer: VertexBuffer = VertexBuffer()
+        self._points: np.ndarray = np.zeros((0, 3))
+        self._lod: tp.Optional[LevelOfDetail] = None
         # settings
         self._width: float = width
+        self.set_points(points)
+
+    # data
+    def set_points(self, points: np.ndarray) -> None:
+        """ Sets the (n, 3)-array of points; the buffer is re-uploaded on the next paint. """
+        self._points = np.asarray(points, dtype=float).reshape(-1, 3)
+        self._lod = None
+        self._update_buffer()
+
+    def get_points(self) -> np.ndarray:
+        return self._points
+
+    def set_colour(self, colour: RgbTuple) -> None:
+        super().set_colour(colour)
+        self._update_buffer()
+
+    def _update_buffer(self) -> None:
+        self._buffer.set_data(self._points, VertexBuffer.uniform_colours(len(self._points), self._colour))
+        self.update()
+
+    def get_lod(self) -> LevelOfDetail:
+        if self._lod is None:
+            self._lod = LevelOfDetail.from_points(self._points)
+        return self._lod
 
     # public method
     def paint(self):
@@ -41,12 +68,12 @@ class Points(GraphicsItem):
         glEnable(GL_POINT_SMOOTH)
         glPointSize(self._width)
 
-        glBegin(GL_POINTS)
+        indices: tp.Optional[np.ndarray] = self.get_lod().select(*self.view_state())
+        if indices is None:
+            self._buffer.draw(GL_POINTS)
+        else:
+            self._buffer.draw_indices(GL_POINTS, indices)
 
-        for point in self._points:
-            Drawer.point(point, colour=self._colour)
-
-        glEnd()
         glDisable(GL_POINT_SMOOTH)
         glBlendFunc(GL_NONE, GL_NONE)
         glDisable(GL_BLEND)
@@ -58,8 +85,19 @@ class Points(GraphicsItem):
 
     @classmethod
     def from_elements(cls, elements: tp.List[DrawPoint]) -> Points:
-        poses: tp.List[Vector3] = [element.draw_point() for element in elements]
+        points: np.ndarray = type(elements[0]).draw_points(elements) if elements else np.zeros((0, 3))
         return cls(
-            poses,
+            points,
             colour=Rgb.similar(DrawPoint.draw_rgb())
         )
+
+    @classmethod
+    def extend(cls, previous: Points, elements: tp.List[DrawPoint], start: int) -> Points:
+        points: np.ndarray = previous.get_points()[:start]
+        if start < len(elements):
+            points = np.concatenate([points, type(elements[0]).draw_points(elements[start:])])
+        return cls(
+            points,
+            colour=previous.get_colour(),
+            width=previous._width
+        )
@@ -47,7 +47,7 @@ class IntelSim(BiSimulation):
         self.add_sensor('gps', Vector2, info_gps_truth, info_gps_estimate)
 
         # parameters:
-        self.truth_simulation().add_static_parameter(
+        self.truth_simulation().add_trajectory_parameter(
             'wheel', 'bias',
             Vector1(0.1), ParameterSpecification.BIAS, index=0
         )
@@ -53,7 +53,7 @@ class ManhattanSim(BiSimulation):
         self.add_sensor('gps', Vector2, info_gps_truth, info_gps_estimate)
 
         # parameters:
-        node = self.truth_simulation().add_static_parameter(
+        node = self.truth_simulation().add_trajectory_parameter(
             'wheel', 'bias',
             Vector1(0.1), ParameterSpecification.BIAS, index=0
         )
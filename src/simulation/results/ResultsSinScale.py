@@ -16,7 +16,7 @@ def f_sin(
 class ResultsSinScale(Results, ABC):
     def initialise(self) -> None:
         super().initialise()
-        self.truth_simulation().add_static_parameter(
+        self.truth_simulation().add_trajectory_parameter(
             'wheel', 'scale',
             Vector1.ones(), ParameterSpecification.SCALE
         )
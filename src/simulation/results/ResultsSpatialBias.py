@@ -24,7 +24,7 @@ def f_spatial(
 class ResultsSpatialBias(Results, ABC):
     def initialise(self) -> None:
         super().initialise()
-        node: 'SubParameterNode' = self.truth_simulation().add_static_parameter(
+        node: 'SubParameterNode' = self.truth_simulation().add_trajectory_parameter(
             'wheel', 'bias',
             Vector1.zeros(),
             # Vector2.zeros(),
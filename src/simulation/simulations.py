@@ -14,77 +14,170 @@ from src.simulation.results.ResultsSinBias import ResultsSinBiasWithout, Results
 
 if tp.TYPE_CHECKING:
     from src.framework.simulation.BiSimulation import SubBiSimulation
+    from src.simulation.results.Results import SubResults
+
+SubSimulationEntry = tp.TypeVar('SubSimulationEntry', bound='SimulationEntry')
+
+
+class SimulationEntry(object):
+    """ A registered simulation: its metadata is available up-front, the simulation is only constructed when used. """
+
+    _section: str
+    _name: str
+    _factory: tp.Callable[[], 'SubBiSimulation']
+    _steps: tp.Optional[int]
+    _config: tp.Any
+    _simulation: tp.Optional['SubBiSimulation']
+
+    def __init__(
+            self,
+            section: str,
+            name: str,
+            factory: tp.Callable[[], 'SubBiSimulation'],
+            steps: tp.Optional[int] = None,
+            config: tp.Any = None
+    ):
+        self._section = section
+        self._name = name
+        self._factory = factory
+        self._steps = steps
+        self._config = config
+        self._simulation = None
+
+    # metadata
+    def get_section(self) -> str:
+        return self._section
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_steps(self) -> tp.Optional[int]:
+        return self._steps
+
+    def get_config(self) -> tp.Any:
+        return self._config
+
+    # simulation
+    def is_instantiated(self) -> bool:
+        return self._simulation is not None
+
+    def instantiate(self) -> 'SubBiSimulation':
+        """ Returns the simulation, which is constructed (and configured) on first use. """
+        if self._simulation is None:
+            self._simulation = self._factory()
+        return self._simulation
 
 
 class SimulationList(object):
-    _simulations: tp.Dict[str, tp.List['SubBiSimulation']]
+    _entries: tp.Dict[str, tp.List[SimulationEntry]]
 
     def __init__(self):
-        self._simulations = {}
+        self._entries = {}
 
     def sections(self) -> tp.List[str]:
-        return list(self._simulations.keys())
+        return list(self._entries.keys())
 
     def add(
             self,
             section: str,
-            simulation: 'SubBiSimulation',
+            factory: tp.Callable[[], 'SubBiSimulation'],
+            name: tp.Optional[str] = None,
+            steps: tp.Optional[int] = None,
+            config: tp.Any = None
+    ) -> SimulationEntry:
+        if name is None:
+            name = getattr(factory, '__name__', str(factory))
+        if section not in self._entries:
+            self._entries[section] = []
+        entry: SimulationEntry = SimulationEntry(section, name, factory, steps=steps, config=config)
+        self._entries[section].append(entry)
+        return entry
+
+    def add_results(
+            self,
+            section: str,
+            type_: tp.Type['SubResults'],
+            dataset: str,
+            steps: tp.Optional[int] = None,
+            config: tp.Any = None,
             name: tp.Optional[str] = None
-    ):
-        if section not in self._simulations:
-            self._simulations[section] = []
-        self._simulations[section].append(simulation)
+    ) -> SimulationEntry:
+        """ Registers a Results-simulation on the 'intel' or 'manhattan' dataset. """
+        assert dataset in ('intel', 'manhattan')
+
+        def factory() -> 'SubResults':
+            results: 'SubResults' = type_()
+            if dataset == 'intel':
+                results.set_intel()
+            else:
+                results.set_manhattan()
+            if steps is not None:
+                results.set_steps(steps)
+            if config is not None:
+                results.set_config(config)
+            if name is not None:
+                results.set_name(name)
+            return results
+
+        return self.add(section, factory, name=name or type_.__name__, steps=steps, config=config)
+
+    def entries(
+            self,
+            section: str
+    ) -> tp.List[SimulationEntry]:
+        assert section in self._entries
+        return self._entries[section]
 
     def simulations(
             self,
             section: str
     ) -> tp.List['SubBiSimulation']:
-        assert section in self._simulations
-        return self._simulations[section]
+        """ Returns the (instantiated) simulations of a section. """
+        return [entry.instantiate() for entry in self.entries(section)]
 
 
 simulations = SimulationList()
 
 section: str = 'ManhattanSim'
-simulations.add(section, ManhattanPlain())
-simulations.add(section, ManhattanWithout())
-simulations.add(section, ManhattanConstant())
-simulations.add(section, ManhattanTimely())
-simulations.add(section, ManhattanSliding())
-simulations.add(section, ManhattanSlidingOld())
-simulations.add(section, ManhattanSpatial())
+simulations.add(section, ManhattanPlain, 'ManhattanSim: Plain')
+simulations.add(section, ManhattanWithout, 'ManhattanSim: Without')
+simulations.add(section, ManhattanConstant, 'ManhattanSim: Constant')
+simulations.add(section, ManhattanTimely, 'ManhattanSim: Timely Batch')
+simulations.add(section, ManhattanSliding, 'ManhattanSim: Sliding')
+simulations.add(section, ManhattanSlidingOld, 'ManhattanSim: Sliding (old)')
+simulations.add(section, ManhattanSpatial, 'ManhattanSim: Spatial')
 
 section: str = 'Demo'
-simulations.add(section, ResultsConstantBiasWithout().set_intel().set_steps(200).set_config([None, None, 0.1]).set_name('Demo: Intel y-bias (PGO)'))
-simulations.add(section, ResultsConstantBiasStatic().set_intel().set_steps(200).set_config([None, None, 0.1]).set_name('Demo: Intel y-bias (PPGO)'))
-simulations.add(section, ResultsSinBiasSliding().set_intel().set_steps(200).set_config(5).set_name('Demo: Intel sin xyz-bias (PPGO)'))
-simulations.add(section, ResultsSinBiasSliding().set_manhattan().set_steps(200).set_config(5).set_name('Demo: Manhattan sin xyz-bias (PPGO)'))
-# simulations.add(section, ResultsConstantScaleWithout().set_manhattan().set_steps(100).set_config([1.1, None, 1.1]))
-# simulations.add(section, ResultsSinBiasTimelyBatch().set_manhattan().set_steps(200).set_config(10))
-# simulations.add(section, ResultsSpatialBiasWithout().set_manhattan().set_steps(400))
-# simulations.add(section, ResultsSpatialBiasSpatial().set_intel().set_steps(800))
-
-simulations.add(section, ResultsPlain().set_manhattan().set_steps(200).set_name('ResultsPlain-Manhattan'))
-simulations.add(section, ResultsPlain().set_intel().set_steps(300).set_name('ResultsPlain-Intel'))
-simulations.add(section, ResultsConstantBiasWithout().set_intel().set_steps(300).set_name('ResultsConstantBiasWithout-Intel'))
-simulations.add(section, ResultsConstantBiasStatic().set_intel().set_steps(300).set_name('ResultsConstantBiasStatic-Intel'))
-simulations.add(section, ResultsConstantBiasWithout().set_manhattan().set_steps(200).set_name('ResultsConstantBiasWithout-Manhattan'))
-simulations.add(section, ResultsConstantBiasStatic().set_manhattan().set_steps(200).set_name('ResultsConstantBiasStatic-Manhattan'))
-simulations.add(section, ResultsConstantScaleWithout().set_intel().set_steps(300).set_name('ResultsConstantScaleWithout-Intel'))
-simulations.add(section, ResultsConstantScaleStatic().set_intel().set_steps(300).set_name('ResultsConstantScaleStatic-Intel'))
-simulations.add(section, ResultsSinBiasWithout().set_manhattan())
-simulations.add(section, ResultsSinBiasTimelyBatch().set_manhattan())
-simulations.add(section, ResultsSinBiasSliding().set_manhattan())
-simulations.add(section, ResultsSinBiasSlidingOld().set_manhattan())
+simulations.add_results(section, ResultsConstantBiasWithout, 'intel', steps=200, config=[None, None, 0.1], name='Demo: Intel y-bias (PGO)')
+simulations.add_results(section, ResultsConstantBiasStatic, 'intel', steps=200, config=[None, None, 0.1], name='Demo: Intel y-bias (PPGO)')
+simulations.add_results(section, ResultsSinBiasSliding, 'intel', steps=200, config=5, name='Demo: Intel sin xyz-bias (PPGO)')
+simulations.add_results(section, ResultsSinBiasSliding, 'manhattan', steps=200, config=5, name='Demo: Manhattan sin xyz-bias (PPGO)')
+# simulations.add_results(section, ResultsConstantScaleWithout, 'manhattan', steps=100, config=[1.1, None, 1.1])
+# simulations.add_results(section, ResultsSinBiasTimelyBatch, 'manhattan', steps=200, config=10)
+# simulations.add_results(section, ResultsSpatialBiasWithout, 'manhattan', steps=400)
+# simulations.add_results(section, ResultsSpatialBiasSpatial, 'intel', steps=800)
+
+simulations.add_results(section, ResultsPlain, 'manhattan', steps=200, name='ResultsPlain-Manhattan')
+simulations.add_results(section, ResultsPlain, 'intel', steps=300, name='ResultsPlain-Intel')
+simulations.add_results(section, ResultsConstantBiasWithout, 'intel', steps=300, name='ResultsConstantBiasWithout-Intel')
+simulations.add_results(section, ResultsConstantBiasStatic, 'intel', steps=300, name='ResultsConstantBiasStatic-Intel')
+simulations.add_results(section, ResultsConstantBiasWithout, 'manhattan', steps=200, name='ResultsConstantBiasWithout-Manhattan')
+simulations.add_results(section, ResultsConstantBiasStatic, 'manhattan', steps=200, name='ResultsConstantBiasStatic-Manhattan')
+simulations.add_results(section, ResultsConstantScaleWithout, 'intel', steps=300, name='ResultsConstantScaleWithout-Intel')
+simulations.add_results(section, ResultsConstantScaleStatic, 'intel', steps=300, name='ResultsConstantScaleStatic-Intel')
+simulations.add_results(section, ResultsSinBiasWithout, 'manhattan')
+simulations.add_results(section, ResultsSinBiasTimelyBatch, 'manhattan')
+simulations.add_results(section, ResultsSinBiasSliding, 'manhattan')
+simulations.add_results(section, ResultsSinBiasSlidingOld, 'manhattan')
 
 # section = 'ManhattanTest'
 # simulations.add(section, manhattan_test_post)
 
 section = 'IntelSim'
-simulations.add(section, IntelPlain())
-simulations.add(section, IntelWithout())
-simulations.add(section, IntelConstant())
-simulations.add(section, IntelTimely())
-simulations.add(section, IntelSliding())
-simulations.add(section, IntelSlidingOld())
-simulations.add(section, IntelSpatial())
+simulations.add(section, IntelPlain, 'IntelSim: Plain')
+simulations.add(section, IntelWithout, 'IntelSim: Without')
+simulations.add(section, IntelConstant, 'IntelSim: Constant')
+simulations.add(section, IntelTimely, 'IntelSim: Timely Batch')
+simulations.add(section, IntelSliding, 'IntelSim: Sliding')
+simulations.add(section, IntelSlidingOld, 'IntelSim: Sliding (old)')
+simulations.add(section, IntelSpatial, 'IntelSim: Spatial')
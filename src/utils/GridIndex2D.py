@@ -0,0 +1,65 @@
+import typing as tp
+
+import numpy as np
+
+
+class GridIndex2D(object):
+    """ A static, array-based spatial index that buckets (x, y)-positions into square cells. """
+
+    _size: float
+    _ids: np.ndarray
+    _cells: np.ndarray
+    _starts: np.ndarray
+    _counts: np.ndarray
+
+    # constructor
+    def __init__(
+            self,
+            positions: np.ndarray,
+            size: float,
+            ids: tp.Optional[np.ndarray] = None
+    ):
+        """ Indexes (n, 2)-positions; a position refers to element <ids[i]> (default: <i>). """
+        assert size > 0.
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        if ids is None:
+            ids = np.arange(len(positions))
+        assert len(ids) == len(positions)
+
+        self._size = size
+        keys: np.ndarray = np.floor(positions / size).astype(np.int64)
+        order: np.ndarray = np.lexsort((keys[:, 1], keys[:, 0]))
+        self._ids = np.asarray(ids)[order]
+        if len(order):
+            self._cells, self._starts, self._counts = np.unique(
+                keys[order], axis=0, return_index=True, return_counts=True
+            )
+        else:
+            self._cells = np.zeros((0, 2), dtype=np.int64)
+            self._starts = np.zeros(0, dtype=np.int64)
+            self._counts = np.zeros(0, dtype=np.int64)
+
+    def size(self) -> float:
+        return self._size
+
+    # public methods
+    def query(
+            self,
+            x_min: float,
+            y_min: float,
+            x_max: float,
+            y_max: float
+    ) -> np.ndarray:
+        """ Returns the sorted unique ids of all elements in the cells overlapping the rectangle. """
+        a_min, b_min = np.floor(np.array([x_min, y_min]) / self._size).astype(np.int64)
+        a_max, b_max = np.floor(np.array([x_max, y_max]) / self._size).astype(np.int64)
+        mask: np.ndarray = (self._cells[:, 0] >= a_min) & (self._cells[:, 0] <= a_max) \
+            & (self._cells[:, 1] >= b_min) & (self._cells[:, 1] <= b_max)
+        starts: np.ndarray = self._starts[mask]
+        counts: np.ndarray = self._counts[mask]
+        if not len(starts):
+            return np.zeros(0, dtype=self._ids.dtype)
+        # concatenates the ranges [start, start + count) without a python-loop
+        offsets: np.ndarray = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        positions: np.ndarray = np.arange(int(counts.sum())) + offsets
+        return np.unique(self._ids[positions])
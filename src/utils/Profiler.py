@@ -0,0 +1,183 @@
+import contextlib
+import functools
+import json
+import os
+import pathlib
+import threading
+import time
+import typing as tp
+from datetime import datetime
+
+F = tp.TypeVar('F', bound=tp.Callable[..., tp.Any])
+
+
+class Timer(object):
+    """ Accumulates the number of calls and the (total, minimum and maximum) duration of a section. """
+
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.
+        self.minimum = float('inf')
+        self.maximum = 0.
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.minimum = min(self.minimum, duration)
+        self.maximum = max(self.maximum, duration)
+
+
+class Profiler(object):
+    """
+    Times named (nested) sections and counts events, and records them as trace-events in the Chrome trace-format
+    (viewable in chrome://tracing or Perfetto). When disabled, a section costs a single flag-check.
+    """
+
+    _max_events: int = 1000000  # bounds the memory of the trace
+
+    _is_enabled: bool
+    _trace_folder: tp.Optional[pathlib.Path]
+    _timers: tp.Dict[str, Timer]
+    _counters: tp.Dict[str, int]
+    _events: tp.List[tp.Dict[str, tp.Any]]
+    _origin: float
+    _lock: threading.Lock
+
+    def __init__(self):
+        self._is_enabled = False
+        self._trace_folder = None
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._events = []
+        self.reset()
+
+    # state
+    def enable(self, trace_folder: tp.Optional[pathlib.Path] = None) -> None:
+        """ Enables profiling; if <trace_folder> is given, the trace of every run is saved to it. """
+        self._is_enabled = True
+        self._trace_folder = trace_folder
+
+    def disable(self) -> None:
+        self._is_enabled = False
+
+    def is_enabled(self) -> bool:
+        return self._is_enabled
+
+    def reset(self) -> None:
+        """ Clears the timers and counters (e.g., at the start of a run), but keeps the trace. """
+        self._timers = {}
+        self._counters = {}
+
+    def clear_trace(self) -> None:
+        self._events = []
+        self._origin = time.perf_counter()
+
+    # runs
+    def begin_run(self) -> None:
+        self.reset()
+        self.clear_trace()
+
+    def end_run(self, name: str) -> tp.Optional[pathlib.Path]:
+        """ Saves the trace of the run (if a trace-folder is set) and returns its file. """
+        if self._trace_folder is None:
+            return None
+        date_string: str = datetime.now().strftime('%Y%m%d-%H%M%S')
+        file: pathlib.Path = (self._trace_folder / f'{name}_{date_string}.json').resolve()
+        self.save_trace(file)
+        return file
+
+    # recording
+    @contextlib.contextmanager
+    def _section(self, name: str) -> tp.Iterator[None]:
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def section(self, name: str) -> tp.ContextManager[None]:
+        """ Returns a context-manager that times its body as section <name>. """
+        if not self._is_enabled:
+            return _null
+        return self._section(name)
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """ Records a section <name> that ran from <start> to <end> (as given by time.perf_counter). """
+        with self._lock:
+            if name not in self._timers:
+                self._timers[name] = Timer()
+            self._timers[name].add(end - start)
+            if len(self._events) < self._max_events:
+                self._events.append({
+                    'name': name, 'ph': 'X', 'pid': os.getpid(), 'tid': threading.get_ident(),
+                    'ts': (start - self._origin) * 1e6, 'dur': (end - start) * 1e6
+                })
+
+    def count(self, name: str, increment: int = 1) -> None:
+        if not self._is_enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + increment
+            if len(self._events) < self._max_events:
+                self._events.append({
+                    'name': name, 'ph': 'C', 'pid': os.getpid(), 'tid': threading.get_ident(),
+                    'ts': (time.perf_counter() - self._origin) * 1e6, 'args': {name: self._counters[name]}
+                })
+
+    # results
+    def get_timers(self) -> tp.Dict[str, Timer]:
+        return self._timers
+
+    def get_counters(self) -> tp.Dict[str, int]:
+        return self._counters
+
+    def summary(self, title: str = 'Profile') -> str:
+        """ Returns a table of the timers (sorted by total duration) and counters. """
+        lines: tp.List[str] = [
+            f'{title}:',
+            f"    {'section':<32} {'calls':>8} {'total [s]':>10} {'mean [ms]':>10} {'max [ms]':>10}"
+        ]
+        for name, timer in sorted(self._timers.items(), key=lambda item: -item[1].total):
+            lines.append(
+                f'    {name:<32} {timer.count:>8} {timer.total:>10.3f} '
+                f'{1000 * timer.total / timer.count:>10.3f} {1000 * timer.maximum:>10.3f}'
+            )
+        for name, value in sorted(self._counters.items()):
+            lines.append(f'    {name:<32} {value:>8}')
+        return '\n'.join(lines)
+
+    def save_trace(self, file: pathlib.Path) -> None:
+        """ Saves the trace-events as json in the Chrome trace-format. """
+        file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            events: tp.List[tp.Dict[str, tp.Any]] = list(self._events)
+        with file.open('w') as writer:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, writer)
+
+
+_null: tp.ContextManager[None] = contextlib.nullcontext()
+
+# shared profiler of the framework
+profiler: Profiler = Profiler()
+
+
+def profiled(name: str) -> tp.Callable[[F], F]:
+    """ Decorates a function, such that each call is timed as section <name> when the profiler is enabled. """
+
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not profiler._is_enabled:
+                return function(*args, **kwargs)
+            start: float = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.record(name, start, time.perf_counter())
+        return tp.cast(F, wrapper)
+    return decorator
@@ -0,0 +1,76 @@
+import typing as tp
+
+T = tp.TypeVar('T')
+
+
+class RingBuffer(tp.Generic[T]):
+    """ A fixed-capacity FIFO-buffer with O(1) push and pop, of which the items are indexed from oldest to newest. """
+
+    _capacity: int
+    _items: tp.List[tp.Optional[T]]
+    _start: int  # index of the oldest item
+    _size: int
+
+    # constructor
+    def __init__(self, capacity: int):
+        assert capacity > 0
+        self._capacity = capacity
+        self._items = [None] * capacity
+        self._start = 0
+        self._size = 0
+
+    # public methods
+    def capacity(self) -> int:
+        return self._capacity
+
+    def is_full(self) -> bool:
+        return self._size == self._capacity
+
+    def clear(self) -> None:
+        self._items = [None] * self._capacity
+        self._start = 0
+        self._size = 0
+
+    def push(self, item: T) -> tp.Optional[T]:
+        """ Appends <item> as newest item and returns the oldest item if it is expelled (i.e., if the buffer is full). """
+        if self._size < self._capacity:
+            self._items[(self._start + self._size) % self._capacity] = item
+            self._size += 1
+            return None
+        expelled: T = self._items[self._start]
+        self._items[self._start] = item
+        self._start = (self._start + 1) % self._capacity
+        return expelled
+
+    def pop(self) -> T:
+        """ Removes and returns the oldest item. """
+        assert self._size > 0
+        item: T = self._items[self._start]
+        self._items[self._start] = None
+        self._start = (self._start + 1) % self._capacity
+        self._size -= 1
+        return item
+
+    def to_list(self) -> tp.List[T]:
+        return [self[i] for i in range(self._size)]
+
+    # helper-methods
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        assert 0 <= index < self._size, f'Index {index} out of range.'
+        return (self._start + index) % self._capacity
+
+    # object methods
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> T:
+        return self._items[self._index(index)]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        self._items[self._index(index)] = item
+
+    def __iter__(self) -> tp.Iterator[T]:
+        for i in range(self._size):
+            yield self._items[(self._start + i) % self._capacity]
@@ -1,2 +1,4 @@
 from src.utils.DictTree import DictTree
 from src.utils.GeoHash2D import GeoHash2D
+from src.utils.GridIndex2D import GridIndex2D
+from src.utils.RingBuffer import RingBuffer
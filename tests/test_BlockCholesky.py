@@ -0,0 +1,50 @@
+import typing as tp
+
+import numpy as np
+import pytest
+from src.framework.math.matrix.BlockCholesky import BlockCholesky
+
+
+def random_hessian(
+        sizes: tp.List[int],
+        num_edges: int,
+        rng: np.random.RandomState
+) -> np.ndarray:
+    offsets: np.ndarray = np.concatenate(([0], np.cumsum(sizes)))
+    hessian: np.ndarray = 0.1 * np.eye(offsets[-1])
+    for _ in range(num_edges):
+        jacobian: np.ndarray = np.zeros((3, offsets[-1]))
+        for i in rng.choice(len(sizes), 2, replace=False):
+            jacobian[:, offsets[i]: offsets[i + 1]] = rng.randn(3, sizes[i])
+        hessian += jacobian.transpose() @ jacobian
+    return hessian
+
+
+def test_block_cholesky():
+    rng: np.random.RandomState = np.random.RandomState(0)
+    sizes: tp.List[int] = rng.randint(1, 4, 60).tolist()
+    offsets: np.ndarray = np.concatenate(([0], np.cumsum(sizes)))
+    hessian: np.ndarray = random_hessian(sizes, 150, rng)
+    blocks: tp.Dict[tp.Tuple[int, int], np.ndarray] = {}
+    for a in range(len(sizes)):
+        for b in range(a + 1):
+            block: np.ndarray = hessian[offsets[a]: offsets[a + 1], offsets[b]: offsets[b + 1]]
+            if np.any(block):
+                blocks[a, b] = block
+    factor: BlockCholesky = BlockCholesky(sizes, blocks)
+    inverse: np.ndarray = np.linalg.inv(hessian)
+
+    # selected inversion gives the diagonal blocks of the inverse
+    for k, block in enumerate(factor.inverse_diagonal()):
+        assert np.allclose(block, inverse[offsets[k]: offsets[k + 1], offsets[k]: offsets[k + 1]])
+
+    # solves for a block-column of the inverse
+    solution: tp.Dict[int, np.ndarray] = factor.solve({5: np.eye(sizes[5])})
+    for k, block in solution.items():
+        assert np.allclose(block, inverse[offsets[k]: offsets[k + 1], offsets[5]: offsets[6]])
+
+
+def test_block_cholesky_indefinite():
+    blocks: tp.Dict[tp.Tuple[int, int], np.ndarray] = {(0, 0): np.eye(2), (1, 1): -np.eye(1)}
+    with pytest.raises(RuntimeError):
+        BlockCholesky([2, 1], blocks)
@@ -0,0 +1,64 @@
+import typing as tp
+
+import numpy as np
+import pytest
+from src.definitions import get_project_root
+from src.framework.graph.FixedLagSmoother import FixedLagSmoother
+from src.framework.optimiser.Optimiser import Library
+from src.framework.simulation.Parameter import SlidingParameter
+from src.simulation.results.ResultsSinBias import ResultsSinBiasSliding
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubGraph, SubEdge
+    from src.framework.simulation.Simulation import SubSimulation
+
+has_g2o: bool = (get_project_root() / 'g2o/bin/g2o').is_file()
+
+
+def fingerprint(edge: 'SubEdge') -> tp.Tuple[tp.Tuple[int, ...], tp.List[float]]:
+    return tuple(edge.get_node_ids()), edge.to_vector().to_list()
+
+
+@pytest.mark.skipif(not has_g2o, reason='requires the g2o binary')
+@pytest.mark.parametrize('parameter_window', [10, 40])  # smaller and larger than the fixed-lag window
+def test_sliding_parameter(parameter_window: int, monkeypatch: pytest.MonkeyPatch):
+    simulation: ResultsSinBiasSliding = ResultsSinBiasSliding()
+    simulation.set_manhattan().set_steps(150).set_config(parameter_window)
+    estimate: 'SubSimulation' = simulation.estimate_simulation()
+    estimate.set_fixed_lag(20)
+    estimate.get_optimiser().set_library(Library.EIGEN)
+
+    # records the marginalised edges of every snapshot (by index), of which those with frozen nodes only are shared
+    marginalised: tp.Dict[int, tp.Tuple[tp.Tuple[int, ...], tp.List[float]]] = {}
+    snapshot = FixedLagSmoother.snapshot
+
+    def record(smoother: FixedLagSmoother, graph: 'SubGraph', timestep: int) -> 'SubGraph':
+        view: 'SubGraph' = snapshot(smoother, graph, timestep)
+        for i, (edge, view_edge) in enumerate(zip(graph.get_edges(), view.get_edges())):
+            if id(edge) not in smoother._edges:
+                marginalised.setdefault(i, fingerprint(view_edge))
+                is_frozen: bool = all(node.get_id() not in smoother._nodes for node in edge.get_nodes())
+                assert (view_edge is edge) == is_frozen
+        return view
+
+    monkeypatch.setattr(FixedLagSmoother, 'snapshot', record)
+    simulation.run()
+    assert marginalised
+
+    # marginalised edges are never changed (e.g., by a retired parameter)
+    edges: tp.List['SubEdge'] = estimate.graph().get_edges()
+    for i, (node_ids, vector) in marginalised.items():
+        assert fingerprint(edges[i])[0] == node_ids
+        assert np.allclose(fingerprint(edges[i])[1], vector)
+
+    # active edges are connected to their active nodes only
+    smoother: FixedLagSmoother = estimate.get_smoother()
+    for key, edge in smoother._edges.items():
+        active_ids: tp.List[int] = [node.get_id() for node in edge.get_nodes() if node.get_id() in smoother._nodes]
+        assert smoother._edge_ids[key] == active_ids
+
+    # retired edges no longer refer to the parameter, of which edges are only retired if it has the smaller window
+    parameter: SlidingParameter = estimate.model().get_sensor('wheel').get_parameter('bias')
+    assert bool(parameter._out) == (parameter_window < smoother.get_window())
+    for edge in parameter._out:
+        assert parameter.node().get_id() not in edge.get_node_ids()
@@ -0,0 +1,59 @@
+import typing as tp
+
+import numpy as np
+import pytest
+from src.framework.graph.parameter.ParameterSpecification import ParameterSpecification
+from src.framework.math.lie.transformation import SE2
+from src.framework.math.matrix.vector import Vector1
+from src.framework.simulation.PostAnalyser import SpatialBatchAnalyser
+from src.framework.simulation.Sensor import SensorSE2
+from src.framework.simulation.Simulation import PostSimulation
+
+if tp.TYPE_CHECKING:
+    from src.framework.graph.Graph import SubEdge
+
+
+def add_odometry(simulation: PostSimulation, num: int, rng: np.random.RandomState) -> None:
+    for _ in range(num):
+        simulation.add_odometry('wheel', SE2.from_translation_angle_elements(1., 0., rng.uniform(-0.3, 0.3)))
+
+
+def test_spatial_batch_deferred(monkeypatch: pytest.MonkeyPatch):
+    simulation: PostSimulation = PostSimulation()
+    simulation.add_sensor('wheel', SensorSE2())
+    simulation.add_spatial_parameter('wheel', 'bias', Vector1.zeros(), ParameterSpecification.BIAS, 20)
+    rng: np.random.RandomState = np.random.RandomState(0)
+    add_odometry(simulation, 2000, rng)
+    analyser: SpatialBatchAnalyser = simulation.get_analyser()
+    edge_type: tp.Type['SubEdge'] = type(analyser.edges()[0])
+
+    # counts the metric-computations of the edges
+    computed: tp.List['SubEdge'] = []
+    compute_error_vector = edge_type._compute_error_vector
+
+    def record(edge: 'SubEdge'):
+        computed.append(edge)
+        return compute_error_vector(edge)
+
+    monkeypatch.setattr(edge_type, '_compute_error_vector', record)
+
+    # the first step attaches a parameter to each edge, of which the metrics are deferred
+    analyser.post_process()
+    assert not computed
+    assert all(len(edge.get_parameter_nodes()) == 1 for edge in analyser.edges())
+    assert all(edge._is_stale for edge in analyser.edges())
+
+    # deferred metrics are computed once when accessed, and are equal to the (eagerly) recomputed ones
+    costs: np.ndarray = np.array([edge.cost() for edge in analyser.edges()])
+    assert len(computed) == len(analyser.edges())
+    for edge in analyser.edges():
+        edge.set_metrics()
+    assert np.allclose(costs, [edge.cost() for edge in analyser.edges()])
+
+    # a next step only defers the metrics of new edges and of edges of which the parameter changed
+    labels: np.ndarray = analyser._labels.copy()
+    add_odometry(simulation, 500, rng)
+    analyser.post_process()
+    changed: tp.Set[int] = set(np.flatnonzero(analyser._labels[:len(labels)] != labels).tolist())
+    expected: tp.Set[int] = changed | set(range(len(labels), len(analyser.edges())))
+    assert {i for i, edge in enumerate(analyser.edges()) if edge._is_stale} == expected
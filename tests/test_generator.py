@@ -0,0 +1,25 @@
+import pathlib
+
+import numpy as np
+from src.benchmarks.generator import GraphGenerator
+from src.framework.graph.Graph import SubGraph
+from src.framework.graph.GraphParser import GraphParser
+from src.framework.math.lie.transformation import SE2
+
+
+def test_generated_pair(tmp_path: pathlib.Path):
+    generator: GraphGenerator = GraphGenerator(1000)
+    generator.set_proximity(0.3).set_landmarks(0.2)
+    generator.set_parameter(
+        SE2.from_translation_angle_elements(0.0123456, -0.0234567, 0.00345678),
+        SE2.from_translation_angle_elements(0., 0., 0.),
+        batch_size=100
+    )
+    truth_file, estimate_file = generator.generate(tmp_path, 'pair', should_print=False)
+    truth: SubGraph = GraphParser.load(truth_file, should_print=False)
+    estimate: SubGraph = GraphParser.load(estimate_file, should_print=False)
+
+    # the (full-precision) truth-graph is consistent, regardless of its number of edges
+    assert np.isclose(truth.cost(), 0., atol=1e-9)
+    estimate.assign_truth(truth)
+    assert estimate.has_truth()